@@ -0,0 +1,247 @@
+"""
+llm.py — async chat-completions backends for the planner.
+
+Every backend offers complete(), stream() and aclose(); get_backend() picks
+one from PPT_LLM_BACKEND:
+    groq  GroqBackend — the real API (default)
+    stub  agent.stub_llm.StubBackend — offline, deterministic, for load tests
+and wraps it in Timed, which feeds the ppt_llm_* histograms (see metrics.py).
+
+GroqBackend keeps one pooled httpx.AsyncClient per event loop, a hard
+per-call deadline (for a stream, from the request to its last delta),
+jittered exponential retry on 429/5xx/transport errors (honouring
+Retry-After), and optional hedging: when a call — or a stream's opening —
+runs past the recent p95 for its kind, a second identical request is fired
+and whichever answers first wins.
+
+Config (env):
+    GROQ_API_KEY / GROQ_BASE_URL
+    PPT_LLM_TIMEOUT          per-attempt read timeout, seconds   (default 60)
+    PPT_LLM_DEADLINE         whole-call budget incl. retries     (default 120)
+    PPT_LLM_RETRIES          attempts per call                   (default 3)
+    PPT_LLM_MAX_CONNECTIONS  pool size                           (default 20)
+    PPT_LLM_HEDGE            1 = hedge slow calls                (default 0)
+"""
+import abc, asyncio, json, os, time, weakref
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+import httpx
+import metrics
+from tenacity import (AsyncRetrying, retry_if_exception_type, stop_after_attempt,
+                      stop_after_delay, wait_random_exponential)
+
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+
+
+class LLMError(Exception):
+    """The provider rejected the request; retrying will not help."""
+
+class RetryableError(LLMError):
+    """429, 5xx or a transport failure."""
+    def __init__(self, msg, retry_after=0.0):
+        super().__init__(msg); self.retry_after = retry_after
+
+
+def _retry_after(r):
+    try: return min(float(r.headers.get("retry-after", 0)), 30.0)
+    except ValueError: return 0.0
+
+def _check(r):
+    if r.status_code == 429 or r.status_code >= 500:
+        raise RetryableError(f"LLM HTTP {r.status_code}", _retry_after(r))
+    if r.status_code >= 400:
+        raise LLMError(f"LLM HTTP {r.status_code}: {r.text[:300]}")
+
+_backoff = wait_random_exponential(multiplier=0.5, max=8)
+
+def _wait(state):
+    exc = state.outcome.exception()
+    return max(getattr(exc, "retry_after", 0.0), _backoff(state))
+
+
+class LLMBackend(abc.ABC):
+    """Interface the planner codes against."""
+    @abc.abstractmethod
+    async def complete(self, prompt, max_tokens=6000, temperature=0.7, kind="default") -> str:
+        """Full completion text for a single user prompt."""
+
+    @abc.abstractmethod
+    def stream(self, prompt, max_tokens=6000, temperature=0.7) -> AsyncIterator[str]:
+        """Content deltas as they arrive; implement as an async generator."""
+
+    async def aclose(self):
+        pass
+
+
+class GroqBackend(LLMBackend):
+    HEDGE_MIN_SAMPLES = 20
+
+    def __init__(self, model, api_key=None, base_url=None, timeout=None, deadline=None,
+                 retries=None, max_connections=None, hedge=None):
+        env = os.getenv
+        self.model    = model
+        self.api_key  = api_key  or env("GROQ_API_KEY", "")
+        self.base_url = (base_url or env("GROQ_BASE_URL") or GROQ_BASE_URL).rstrip("/")
+        self.timeout  = timeout  or float(env("PPT_LLM_TIMEOUT", "60"))
+        self.deadline = deadline or float(env("PPT_LLM_DEADLINE", "120"))
+        self.retries  = retries  or int(env("PPT_LLM_RETRIES", "3"))
+        self.max_connections = max_connections or int(env("PPT_LLM_MAX_CONNECTIONS", "20"))
+        self.hedge    = env("PPT_LLM_HEDGE", "0") == "1" if hedge is None else hedge
+        self._latency = defaultdict(lambda: deque(maxlen=200))   # kind -> recent seconds
+        self._http    = weakref.WeakKeyDictionary()              # loop -> AsyncClient
+
+    # ── connection pool ───────────────────────────────────────────────────────
+    def http(self):
+        loop = asyncio.get_running_loop()
+        c = self._http.get(loop)
+        if c is None:
+            c = self._http[loop] = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+            )
+        return c
+
+    async def aclose(self):
+        """Close this loop's pool (for short-lived loops such as asyncio.run)."""
+        c = self._http.pop(asyncio.get_running_loop(), None)
+        if c is not None: await c.aclose()
+
+    # ── hedging ───────────────────────────────────────────────────────────────
+    def hedge_after(self, kind):
+        lat = self._latency[kind]
+        if not self.hedge or len(lat) < self.HEDGE_MIN_SAMPLES: return None
+        return sorted(lat)[int(len(lat) * 0.95) - 1]
+
+    async def _open(self, payload):
+        """A streaming response whose status is OK; its body not yet read."""
+        t0 = time.monotonic()
+        http = self.http()
+        try:
+            r = await http.send(http.build_request("POST", "/chat/completions", json=payload), stream=True)
+        except httpx.TransportError as e:
+            raise RetryableError(f"LLM transport error: {e!r}")
+        if r.status_code >= 400:
+            await r.aread(); await r.aclose(); _check(r)
+        self._latency["stream"].append(time.monotonic() - t0)
+        return r
+
+    async def _post(self, payload, kind):
+        t0 = time.monotonic()
+        try:
+            r = await self.http().post("/chat/completions", json=payload)
+        except httpx.TransportError as e:
+            raise RetryableError(f"LLM transport error: {e!r}")
+        _check(r)
+        self._latency[kind].append(time.monotonic() - t0)
+        return r.json()
+
+    async def _hedged(self, attempt, kind, discard=None):
+        """attempt(), raced by a second one past the p95 for kind; a loser that also succeeded goes to discard()."""
+        first = asyncio.create_task(attempt())
+        wait = self.hedge_after(kind)
+        if wait is None: return await first
+        done, _ = await asyncio.wait({first}, timeout=wait)
+        if done: return first.result()
+        tasks = {first, asyncio.create_task(attempt())}
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                ok = [t for t in done if t.exception() is None]
+                if ok:
+                    if discard:
+                        for t in ok[1:]: await discard(t.result())
+                    return ok[0].result()
+                if not tasks: return done.pop().result()   # both failed: re-raise one
+        finally:
+            for t in tasks: t.cancel()
+
+    def _retrying(self):
+        return AsyncRetrying(retry=retry_if_exception_type(RetryableError), wait=_wait,
+                             stop=stop_after_attempt(self.retries) | stop_after_delay(self.deadline),
+                             reraise=True)
+
+    # ── public API ────────────────────────────────────────────────────────────
+    def _payload(self, prompt, max_tokens, temperature, **extra):
+        return {"model": self.model, "messages": [{"role": "user", "content": prompt}],
+                "temperature": temperature, "max_tokens": max_tokens, **extra}
+
+    async def complete(self, prompt, max_tokens=6000, temperature=0.7, kind="default"):
+        """Full completion text for a single user prompt."""
+        payload = self._payload(prompt, max_tokens, temperature)
+        end = time.monotonic() + self.deadline
+        async for attempt in self._retrying():
+            with attempt:
+                data = await asyncio.wait_for(self._hedged(lambda: self._post(payload, kind), kind),
+                                              max(0.1, end - time.monotonic()))
+        return data["choices"][0]["message"]["content"].strip()
+
+    async def stream(self, prompt, max_tokens=6000, temperature=0.7):
+        """
+        Yield content deltas as they arrive, all within the call's deadline
+        (TimeoutError past it). Only opening the stream is retried and
+        hedged — once tokens have been yielded a failure propagates.
+        """
+        payload = self._payload(prompt, max_tokens, temperature, stream=True)
+        end = asyncio.get_running_loop().time() + self.deadline
+        async with asyncio.timeout_at(end):
+            async for attempt in self._retrying():
+                with attempt:
+                    r = await self._hedged(lambda: self._open(payload), "stream", discard=lambda r: r.aclose())
+        try:
+            lines = r.aiter_lines()
+            while True:
+                # scoped to the read, so a timeout never lands in the consumer's code at the yield
+                async with asyncio.timeout_at(end):
+                    try: line = await anext(lines)
+                    except StopAsyncIteration: break
+                if not line.startswith("data:"): continue
+                data = line[5:].strip()
+                if data == "[DONE]": break
+                choices = json.loads(data).get("choices") or [{}]
+                delta = choices[0].get("delta", {}).get("content")
+                if delta: yield delta
+        finally:
+            await r.aclose()
+
+
+class Timed(LLMBackend):
+    """
+    Latency spans around another backend. A completion's first byte is its
+    last, so only streams get ppt_llm_ttfb_seconds (kind="stream").
+    """
+    def __init__(self, inner): self.inner = inner
+
+    def __getattr__(self, name): return getattr(self.inner, name)
+
+    async def complete(self, prompt, max_tokens=6000, temperature=0.7, kind="default"):
+        with metrics.span("ppt_llm_seconds", kind=kind):
+            return await self.inner.complete(prompt, max_tokens, temperature, kind)
+
+    async def stream(self, prompt, max_tokens=6000, temperature=0.7):
+        t0 = time.perf_counter(); first = True
+        try:
+            async with aclosing(self.inner.stream(prompt, max_tokens, temperature)) as deltas:
+                async for delta in deltas:
+                    if first:
+                        metrics.observe("ppt_llm_ttfb_seconds", time.perf_counter() - t0, kind="stream")
+                        first = False
+                    yield delta
+        finally:
+            metrics.observe("ppt_llm_seconds", time.perf_counter() - t0, kind="stream")
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+def get_backend(model) -> LLMBackend:
+    kind = os.getenv("PPT_LLM_BACKEND", "groq").lower()
+    if kind == "stub":
+        from agent.stub_llm import StubBackend
+        return Timed(StubBackend())
+    if kind != "groq":
+        raise ValueError(f"Unknown PPT_LLM_BACKEND {kind!r} (expected groq or stub)")
+    return Timed(GroqBackend(model))
@@ -0,0 +1,132 @@
+"""
+outline_cache.py — content-addressed cache for generated outlines.
+
+Keys are an xxh3-128 of (topic, slides, model, prompt version), so /preview and
+/generate-ppt with the same inputs share one LLM call, and the key doubles as
+the outline ID handed back to the frontend.
+
+Two tiers: an in-process LRU, and an optional on-disk tier of zstd-compressed
+JSON (set PPT_OUTLINE_CACHE_DIR) that survives restarts and is shared between
+workers on the same box. Async code calls aget()/aput(): the memory tier
+answers on the event loop and the disk tier's I/O runs on a thread. A disk hit refreshes the file's mtime, so eviction
+drops entries unused for the TTL, then the least recently used until the
+tier is under its size cap. It runs when a write takes the tier past the cap
+(by this process's running estimate), and every few minutes of writes.
+
+Config (env):
+    PPT_OUTLINE_CACHE_SIZE  outlines kept in memory               (default 256)
+    PPT_OUTLINE_CACHE_DIR   disk tier directory, unset = no disk tier
+    PPT_OUTLINE_CACHE_MB    disk tier size cap                     (default 256)
+    PPT_OUTLINE_CACHE_TTL   seconds an unused outline stays on disk (default 604800)
+"""
+import asyncio, json, os, threading, time
+from collections import OrderedDict
+import xxhash, zstandard
+from metrics import log
+
+def outline_key(topic: str, slides: int, model: str, prompt_version: int) -> str:
+    raw = "\x1f".join((topic.strip(), str(slides), model, str(prompt_version)))
+    return xxhash.xxh3_128_hexdigest(raw.encode())
+
+
+class OutlineCache:
+    SWEEP_EVERY = 600   # seconds between disk evictions when under the cap
+
+    def __init__(self, max_items=256, disk_dir=None, level=3, disk_max_bytes=256 << 20, disk_ttl=7 * 86400):
+        self.max_items = max_items
+        self.disk_dir  = disk_dir
+        self.disk_max_bytes = disk_max_bytes; self.disk_ttl = disk_ttl
+        self._disk_bytes = None; self._swept = 0.0   # estimate since the last evict()
+        self._mem  = OrderedDict()
+        self._lock = threading.Lock()
+        self._level = level
+        if disk_dir: os.makedirs(disk_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json.zst")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                return self._mem[key]
+        if not self.disk_dir or len(key) != 32 or not all(c in "0123456789abcdef" for c in key):
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.disk_ttl: return None
+            with open(path, "rb") as f:
+                outline = json.loads(zstandard.ZstdDecompressor().decompress(f.read()))
+            os.utime(path)
+        except (OSError, ValueError, zstandard.ZstdError):
+            return None
+        self._remember(key, outline)
+        return outline
+
+    async def aget(self, key):
+        """get() for the event loop: a memory hit answers at once, the disk tier is read on a thread."""
+        with self._lock:
+            if key in self._mem:
+                self._mem.move_to_end(key)
+                return self._mem[key]
+        if not self.disk_dir: return None
+        return await asyncio.to_thread(self.get, key)
+
+    def put(self, key, outline):
+        self._remember(key, outline)
+        if self.disk_dir: self._write(key, outline)
+
+    async def aput(self, key, outline):
+        """put() for the event loop: memory now, the disk write (and any eviction) on a thread."""
+        self._remember(key, outline)
+        if self.disk_dir: await asyncio.to_thread(self._write, key, outline)
+
+    def _write(self, key, outline):
+        blob = zstandard.ZstdCompressor(level=self._level).compress(json.dumps(outline).encode())
+        tmp = f"{self._path(key)}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f: f.write(blob)
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            log(f"[OutlineCache] {e}"); return
+        with self._lock:
+            if self._disk_bytes is not None: self._disk_bytes += len(blob)
+            due = (self._disk_bytes is None or self._disk_bytes > self.disk_max_bytes
+                   or time.time() - self._swept > self.SWEEP_EVERY)
+        if due: self.evict()
+
+    def evict(self):
+        """Drop disk entries unused for disk_ttl, then the least recently used until under disk_max_bytes."""
+        now = time.time(); entries = []
+        for name in os.listdir(self.disk_dir):
+            path = os.path.join(self.disk_dir, name)
+            try: st = os.stat(path)
+            except OSError: continue
+            if now - st.st_mtime > self.disk_ttl: _remove(path)   # stale .tmp files too
+            elif name.endswith(".json.zst"): entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_max_bytes: break
+            _remove(path); total -= size
+        with self._lock:
+            self._disk_bytes = total; self._swept = now
+
+    def _remember(self, key, outline):
+        with self._lock:
+            self._mem[key] = outline
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.max_items:
+                self._mem.popitem(last=False)
+
+
+def _remove(path):
+    try: os.remove(path)
+    except OSError: pass
+
+
+cache = OutlineCache(
+    max_items=int(os.getenv("PPT_OUTLINE_CACHE_SIZE", "256")),
+    disk_dir=os.getenv("PPT_OUTLINE_CACHE_DIR") or None,
+    disk_max_bytes=int(os.getenv("PPT_OUTLINE_CACHE_MB", "256")) * 1024 * 1024,
+    disk_ttl=float(os.getenv("PPT_OUTLINE_CACHE_TTL", str(7 * 86400))),
+)
@@ -0,0 +1,143 @@
+"""
+outline_parse.py — tolerant reading of the model's outline JSON.
+
+The planner asks for a bare JSON array of slide objects. What comes back is
+now and then wrapped in prose or a ```json fence, carries a trailing comma,
+or stops mid-object because the completion ran out of tokens. Rather than
+fail the whole outline on json.loads, recover() keeps every slide that can
+be read and marks the rest as gaps, which the planner then asks the model
+for on their own (see planner._refill):
+
+    1. the whole array, between its outermost brackets
+    2. the same with trailing commas dropped
+    3. object by object with SlideScanner — skips prose, stops cleanly at
+       a truncated last object, and picks up again after an object broken
+       by a stray quote, so that object alone becomes a gap
+    4. failing those, a bare object where an array should be
+
+Each object is checked against Slide, a pydantic model (its validator is
+built once, at import). An object that fails is a gap like a missing one.
+"""
+import json, re
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+
+class Slide(BaseModel):
+    """What a readable slide needs. Keys it lacks are filled by planner.clean_slide."""
+    model_config = ConfigDict(extra="ignore", coerce_numbers_to_str=True, str_strip_whitespace=True)
+    title:    str = Field(min_length=1)
+    subtitle: str = ""
+    points:   list[str] = Field(min_length=1)
+    detail:   str = ""
+    notes:    str = ""
+    layout:   str = ""
+
+    @field_validator("points", mode="before")
+    @classmethod
+    def _split(cls, v):
+        # "points": "- one\n- two" instead of a list
+        if isinstance(v, str): return [p.strip(" -*•▸") for p in v.splitlines() if p.strip(" -*•▸")]
+        return v
+
+def validate(obj):
+    """The slide dict with only the keys it had, or None if obj isn't a usable slide."""
+    if not isinstance(obj, dict): return None
+    try: return Slide.model_validate(obj).model_dump(exclude_unset=True)
+    except ValidationError: return None
+
+
+# ── lenient JSON ──────────────────────────────────────────────────────────────
+_STR_OR_TRAILING_COMMA = re.compile(r'"(?:\\.|[^"\\])*"|,(?=\s*[}\]])', re.S)
+
+def _drop_trailing_commas(src):
+    return _STR_OR_TRAILING_COMMA.sub(lambda m: m.group() if m.group()[0] == '"' else "", src)
+
+def loads(src):
+    """json.loads allowing raw control characters in strings and trailing commas; None if still unreadable."""
+    try: return json.loads(src, strict=False)
+    except json.JSONDecodeError: pass
+    try: return json.loads(_drop_trailing_commas(src), strict=False)
+    except json.JSONDecodeError: return None
+
+
+class SlideScanner:
+    """
+    Incremental splitter for a streamed JSON array of objects. feed() takes
+    raw completion text and returns each top-level object's source as soon as
+    its closing brace arrives. Anything before the first "[" (prose, a
+    ```json fence) is skipped, as is anything after the closing "]".
+
+    An unescaped quote inside a string (`a 27" monitor`) would leave the
+    scanner "inside a string" from there on and swallow every later slide.
+    So an object boundary — `}` then `,` then `{`, or `}` then `]`, with only
+    whitespace between — seen while in a string ends the object there: that
+    object comes out unreadable and scanning resumes in step at the next one.
+    """
+    def __init__(self):
+        self._buf = []; self._depth = 0
+        self._in_str = self._esc = False
+        self._edge = 0; self._cut = 0   # boundary progress: 1 after "}", 2 after "},"; buffer length at "}"
+        self.started = self.done = False
+
+    def feed(self, chunk: str) -> list:
+        out = []
+        for ch in chunk:
+            if self.done: break
+            if not self.started:
+                self.started = ch == "["
+                continue
+            if self._depth == 0:
+                if ch == "{": self._depth = 1; self._buf = [ch]; self._in_str = self._esc = False; self._edge = 0
+                elif ch == "]": self.done = True
+                continue
+            if ch == "}": self._edge = 1; self._cut = len(self._buf) + 1
+            elif ch == "," and self._edge == 1: self._edge = 2
+            elif self._in_str and ((ch == "{" and self._edge == 2) or (ch == "]" and self._edge == 1)):
+                out.append("".join(self._buf[:self._cut]))   # resync: the object ended at that "}"
+                if ch == "{": self._buf = [ch]; self._depth = 1; self._in_str = self._esc = False; self._edge = 0
+                else: self.done = True
+                continue
+            elif not ch.isspace(): self._edge = 0
+            self._buf.append(ch)
+            if self._in_str:
+                if self._esc: self._esc = False
+                elif ch == "\\": self._esc = True
+                elif ch == '"': self._in_str = False
+            elif ch == '"': self._in_str = True
+            elif ch in "{[": self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0: out.append("".join(self._buf))
+        return out
+
+
+def _unfence(raw):
+    if "```" in raw:
+        for part in raw.split("```"):
+            part = part.strip()
+            if part.startswith("json"): part = part[4:].strip()
+            if part.startswith("["): return part
+    return raw
+
+def read_objects(raw: str) -> list:
+    """The array's items in order — None for an object that could not be read."""
+    raw = _unfence(raw)
+    start, end = raw.find("["), raw.rfind("]") + 1
+    if start != -1 and end > start:
+        data = loads(raw[start:end])
+        if isinstance(data, list) and any(isinstance(o, dict) for o in data): return data
+    items = [loads(src) for src in SlideScanner().feed(raw)]
+    brace = raw.find("{")
+    if brace != -1 and not any(isinstance(o, dict) for o in items):   # one bare object, not an array
+        data = loads(raw[brace:raw.rfind("}") + 1])
+        items = [data] if isinstance(data, dict) else [loads(src) for src in SlideScanner().feed("[" + raw[brace:])]
+    return items
+
+def recover(raw: str, n: int | None = None) -> list:
+    """
+    n slots (or as many as were written): a validated slide dict, or None
+    where the model's object was unreadable, invalid, or never written.
+    """
+    slots = [validate(obj) for obj in read_objects(raw)]
+    if n is None: return slots
+    return slots[:n] + [None] * (n - len(slots))
@@ -1,20 +1,20 @@
-import os
-import json
-from groq import Groq
+import asyncio
+from contextlib import aclosing
 from dotenv import load_dotenv
+from agent.outline_cache import outline_key
+from agent.llm import get_backend
+from agent.outline_parse import SlideScanner, loads, read_objects, recover, validate
+from metrics import count, span, log
 
 load_dotenv()
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+MODEL = "llama-3.3-70b-versatile"
+client = get_backend(MODEL)   # no I/O until the first call
+PROMPT_VERSION = 3   # bump whenever the prompt or cleanup changes — invalidates cached outlines
 
-def generate_outline(topic: str, slides: int = 10) -> list:
-    prompt = f"""
-You are an expert presentation designer and subject matter expert.
-Create a detailed, informative {slides}-slide presentation about: "{topic}".
-
-Return ONLY a valid JSON array with exactly {slides} objects.
-No markdown code blocks, no explanation — just the raw JSON array starting with [ and ending with ].
+def outline_id(topic: str, slides: int = 10) -> str:
+    return outline_key(topic, slides, MODEL, PROMPT_VERSION)
 
-Each object must have ALL of these keys:
+SLIDE_SPEC = """Each object must have ALL of these keys:
 - "title": compelling slide title (max 8 words)
 - "subtitle": one punchy line summarizing the slide (max 15 words)
 - "points": list of exactly 4 bullet points. Each bullet MUST be a complete sentence of 20-30 words that fully explains the concept with specific details, facts, or examples.
@@ -28,7 +28,17 @@ Each object must have ALL of these keys:
     "timeline"     - for sequential steps, history, or process
     "full_detail"  - for complex topics needing full explanation
 
-Rules:
+"""
+
+def _prompt(topic: str, slides: int) -> str:
+    return f"""
+You are an expert presentation designer and subject matter expert.
+Create a detailed, informative {slides}-slide presentation about: "{topic}".
+
+Return ONLY a valid JSON array with exactly {slides} objects.
+No markdown code blocks, no explanation — just the raw JSON array starting with [ and ending with ].
+
+{SLIDE_SPEC}Rules:
 - NEVER use the same layout twice in a row
 - Use "title_hero" for slide 1 and the last slide
 - Vary layouts across all {slides} slides
@@ -39,53 +49,300 @@ Rules:
 Return ONLY the JSON array. No markdown, no backticks, no explanation.
 """
 
-    response = client.chat.completions.create(
-        model="llama-3.3-70b-versatile",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.7,
-        max_tokens=6000,
-    )
-    raw = response.choices[0].message.content.strip()
-
-    # Strip markdown fences
-    if "```" in raw:
-        for part in raw.split("```"):
-            part = part.strip()
-            if part.startswith("json"):
-                part = part[4:].strip()
-            if part.startswith("["):
-                raw = part
-                break
-
-    # Find JSON boundaries
-    start = raw.find("[")
-    end   = raw.rfind("]") + 1
-    if start != -1 and end > start:
-        raw = raw[start:end]
-
-    data = json.loads(raw)
-
-    # Ensure we have exactly the right number of slides
-    # and all required keys exist
-    required_keys = ["title", "subtitle", "points", "detail", "notes", "layout"]
-    valid_layouts  = {"title_hero","two_column","icon_grid","stat_callout","timeline","full_detail"}
-    cleaned = []
-    for i, item in enumerate(data[:slides]):
-        for key in required_keys:
-            if key not in item:
-                if key == "points":
-                    item[key] = [f"Key concept about {item.get('title','this topic')}"] * 4
-                elif key == "layout":
-                    fallbacks = ["two_column","icon_grid","stat_callout","timeline","full_detail"]
-                    item[key] = fallbacks[i % len(fallbacks)]
-                else:
-                    item[key] = ""
-        if item["layout"] not in valid_layouts:
-            item["layout"] = "two_column"
-        # Ensure 4 points
-        while len(item["points"]) < 4:
-            item["points"].append(f"Additional insight about {item.get('title','this topic')}.")
-        item["points"] = item["points"][:4]
-        cleaned.append(item)
-
-    return cleaned
\ No newline at end of file
+REQUIRED_KEYS = ["title", "subtitle", "points", "detail", "notes", "layout"]
+VALID_LAYOUTS = {"title_hero","two_column","icon_grid","stat_callout","timeline","full_detail"}
+
+def clean_slide(item: dict, i: int) -> dict:
+    """Fill missing keys, fix the layout and force exactly 4 points on slide i (0-based)."""
+    for key in REQUIRED_KEYS:
+        if key not in item:
+            if key == "points":
+                item[key] = [f"Key concept about {item.get('title','this topic')}"] * 4
+            elif key == "layout":
+                fallbacks = ["two_column","icon_grid","stat_callout","timeline","full_detail"]
+                item[key] = fallbacks[i % len(fallbacks)]
+            else:
+                item[key] = ""
+    if item["layout"] not in VALID_LAYOUTS:
+        item["layout"] = "two_column"
+    # Ensure 4 points
+    while len(item["points"]) < 4:
+        item["points"].append(f"Additional insight about {item.get('title','this topic')}.")
+    item["points"] = item["points"][:4]
+    return item
+
+async def agenerate_outline(topic: str, slides: int = 10) -> list:
+    if slides > SECTION_THRESHOLD:
+        return await _generate_sectioned(topic, slides)
+    raw = await client.complete(_prompt(topic, slides), kind="outline")
+    with span("ppt_outline_parse_seconds", kind="outline"):
+        slots = recover(raw, slides)
+    return await _complete(topic, slots)
+
+def generate_outline(topic: str, slides: int = 10) -> list:
+    """Blocking wrapper for scripts and worker processes — the API awaits agenerate_outline."""
+    async def run():
+        try: return await agenerate_outline(topic, slides)
+        finally: await client.aclose()
+    return asyncio.run(run())
+
+
+# ── Sectioned generation (large decks) ───────────────────────────────────────
+# One 6000-token completion truncates somewhere past ~12 slides. Bigger decks
+# get a short section skeleton first, then one concurrent request per section,
+# each with its own token budget, so latency stays roughly flat with size.
+
+SECTION_THRESHOLD = 12   # decks larger than this are generated section by section
+SECTION_SIZE      = 6    # target slides per section
+TOKENS_PER_SLIDE  = 650
+
+def _skeleton_prompt(topic: str, slides: int, sections: int) -> str:
+    return f"""
+You are planning a {slides}-slide presentation about: "{topic}".
+Split it into exactly {sections} sections that flow logically from introduction to conclusion.
+
+Return ONLY a valid JSON array with exactly {sections} objects, each with:
+- "title": section title (max 6 words)
+- "focus": one sentence describing what the section covers
+
+No markdown, no backticks, no explanation.
+"""
+
+def _section_prompt(topic, slides, sections, k, first, count):
+    sec = sections[k]
+    outline = "\n".join(f"{j+1}. {s['title']}" for j, s in enumerate(sections))
+    hero = []
+    if first == 0: hero.append("the first slide of this section (it opens the deck)")
+    if first + count == slides: hero.append("the last slide of this section (it closes the deck)")
+    hero_rule = ('- Use "title_hero" ONLY for ' + " and ".join(hero)) if hero else '- Do NOT use "title_hero"'
+    return f"""
+You are an expert presentation designer and subject matter expert.
+You are writing part of a {slides}-slide presentation about: "{topic}".
+
+The full presentation has these sections:
+{outline}
+
+Write ONLY section {k+1}, "{sec['title']}" ({sec.get('focus', '')}):
+slides {first+1} to {first+count} of {slides}.
+
+Return ONLY a valid JSON array with exactly {count} objects.
+No markdown code blocks, no explanation — just the raw JSON array starting with [ and ending with ].
+
+{SLIDE_SPEC}Rules:
+- NEVER use the same layout twice in a row
+{hero_rule}
+- Do not repeat material that belongs to other sections
+- Make content expert-level, educational, and deeply informative
+- Include real-world examples, statistics, or named technologies where relevant
+- Each bullet point must be substantive — no vague filler phrases
+
+Return ONLY the JSON array. No markdown, no backticks, no explanation.
+"""
+
+def _fix_layout(outline: list, i: int) -> dict:
+    """Slide i, its layout changed if it repeats slide i-1's (already fixed) — avoiding slide i+1's too."""
+    fallbacks = ["two_column","icon_grid","stat_callout","timeline","full_detail"]
+    if i and outline[i]["layout"] == outline[i-1]["layout"]:
+        nxt = outline[i+1]["layout"] if i+1 < len(outline) else None
+        outline[i]["layout"] = next(l for l in fallbacks if l not in (outline[i-1]["layout"], nxt))
+    return outline[i]
+
+def _fix_layouts(outline: list) -> list:
+    """Re-apply the no-repeat layout rule across section seams."""
+    for i in range(len(outline)): _fix_layout(outline, i)
+    return outline
+
+async def _generate_sectioned(topic: str, slides: int) -> list:
+    n = -(-slides // SECTION_SIZE)
+    raw = await client.complete(_skeleton_prompt(topic, slides, n), 800, 0.5, kind="skeleton")
+    with span("ppt_outline_parse_seconds", kind="skeleton"):
+        sections = [s for s in read_objects(raw) if isinstance(s, dict) and s.get("title")][:n]
+    sections += [{"title": f"Part {k+1}", "focus": ""} for k in range(len(sections), n)]
+
+    # Spread slides as evenly as possible: e.g. 40 → 6,6,6,6,6,5,5
+    counts = [slides // n + (k < slides % n) for k in range(n)]
+    starts = [sum(counts[:k]) for k in range(n)]
+
+    async def section(k):
+        try:
+            raw = await client.complete(_section_prompt(topic, slides, sections, k, starts[k], counts[k]),
+                                        min(6000, TOKENS_PER_SLIDE * counts[k] + 400), kind="section")
+        except Exception as e:
+            # Its slides become gaps, re-requested with the other sections' titles as context
+            log(f"[Planner] section {k+1}/{n} failed: {e!r}")
+            return [None] * counts[k]
+        with span("ppt_outline_parse_seconds", kind="section"):
+            return recover(raw, counts[k])
+
+    parts = await asyncio.gather(*(section(k) for k in range(n)))
+    return await _complete(topic, [slot for part in parts for slot in part])
+
+
+# ── Repair ───────────────────────────────────────────────────────────────────
+# A malformed completion used to fail the whole outline. Now recover() keeps
+# every slide it can read, and only the gaps (a truncated tail, an object
+# that would not parse or validate) go back to the model — one request per
+# run of consecutive gaps, with the slides around it as context.
+
+def _gap_prompt(topic: str, slots: list, first: int, count: int) -> str:
+    n = len(slots)
+    titles = "\n".join(f"{j+1}. " + (s["title"] if s else "(to write)") for j, s in enumerate(slots))
+    which = f"slide {first+1} of {n}" if count == 1 else f"slides {first+1} to {first+count} of {n}"
+    hero = []
+    if first == 0: hero.append("slide 1 (it opens the deck)")
+    if first + count == n: hero.append(f"slide {n} (it closes the deck)")
+    hero_rule = ('- Use "title_hero" ONLY for ' + " and ".join(hero)) if hero else '- Do NOT use "title_hero"'
+    return f"""
+You are an expert presentation designer and subject matter expert.
+You are completing a {n}-slide presentation about: "{topic}".
+
+The slides so far:
+{titles}
+
+Write ONLY {which}.
+
+Return ONLY a valid JSON array with exactly {count} objects.
+No markdown code blocks, no explanation — just the raw JSON array starting with [ and ending with ].
+
+{SLIDE_SPEC}Rules:
+- NEVER use the same layout twice in a row
+{hero_rule}
+- Do not repeat material that belongs to the other slides
+- Make content expert-level, educational, and deeply informative
+- Include real-world examples, statistics, or named technologies where relevant
+- Each bullet point must be substantive — no vague filler phrases
+
+Return ONLY the JSON array. No markdown, no backticks, no explanation.
+"""
+
+def _gaps(slots: list) -> list:
+    """(first, count) for each run of None in slots."""
+    runs, i = [], 0
+    while i < len(slots):
+        if slots[i] is None:
+            j = i
+            while j < len(slots) and slots[j] is None: j += 1
+            runs.append((i, j - i)); i = j
+        else:
+            i += 1
+    return runs
+
+async def _refill(topic: str, slots: list) -> None:
+    """Fill the None slots in place with slides asked for on their own; a failed request leaves its gap."""
+    runs = _gaps(slots)
+    if not runs: return
+    log(f"[Planner] {sum(c for _, c in runs)}/{len(slots)} slides unreadable or missing, requesting only those")
+    async def fill(first, count):
+        try:
+            raw = await client.complete(_gap_prompt(topic, slots, first, count),
+                                        min(6000, TOKENS_PER_SLIDE * count + 400), kind="repair")
+        except Exception as e:
+            log(f"[Planner] refilling slides {first+1}-{first+count} failed: {e!r}"); return
+        with span("ppt_outline_parse_seconds", kind="repair"):
+            got = [item for item in recover(raw) if item][:count]
+        slots[first:first + len(got)] = got
+    await asyncio.gather(*(fill(first, count) for first, count in runs))
+    count("ppt_outline_slides_total", sum(c for _, c in runs) - slots.count(None), outcome="refilled")
+
+async def _complete(topic: str, slots: list) -> list:
+    """The cleaned outline from recover()ed slots, gaps re-requested; slides still missing are dropped."""
+    count("ppt_outline_slides_total", len(slots) - slots.count(None), outcome="parsed")
+    await _refill(topic, slots)
+    dropped = slots.count(None)
+    if dropped:
+        count("ppt_outline_slides_total", dropped, outcome="dropped")
+        log(f"[Planner] dropping {dropped} slide(s) the model never produced")
+    outline = [item for item in slots if item is not None]
+    if not outline: raise ValueError("The model returned no readable slides")
+    with span("ppt_outline_parse_seconds", kind="clean"):
+        return _fix_layouts([clean_slide(item, i) for i, item in enumerate(outline)])
+
+
+# ── Single-slide edits ───────────────────────────────────────────────────────
+# Re-writing one slide of an existing deck: only the neighbouring titles go in
+# the prompt, so the call costs one slide's tokens whatever the deck length.
+
+def _slide_prompt(topic: str, outline: list, i: int, instruction: str | None) -> str:
+    n = len(outline)
+    around = "\n".join(f"{j+1}. {outline[j].get('title', '')}" + ("   <- rewrite this one" if j == i else "")
+                       for j in range(max(0, i - 2), min(n, i + 3)))
+    hero = i == 0 or i == n - 1
+    layouts = {outline[j].get("layout") for j in (i - 1, i + 1) if 0 <= j < n}
+    hero_rule = '- Use "title_hero"' if hero else '- Do NOT use "title_hero"'
+    avoid = ", ".join(f'"{l}"' for l in sorted(layouts - {"title_hero", None}))
+    return f"""
+You are an expert presentation designer and subject matter expert.
+You are revising a {n}-slide presentation about: "{topic}".
+
+Neighbouring slides:
+{around}
+
+Write ONLY slide {i+1} of {n}.{f' Requested change: {instruction.strip()}' if instruction and instruction.strip() else ''}
+
+Return ONLY a valid JSON array with exactly 1 object.
+No markdown code blocks, no explanation — just the raw JSON array starting with [ and ending with ].
+
+{SLIDE_SPEC}Rules:
+{hero_rule}{f"{chr(10)}- Do NOT use {avoid} (used by the neighbouring slides)" if avoid else ""}
+- Do not repeat material that belongs to the neighbouring slides
+- Make content expert-level, educational, and deeply informative
+- Include real-world examples, statistics, or named technologies where relevant
+- Each bullet point must be substantive — no vague filler phrases
+
+Return ONLY the JSON array. No markdown, no backticks, no explanation.
+"""
+
+async def agenerate_slide(topic: str, outline: list, i: int, instruction: str | None = None) -> dict:
+    """A fresh slide i (0-based) for `outline`, written with its neighbours' titles as context."""
+    raw = await client.complete(_slide_prompt(topic, outline, i, instruction), TOKENS_PER_SLIDE + 400, kind="slide")
+    with span("ppt_outline_parse_seconds", kind="slide"):
+        item = next((d for d in recover(raw) if d), None)
+        if item is None: raise ValueError("The model returned no slide")
+        return clean_slide(item, i)
+
+
+# ── Streaming ────────────────────────────────────────────────────────────────
+
+async def astream_outline(topic: str, slides: int = 10):
+    """
+    Same outline as agenerate_outline, but yields each cleaned slide dict as
+    soon as the model has written it and the one after it (the layout rule
+    looks both ways). An unreadable slide stays a gap at its position: the
+    slides after it are held back until the stream ends and the gaps have
+    been asked for on their own, so the deck keeps the model's order.
+    Sectioned decks finish all sections at about the same time, so they are
+    yielded once merged.
+    """
+    if slides > SECTION_THRESHOLD:
+        for item in await _generate_sectioned(topic, slides):
+            yield item
+        return
+    scanner = SlideScanner(); slots = []; sent = 0; gap = None   # gap: index of the first unreadable slide
+    async with aclosing(client.stream(_prompt(topic, slides), max_tokens=6000)) as deltas:
+        async for delta in deltas:
+            for raw in scanner.feed(delta):
+                if len(slots) >= slides: break
+                with span("ppt_outline_parse_seconds", kind="stream"):
+                    item = validate(loads(raw))
+                    if item is None:
+                        log(f"[Planner] slide {len(slots)+1} unreadable, will re-request it")
+                        if gap is None: gap = len(slots)
+                    elif gap is None:
+                        item = clean_slide(item, len(slots))
+                slots.append(item)
+                while sent + 1 < min(len(slots), slides if gap is None else gap):
+                    yield _fix_layout(slots, sent); sent += 1
+            if scanner.done or len(slots) >= slides: break
+    count("ppt_outline_slides_total", len(slots) - slots.count(None), outcome="parsed")
+    slots += [None] * (slides - len(slots))
+    await _refill(topic, slots)
+    dropped = slots.count(None)
+    if dropped:
+        count("ppt_outline_slides_total", dropped, outcome="dropped")
+        log(f"[Planner] dropping {dropped} slide(s) the model never produced")
+    outline = slots[:sent] + [item for item in slots[sent:] if item is not None]
+    if not outline: raise ValueError("The model returned no readable slides")
+    with span("ppt_outline_parse_seconds", kind="clean"):
+        for i in range(sent, len(outline)): outline[i] = clean_slide(outline[i], i)
+    for i in range(sent, len(outline)):
+        yield _fix_layout(outline, i)
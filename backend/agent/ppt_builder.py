@@ -11,55 +11,177 @@ from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
-import io, sys, os
+from pptx.oxml import parse_xml
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.slide import NotesSlidePart
+from pptx.oxml.text import CT_RegularTextRun
+from lxml import etree
+import copy, io, sys, os, threading
+from functools import lru_cache
 sys.path.insert(0, os.path.dirname(__file__))
 from anim_engine import AnimSequence, add_transition
+from agent.slide_cache import cache as slide_cache, slide_key
+from metrics import count, span
 
 W = Inches(13.33); H = Inches(7.5)
 
+@lru_cache(maxsize=1024)
 def rgb(h):
     h=h.lstrip("#"); return RGBColor(int(h[:2],16),int(h[2:4],16),int(h[4:],16))
 
+_pt = lru_cache(maxsize=None)(Pt)   # Length is an immutable int, safe to share
+
+# ── resolved theme ────────────────────────────────────────────────────────────
+class ResolvedTheme:
+    """
+    A theme dict with its colours parsed into RGBColor once. Templates read
+    th.accent / th.font_head instead of rgb(th["accent"]) / th["font_head"].
+    Palettes don't vary by template, so one instance per theme is shared by
+    every template and request (see resolve_theme).
+    """
+    COLORS = ("bg","card_bg","header_bg","title_color","body_color","muted_color","accent","accent2")
+    FONTS  = ("font_head","font_body")
+    __slots__ = ("name",) + COLORS + FONTS
+
+    def __init__(self, name, *values):
+        self.name = name
+        for k, v in zip(self.COLORS, values): setattr(self, k, rgb(v))
+        for k, v in zip(self.FONTS, values[len(self.COLORS):]): setattr(self, k, v)
+
+@lru_cache(maxsize=256)
+def _resolve(*values): return ResolvedTheme(*values)
+
+def resolve_theme(th):
+    if isinstance(th, ResolvedTheme): return th
+    return _resolve(th.get("name",""), *(th[k] for k in ResolvedTheme.COLORS + ResolvedTheme.FONTS))
+
 def bg(slide, c): f=slide.background.fill; f.solid(); f.fore_color.rgb=c
 
-def rect(slide,l,t,w,h,c):
-    s=slide.shapes.add_shape(1,l,t,w,h)
-    s.fill.solid(); s.fill.fore_color.rgb=c; s.line.fill.background(); return s
+# ── shape fast path ───────────────────────────────────────────────────────────
+# Setting a fill, line or font through python-pptx's proxies costs several XPath
+# lookups per property. Instead each kind of shape (per flag combination) is
+# built that way once, on a scratch slide with marker values, and kept as a
+# prototype; later shapes are a deepcopy with the marked attributes and text
+# set in place. The XML is byte-for-byte what python-pptx would have written.
+_MARK = dict(id="900000", n="899999", x="910001", y="910002", cx="910003", cy="910004",
+             c="ABCDEF", fn="@font@", sz="7700", lw="98679", text="@text@")
+_CNVPR = "{http://schemas.openxmlformats.org/presentationml/2006/main}cNvPr"
+_text = etree._Element.text   # raw .text; some oxml classes (a:p) shadow it with a property
+_esc = CT_RegularTextRun._escape_ctrl_chars   # what _Run.text does to control chars
+
+def _unmark(v):
+    for f, m in _MARK.items(): v = v.replace(m, "{%s}" % f)
+    return v
+
+class _Proto:
+    """An element built once through python-pptx, plus where the marker values ended up."""
+    __slots__ = ("el", "slots")
+    def __init__(self, el):
+        self.el, self.slots = el, []
+        for i, node in enumerate(el.iter()):
+            for k, v in node.attrib.items():
+                if _unmark(v) != v: self.slots.append((i, k, _unmark(v)))
+            v = _text.__get__(node)
+            if v and _unmark(v) != v: self.slots.append((i, None, _unmark(v)))
+
+    def __call__(self, **vals):
+        el = copy.deepcopy(self.el); nodes = list(el.iter())
+        for i, k, tmpl in self.slots:
+            if k is None: _text.__set__(nodes[i], tmpl.format_map(vals))
+            else: nodes[i].set(k, tmpl.format_map(vals))
+        return el
+
+_protos = {}; _proto_lock = threading.Lock(); _scratch = []
+
+def _proto(key, build):
+    """Prototype for `key`, made on first use by build(slide, **markers) -> element."""
+    p = _protos.get(key)
+    if p is None:
+        with _proto_lock:
+            p = _protos.get(key)
+            if p is None:
+                if not _scratch:   # spTree's own id is the max, so the next shape gets _MARK["id"]
+                    prs = Presentation(); s = prs.slides.add_slide(prs.slide_layouts[6])
+                    s.shapes._spTree[0][0].set("id", _MARK["n"]); _scratch.append(s)
+                m = {k: int(v) for k, v in _MARK.items() if k in ("x","y","cx","cy","lw")}
+                el = build(_scratch[0], c=RGBColor.from_string(_MARK["c"]), fn=_MARK["fn"],
+                           sz=int(_MARK["sz"])//100, text=_MARK["text"], **m)
+                if el.getparent() is not None: el.getparent().remove(el)
+                p = _protos[key] = _Proto(el)
+    return p
+
+def _place(slide, proto, l, t, w, h, **vals):
+    tree = slide.shapes._spTree   # next id as python-pptx: max @id + 1 (only cNvPr carry one before timing)
+    nid = max(int(i) for i in (e.get("id") for e in tree.iter(_CNVPR)) if i.isdigit()) + 1
+    sp = proto(id=nid, n=nid-1, x="%d" % l, y="%d" % t, cx="%d" % w, cy="%d" % h, **vals)
+    tree.insert_element_before(sp, "p:extLst")
+    return slide.shapes._shape_factory(sp)
+
+def _pptx_auto(prst):
+    def build(slide, x, y, cx, cy, c, **_):
+        s=slide.shapes.add_shape(prst,x,y,cx,cy)
+        s.fill.solid(); s.fill.fore_color.rgb=c; s.line.fill.background(); return s._element
+    return build
+
+def _pptx_outline(slide, x, y, cx, cy, c, lw, **_):
+    s=slide.shapes.add_shape(1,x,y,cx,cy)
+    s.fill.background(); s.line.color.rgb=c; s.line.width=lw; return s._element
+
+def _pptx_txt(bold, italic, align, wrap, font):
+    def build(slide, x, y, cx, cy, c, fn, sz, text, **_):
+        b=slide.shapes.add_textbox(x,y,cx,cy); tf=b.text_frame; tf.word_wrap=wrap
+        p=tf.paragraphs[0]; p.alignment=align; r=p.add_run()
+        r.text=text; r.font.name=fn if font else None; r.font.size=Pt(sz)
+        r.font.color.rgb=c; r.font.bold=bold; r.font.italic=italic; return b._element
+    return build
+
+def _pptx_para(font):
+    def build(slide, c, fn, sz, text, **_):
+        b=slide.shapes.add_textbox(0,0,0,0); tf=b.text_frame
+        p=tf.add_paragraph(); p.alignment=PP_ALIGN.LEFT; p.space_before=_pt(8)
+        r=p.add_run(); r.text=text; r.font.name=fn if font else None; r.font.size=Pt(sz); r.font.color.rgb=c
+        b._element.getparent().remove(b._element); return p._p
+    return build
+
+def _auto(slide,prst,l,t,w,h,c):
+    return _place(slide, _proto(("auto",prst), _pptx_auto(prst)), l,t,w,h, c=str(c))
+
+def rect(slide,l,t,w,h,c): return _auto(slide,1,l,t,w,h,c)
 
 def rrect(slide,l,t,w,h,c,lc=None,lw=1.5):
     """rect with optional border"""
-    s=slide.shapes.add_shape(1,l,t,w,h)
-    if lc: s.fill.background(); s.line.color.rgb=lc; s.line.width=Pt(lw)
-    else: s.fill.solid(); s.fill.fore_color.rgb=c; s.line.fill.background()
-    return s
+    if lc: return _place(slide, _proto(("outline",), _pptx_outline), l,t,w,h, c=str(lc), lw=str(_pt(lw)))
+    return _auto(slide,1,l,t,w,h,c)
 
-def oval(slide,l,t,w,h,c):
-    s=slide.shapes.add_shape(9,l,t,w,h); s.fill.solid()
-    s.fill.fore_color.rgb=c; s.line.fill.background(); return s
+def oval(slide,l,t,w,h,c): return _auto(slide,9,l,t,w,h,c)
 
-def tri(slide,l,t,w,h,c):
-    s=slide.shapes.add_shape(5,l,t,w,h); s.fill.solid()
-    s.fill.fore_color.rgb=c; s.line.fill.background(); return s
+def tri(slide,l,t,w,h,c): return _auto(slide,5,l,t,w,h,c)
 
 def txt(slide,text,l,t,w,h,fn="Calibri",sz=18,c=RGBColor(255,255,255),
         bold=False,italic=False,align=PP_ALIGN.LEFT,wrap=True):
-    b=slide.shapes.add_textbox(l,t,w,h); tf=b.text_frame; tf.word_wrap=wrap
-    p=tf.paragraphs[0]; p.alignment=align; r=p.add_run()
-    r.text=text; r.font.name=fn; r.font.size=Pt(sz)
-    r.font.color.rgb=c; r.font.bold=bold; r.font.italic=italic; return b
+    key=("txt",bold,italic,align,wrap,fn is not None)
+    return _place(slide, _proto(key, _pptx_txt(*key[1:])), l,t,w,h,
+                  c=str(c), fn=fn, sz=_pt(sz).centipoints, text=_esc(text))
 
 def bpara(tf,text,fn,sz,c,bullet="▸ "):
-    p=tf.add_paragraph(); p.alignment=PP_ALIGN.LEFT; p.space_before=Pt(8)
-    r=p.add_run(); r.text=bullet+text; r.font.name=fn; r.font.size=Pt(sz); r.font.color.rgb=c
+    p=_proto(("para",fn is not None), _pptx_para(fn is not None))
+    tf._txBody.append(p(c=str(c), fn=fn, sz=_pt(sz).centipoints, text=_esc(bullet+text)))
+
+def _pptx_bullets(font, first):
+    def build(slide, x, y, cx, cy, c, fn, sz, text, **_):
+        b=slide.shapes.add_textbox(x,y,cx,cy); tf=b.text_frame; tf.word_wrap=True
+        if first:
+            r=tf.paragraphs[0].add_run(); r.text=text
+            r.font.name=fn if font else None; r.font.size=Pt(sz); r.font.color.rgb=c
+        return b._element
+    return build
 
 def bullets(slide,pts,l,t,w,h,th,bullet="▸  ",fn=None):
-    fn=fn or th["font_body"]
-    b=slide.shapes.add_textbox(l,t,w,h); tf=b.text_frame; tf.word_wrap=True
-    for i,pt in enumerate(pts):
-        if i==0:
-            p0=tf.paragraphs[0]; r=p0.add_run(); r.text=bullet+pt
-            r.font.name=fn; r.font.size=Pt(13); r.font.color.rgb=rgb(th["body_color"])
-        else: bpara(tf,pt,fn,13,rgb(th["body_color"]),bullet)
+    fn=fn or th.font_body
+    key=("bullets",fn is not None,bool(pts)); c=th.body_color
+    b=_place(slide, _proto(key, _pptx_bullets(*key[1:])), l,t,w,h,
+             c=str(c), fn=fn, sz=_pt(13).centipoints, text=_esc(bullet+pts[0]) if pts else "")
+    for pt in pts[1:]: bpara(b.text_frame,pt,fn,13,c,bullet)
     return b
 
 def notes(slide,text):
@@ -70,12 +192,12 @@ def notes(slide,text):
 # ─────────────────────── TEMPLATE BASE ────────────────────────────────────────
 class _Base:
     trans="fade"
-    def __init__(self,th): self.th=th
+    def __init__(self,th): self.th=resolve_theme(th)
 
     def _slide(self,prs,bg_col=None):
         s=prs.slides.add_slide(prs.slide_layouts[6])
         if bg_col: bg(s,bg_col)
-        else: bg(s,rgb(self.th["bg"]))
+        else: bg(s,self.th.bg)
         return s, AnimSequence()
 
     def hero(self,prs,data,idx): return self.content(prs,data,idx)
@@ -95,29 +217,29 @@ class Futuristic(_Base):
     trans="push"
     def _chrome(self,slide,seq,idx):
         th=self.th
-        bar=rect(slide,Inches(0),Inches(0),Inches(0.42),H,rgb(th["accent"]))
+        bar=rect(slide,Inches(0),Inches(0),Inches(0.42),H,th.accent)
         seq.wipe_in(bar,dur=400)
-        tl=rect(slide,Inches(0.42),Inches(0),W-Inches(0.42),Inches(0.05),rgb(th["accent"]))
+        tl=rect(slide,Inches(0.42),Inches(0),W-Inches(0.42),Inches(0.05),th.accent)
         seq.wipe_in(tl,dur=500,delay=100)
-        c=oval(slide,W-Inches(1.1),Inches(0.08),Inches(0.75),Inches(0.75),rgb(th["accent2"]))
+        c=oval(slide,W-Inches(1.1),Inches(0.08),Inches(0.75),Inches(0.75),th.accent2)
         seq.zoom_in(c,dur=350,delay=200)
         n=txt(slide,f"{idx:02d}",Inches(0.6),Inches(0.12),Inches(1.2),Inches(0.5),
-              th["font_body"],11,rgb(th["accent"]),bold=True)
+              th.font_body,11,th.accent,bold=True)
         seq.appear(n,delay=280)
 
     def hero(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         self._chrome(slide,seq,idx)
-        bg_c=oval(slide,Inches(8.5),Inches(-1.8),Inches(6.2),Inches(6.2),rgb(th["header_bg"]))
+        bg_c=oval(slide,Inches(8.5),Inches(-1.8),Inches(6.2),Inches(6.2),th.header_bg)
         seq.zoom_in(bg_c,dur=600,delay=80)
         t=txt(slide,data["title"],Inches(0.6),Inches(1.1),Inches(11),Inches(2.9),
-              th["font_head"],54,rgb(th["title_color"]),bold=True)
+              th.font_head,54,th.title_color,bold=True)
         seq.fly_in(t,dur=600,delay=280)
         s=txt(slide,data.get("subtitle",""),Inches(0.6),Inches(4.0),Inches(10),Inches(0.8),
-              th["font_body"],20,rgb(th["accent"]),italic=True)
+              th.font_body,20,th.accent,italic=True)
         seq.fade(s,dur=400,delay=500)
         d=txt(slide,data.get("detail",""),Inches(0.6),Inches(4.9),Inches(10.5),Inches(2.1),
-              th["font_body"],14,rgb(th["muted_color"]),wrap=True)
+              th.font_body,14,th.muted_color,wrap=True)
         seq.fade(d,dur=400,delay=700)
         return self._fin(slide,seq,data)
 
@@ -125,22 +247,22 @@ class Futuristic(_Base):
         slide,seq=self._slide(prs); th=self.th
         self._chrome(slide,seq,idx)
         t=txt(slide,data["title"],Inches(0.6),Inches(0.45),Inches(8.5),Inches(1.2),
-              th["font_head"],34,rgb(th["title_color"]),bold=True)
+              th.font_head,34,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=240)
         s=txt(slide,data.get("subtitle",""),Inches(0.6),Inches(1.6),Inches(8),Inches(0.5),
-              th["font_body"],13,rgb(th["accent"]),italic=True)
+              th.font_body,13,th.accent,italic=True)
         seq.fade(s,dur=350,delay=400)
         bl=bullets(slide,data.get("points",[]),Inches(0.6),Inches(2.25),Inches(6.5),Inches(4.8),th)
         seq.fly_in(bl,dur=500,delay=530)
-        card=rect(slide,Inches(7.4),Inches(0.38),Inches(5.5),Inches(6.8),rgb(th["card_bg"]))
+        card=rect(slide,Inches(7.4),Inches(0.38),Inches(5.5),Inches(6.8),th.card_bg)
         seq.fade(card,dur=400,delay=290)
-        cb=rect(slide,Inches(7.4),Inches(0.38),Inches(0.09),Inches(6.8),rgb(th["accent"]))
+        cb=rect(slide,Inches(7.4),Inches(0.38),Inches(0.09),Inches(6.8),th.accent)
         seq.wipe_in(cb,dur=400,delay=340)
         lbl=txt(slide,"ANALYSIS",Inches(7.65),Inches(0.72),Inches(5),Inches(0.38),
-                th["font_body"],9,rgb(th["accent"]),bold=True)
+                th.font_body,9,th.accent,bold=True)
         seq.appear(lbl,delay=400)
         d=txt(slide,data.get("detail",""),Inches(7.65),Inches(1.2),Inches(5.05),Inches(5.8),
-              th["font_body"],13,rgb(th["body_color"]),wrap=True)
+              th.font_body,13,th.body_color,wrap=True)
         seq.fade(d,dur=400,delay=580)
         seq.grow_emphasis(card,scale=102)
         return self._fin(slide,seq,data)
@@ -148,24 +270,24 @@ class Futuristic(_Base):
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         self._chrome(slide,seq,idx)
-        strip=rect(slide,Inches(0.42),Inches(0),W-Inches(0.42),Inches(2.1),rgb(th["header_bg"]))
+        strip=rect(slide,Inches(0.42),Inches(0),W-Inches(0.42),Inches(2.1),th.header_bg)
         seq.fade(strip,dur=400,delay=80)
         t=txt(slide,data["title"],Inches(0.6),Inches(0.35),Inches(12),Inches(1.1),
-              th["font_head"],36,rgb(th["title_color"]),bold=True)
+              th.font_head,36,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=200)
         pts=data.get("points",[""])
         pos=[(Inches(0.62),Inches(2.28)),(Inches(6.9),Inches(2.28)),(Inches(0.62),Inches(4.98)),(Inches(6.9),Inches(4.98))]
         for i,(pt,(cx,cy)) in enumerate(zip(pts[:4],pos)):
             d=430+i*130
-            c=rect(slide,cx,cy,Inches(6.05),Inches(2.38),rgb(th["card_bg"]))
+            c=rect(slide,cx,cy,Inches(6.05),Inches(2.38),th.card_bg)
             seq.zoom_in(c,dur=400,delay=d)
-            bdg=oval(slide,cx+Inches(0.14),cy+Inches(0.13),Inches(0.54),Inches(0.54),rgb(th["accent"]))
+            bdg=oval(slide,cx+Inches(0.14),cy+Inches(0.13),Inches(0.54),Inches(0.54),th.accent)
             seq.zoom_in(bdg,dur=250,delay=d+80); seq.grow_emphasis(bdg,scale=115)
             bn=txt(slide,f"0{i+1}",cx+Inches(0.14),cy+Inches(0.13),Inches(0.54),Inches(0.54),
-                   th["font_body"],11,rgb(th["bg"]),bold=True,align=PP_ALIGN.CENTER)
+                   th.font_body,11,th.bg,bold=True,align=PP_ALIGN.CENTER)
             seq.appear(bn,delay=d+80)
             ptxt=txt(slide,pt,cx+Inches(0.84),cy+Inches(0.08),Inches(5.05),Inches(2.18),
-                     th["font_body"],12,rgb(th["body_color"]),wrap=True)
+                     th.font_body,12,th.body_color,wrap=True)
             seq.fade(ptxt,dur=350,delay=d+150)
         return self._fin(slide,seq,data)
 
@@ -173,50 +295,50 @@ class Futuristic(_Base):
         slide,seq=self._slide(prs); th=self.th
         self._chrome(slide,seq,idx)
         t=txt(slide,data["title"],Inches(0.6),Inches(0.38),Inches(12),Inches(1.1),
-              th["font_head"],36,rgb(th["title_color"]),bold=True)
+              th.font_head,36,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=200)
-        tl=rect(slide,Inches(0.6),Inches(3.48),Inches(12.45),Inches(0.08),rgb(th["accent"]))
+        tl=rect(slide,Inches(0.6),Inches(3.48),Inches(12.45),Inches(0.08),th.accent)
         seq.wipe_in(tl,dur=600,delay=420)
         pts=data.get("points",[]); n=min(len(pts),4); sp=Inches(12.4)/max(n,1)
         for i,pt in enumerate(pts[:4]):
             cx=Inches(0.6)+i*sp+sp/2-Inches(1.5); d=520+i*160
-            dot=oval(slide,cx+Inches(1.14),Inches(3.2),Inches(0.6),Inches(0.6),rgb(th["accent"]))
+            dot=oval(slide,cx+Inches(1.14),Inches(3.2),Inches(0.6),Inches(0.6),th.accent)
             seq.zoom_in(dot,dur=300,delay=d); seq.grow_emphasis(dot,scale=120)
             sn=txt(slide,str(i+1),cx+Inches(1.14),Inches(3.2),Inches(0.6),Inches(0.6),
-                   th["font_head"],13,rgb(th["bg"]),bold=True,align=PP_ALIGN.CENTER)
+                   th.font_head,13,th.bg,bold=True,align=PP_ALIGN.CENTER)
             seq.appear(sn,delay=d+40)
-            card=rect(slide,cx,Inches(3.98),Inches(3.04),Inches(2.98),rgb(th["card_bg"]))
+            card=rect(slide,cx,Inches(3.98),Inches(3.04),Inches(2.98),th.card_bg)
             seq.fade(card,dur=350,delay=d+80)
             ptxt=txt(slide,pt,cx+Inches(0.12),Inches(4.12),Inches(2.78),Inches(2.72),
-                     th["font_body"],12,rgb(th["body_color"]),wrap=True)
+                     th.font_body,12,th.body_color,wrap=True)
             seq.fly_in(ptxt,dur=350,delay=d+160)
         return self._fin(slide,seq,data)
 
     def numbered(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         self._chrome(slide,seq,idx)
-        panel=rect(slide,Inches(0.42),Inches(0),Inches(5.25),H,rgb(th["header_bg"]))
+        panel=rect(slide,Inches(0.42),Inches(0),Inches(5.25),H,th.header_bg)
         seq.fade(panel,dur=400,delay=80)
-        sep=rect(slide,Inches(5.67),Inches(0),Inches(0.08),H,rgb(th["accent"]))
+        sep=rect(slide,Inches(5.67),Inches(0),Inches(0.08),H,th.accent)
         seq.wipe_in(sep,dur=450,delay=120)
         t=txt(slide,data["title"],Inches(0.62),Inches(0.68),Inches(4.8),Inches(1.5),
-              th["font_head"],30,rgb(th["title_color"]),bold=True)
+              th.font_head,30,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=240)
         s=txt(slide,data.get("subtitle",""),Inches(0.62),Inches(2.22),Inches(4.8),Inches(0.55),
-              th["font_body"],13,rgb(th["accent"]),italic=True)
+              th.font_body,13,th.accent,italic=True)
         seq.fade(s,dur=350,delay=400)
         d=txt(slide,data.get("detail",""),Inches(0.62),Inches(2.95),Inches(4.8),Inches(4.1),
-              th["font_body"],12,rgb(th["body_color"]),wrap=True)
+              th.font_body,12,th.body_color,wrap=True)
         seq.fade(d,dur=400,delay=530)
         for i,pt in enumerate(data.get("points",[])[:4]):
             y=Inches(0.52+i*1.65); dd=290+i*160
-            c=oval(slide,Inches(6.08),y,Inches(0.68),Inches(0.68),rgb(th["accent"]))
+            c=oval(slide,Inches(6.08),y,Inches(0.68),Inches(0.68),th.accent)
             seq.zoom_in(c,dur=300,delay=dd)
             nt=txt(slide,str(i+1),Inches(6.08),y,Inches(0.68),Inches(0.68),
-                   th["font_head"],16,rgb(th["bg"]),bold=True,align=PP_ALIGN.CENTER)
+                   th.font_head,16,th.bg,bold=True,align=PP_ALIGN.CENTER)
             seq.appear(nt,delay=dd+30)
             ptxt=txt(slide,pt,Inches(6.9),y,Inches(6.1),Inches(1.5),
-                     th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                     th.font_body,13,th.body_color,wrap=True)
             seq.sweep_from_left(ptxt,delay=dd+80,dur=600)
         return self._fin(slide,seq,data)
 
@@ -228,85 +350,85 @@ class Minimalist(_Base):
     trans="fade"
     def hero(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        hr=rect(slide,Inches(1.0),Inches(1.45),Inches(3.5),Inches(0.025),rgb(th["accent"]))
+        hr=rect(slide,Inches(1.0),Inches(1.45),Inches(3.5),Inches(0.025),th.accent)
         seq.wipe_in(hr,dur=600)
         wm=txt(slide,f"{idx:02d}",Inches(9.5),Inches(4.5),Inches(3.5),Inches(3.0),
-               th["font_head"],120,rgb(th["muted_color"]),bold=True,align=PP_ALIGN.RIGHT)
+               th.font_head,120,th.muted_color,bold=True,align=PP_ALIGN.RIGHT)
         seq.fade(wm,dur=800,delay=100)
         t=txt(slide,data["title"],Inches(1.0),Inches(1.75),Inches(9.5),Inches(2.8),
-              th["font_head"],54,rgb(th["title_color"]),bold=True)
+              th.font_head,54,th.title_color,bold=True)
         seq.fade(t,dur=600,delay=200)
         s=txt(slide,data.get("subtitle",""),Inches(1.0),Inches(4.5),Inches(9),Inches(0.7),
-              th["font_body"],16,rgb(th["muted_color"]),italic=True)
+              th.font_body,16,th.muted_color,italic=True)
         seq.fade(s,dur=500,delay=450)
         d=txt(slide,data.get("detail",""),Inches(1.0),Inches(5.3),Inches(9.5),Inches(1.8),
-              th["font_body"],13,rgb(th["body_color"]),wrap=True)
+              th.font_body,13,th.body_color,wrap=True)
         seq.fade(d,dur=500,delay=650)
-        br=rect(slide,Inches(1.0),Inches(6.98),W-Inches(2.0),Inches(0.025),rgb(th["muted_color"]))
+        br=rect(slide,Inches(1.0),Inches(6.98),W-Inches(2.0),Inches(0.025),th.muted_color)
         seq.wipe_in(br,dur=600,delay=800)
         return self._fin(slide,seq,data)
 
     def content(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        vl=rect(slide,Inches(1.0),Inches(0.8),Inches(0.025),Inches(6.0),rgb(th["accent"]))
+        vl=rect(slide,Inches(1.0),Inches(0.8),Inches(0.025),Inches(6.0),th.accent)
         seq.wipe_in(vl,dur=500)
         n=txt(slide,f"{idx:02d}",Inches(0.38),Inches(0.38),Inches(0.5),Inches(0.5),
-              th["font_body"],10,rgb(th["muted_color"]))
+              th.font_body,10,th.muted_color)
         seq.appear(n,delay=100)
         t=txt(slide,data["title"],Inches(1.2),Inches(0.65),Inches(9.5),Inches(1.3),
-              th["font_head"],36,rgb(th["title_color"]),bold=True)
+              th.font_head,36,th.title_color,bold=True)
         seq.fade(t,dur=500,delay=200)
         s=txt(slide,data.get("subtitle",""),Inches(1.2),Inches(1.9),Inches(9.5),Inches(0.5),
-              th["font_body"],13,rgb(th["accent"]),italic=True)
+              th.font_body,13,th.accent,italic=True)
         seq.fade(s,dur=400,delay=370)
         bl=bullets(slide,data.get("points",[]),Inches(1.2),Inches(2.55),Inches(6.5),Inches(4.5),th,bullet="— ")
         seq.fade(bl,dur=450,delay=490)
-        db_t=rect(slide,Inches(8.5),Inches(0.65),Inches(4.35),Inches(0.04),rgb(th["accent"]))
+        db_t=rect(slide,Inches(8.5),Inches(0.65),Inches(4.35),Inches(0.04),th.accent)
         seq.wipe_in(db_t,dur=400,delay=310)
         d=txt(slide,data.get("detail",""),Inches(8.5),Inches(0.88),Inches(4.35),Inches(6.3),
-              th["font_body"],14,rgb(th["body_color"]),wrap=True)
+              th.font_body,14,th.body_color,wrap=True)
         seq.fade(d,dur=500,delay=510)
         return self._fin(slide,seq,data)
 
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        hr=rect(slide,Inches(1.0),Inches(0.98),Inches(11.5),Inches(0.025),rgb(th["accent"]))
+        hr=rect(slide,Inches(1.0),Inches(0.98),Inches(11.5),Inches(0.025),th.accent)
         seq.wipe_in(hr,dur=600)
         t=txt(slide,data["title"],Inches(1.0),Inches(0.22),Inches(10),Inches(0.8),
-              th["font_head"],32,rgb(th["title_color"]),bold=True)
+              th.font_head,32,th.title_color,bold=True)
         seq.fade(t,dur=500,delay=150)
         pts=data.get("points",[""])
         pos=[(Inches(1.0),Inches(1.28)),(Inches(7.3),Inches(1.28)),(Inches(1.0),Inches(4.18)),(Inches(7.3),Inches(4.18))]
         for i,(pt,(cx,cy)) in enumerate(zip(pts[:4],pos)):
             d=340+i*120
-            cb=rect(slide,cx,cy,Inches(0.03),Inches(2.8),rgb(th["accent"]))
+            cb=rect(slide,cx,cy,Inches(0.03),Inches(2.8),th.accent)
             seq.wipe_in(cb,dur=350,delay=d)
             num=txt(slide,f"0{i+1}",cx+Inches(0.14),cy,Inches(0.8),Inches(0.5),
-                    th["font_head"],18,rgb(th["accent"]),bold=True)
+                    th.font_head,18,th.accent,bold=True)
             seq.fade(num,dur=250,delay=d+80)
             ptxt=txt(slide,pt,cx+Inches(0.14),cy+Inches(0.44),Inches(6.0),Inches(2.3),
-                     th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                     th.font_body,13,th.body_color,wrap=True)
             seq.fade(ptxt,dur=350,delay=d+150)
         return self._fin(slide,seq,data)
 
     def numbered(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        vl=rect(slide,Inches(1.0),Inches(0.48),Inches(0.025),Inches(6.7),rgb(th["muted_color"]))
+        vl=rect(slide,Inches(1.0),Inches(0.48),Inches(0.025),Inches(6.7),th.muted_color)
         seq.wipe_in(vl,dur=600)
         t=txt(slide,data["title"],Inches(1.3),Inches(0.38),Inches(11.5),Inches(1.2),
-              th["font_head"],38,rgb(th["title_color"]),bold=True)
+              th.font_head,38,th.title_color,bold=True)
         seq.fade(t,dur=500,delay=150)
-        ac=rect(slide,Inches(1.3),Inches(1.48),Inches(2.5),Inches(0.04),rgb(th["accent"]))
+        ac=rect(slide,Inches(1.3),Inches(1.48),Inches(2.5),Inches(0.04),th.accent)
         seq.wipe_in(ac,dur=400,delay=280)
         for i,pt in enumerate(data.get("points",[])[:4]):
             y=Inches(1.78+i*1.35); d=340+i*150
             num=txt(slide,f"0{i+1}",Inches(1.3),y,Inches(0.7),Inches(0.7),
-                    th["font_head"],22,rgb(th["accent"]),bold=True)
+                    th.font_head,22,th.accent,bold=True)
             seq.fade(num,dur=300,delay=d)
-            hl=rect(slide,Inches(2.1),y+Inches(0.32),Inches(0.5),Inches(0.02),rgb(th["muted_color"]))
+            hl=rect(slide,Inches(2.1),y+Inches(0.32),Inches(0.5),Inches(0.02),th.muted_color)
             seq.wipe_in(hl,dur=300,delay=d+80)
             ptxt=txt(slide,pt,Inches(2.78),y,Inches(10.1),Inches(1.2),
-                     th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                     th.font_body,13,th.body_color,wrap=True)
             seq.fade(ptxt,dur=400,delay=d+120)
         return self._fin(slide,seq,data)
 
@@ -320,94 +442,94 @@ class Artistic(_Base):
     trans="zoom"
     def hero(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        b1=oval(slide,Inches(-1),Inches(-1),Inches(6),Inches(6),rgb(th["header_bg"]))
+        b1=oval(slide,Inches(-1),Inches(-1),Inches(6),Inches(6),th.header_bg)
         seq.zoom_in(b1,dur=700)
-        b2=oval(slide,Inches(9),Inches(3.5),Inches(5),Inches(5),rgb(th["accent2"]))
+        b2=oval(slide,Inches(9),Inches(3.5),Inches(5),Inches(5),th.accent2)
         seq.zoom_in(b2,dur=700,delay=100)
-        b3=rect(slide,Inches(5),Inches(-0.5),Inches(8.33),Inches(0.5),rgb(th["accent"]))
+        b3=rect(slide,Inches(5),Inches(-0.5),Inches(8.33),Inches(0.5),th.accent)
         seq.wipe_in(b3,dur=500,delay=200)
-        t3=tri(slide,Inches(11),Inches(5),Inches(2),Inches(2.5),rgb(th["accent"]))
+        t3=tri(slide,Inches(11),Inches(5),Inches(2),Inches(2.5),th.accent)
         seq.zoom_in(t3,dur=400,delay=300); seq.spin_emphasis(t3,degrees=45)
         n=txt(slide,f"{idx:02d}",Inches(0.5),Inches(0.28),Inches(1.5),Inches(0.7),
-              th["font_head"],14,rgb(th["accent"]),bold=True)
+              th.font_head,14,th.accent,bold=True)
         seq.appear(n,delay=350)
         t=txt(slide,data["title"],Inches(0.6),Inches(1.4),Inches(9.5),Inches(3.0),
-              th["font_head"],58,rgb(th["title_color"]),bold=True)
+              th.font_head,58,th.title_color,bold=True)
         seq.fly_in(t,dur=600,delay=280,from_dir="left")
         s=txt(slide,data.get("subtitle",""),Inches(0.6),Inches(4.35),Inches(9),Inches(0.8),
-              th["font_body"],18,rgb(th["accent"]),italic=True)
+              th.font_body,18,th.accent,italic=True)
         seq.fade(s,dur=400,delay=550)
         d=txt(slide,data.get("detail",""),Inches(0.6),Inches(5.25),Inches(10),Inches(1.8),
-              th["font_body"],13,rgb(th["body_color"]),wrap=True)
+              th.font_body,13,th.body_color,wrap=True)
         seq.fade(d,dur=400,delay=720)
         return self._fin(slide,seq,data)
 
     def content(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        rp=rect(slide,Inches(7.8),Inches(0),Inches(5.53),H,rgb(th["header_bg"]))
+        rp=rect(slide,Inches(7.8),Inches(0),Inches(5.53),H,th.header_bg)
         seq.fade(rp,dur=500)
-        dt=tri(slide,Inches(7.3),Inches(0),Inches(1.5),H,rgb(th["accent2"]))
+        dt=tri(slide,Inches(7.3),Inches(0),Inches(1.5),H,th.accent2)
         seq.zoom_in(dt,dur=500,delay=100)
-        ac=oval(slide,Inches(9.5),Inches(5.2),Inches(3.5),Inches(3.5),rgb(th["accent"]))
+        ac=oval(slide,Inches(9.5),Inches(5.2),Inches(3.5),Inches(3.5),th.accent)
         seq.zoom_in(ac,dur=400,delay=200)
         n=txt(slide,f"{idx:02d}",Inches(0.3),Inches(0.2),Inches(1),Inches(0.6),
-              th["font_head"],13,rgb(th["accent"]),bold=True)
+              th.font_head,13,th.accent,bold=True)
         seq.appear(n,delay=250)
         t=txt(slide,data["title"],Inches(0.3),Inches(0.65),Inches(7.2),Inches(1.4),
-              th["font_head"],34,rgb(th["title_color"]),bold=True)
+              th.font_head,34,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=300,from_dir="left")
         s=txt(slide,data.get("subtitle",""),Inches(0.3),Inches(1.98),Inches(7.0),Inches(0.5),
-              th["font_body"],14,rgb(th["accent"]),italic=True)
+              th.font_body,14,th.accent,italic=True)
         seq.fade(s,dur=350,delay=450)
         bl=bullets(slide,data.get("points",[]),Inches(0.3),Inches(2.65),Inches(6.8),Inches(4.5),th,bullet="● ")
         seq.sweep_from_left(bl,delay=550,dur=600)
         d=txt(slide,data.get("detail",""),Inches(8.3),Inches(1.5),Inches(4.7),Inches(5.6),
-              th["font_body"],13,rgb(th["title_color"]),wrap=True)
+              th.font_body,13,th.title_color,wrap=True)
         seq.fade(d,dur=400,delay=480)
         return self._fin(slide,seq,data)
 
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        dc=oval(slide,Inches(10.5),Inches(-1),Inches(4),Inches(4),rgb(th["header_bg"]))
+        dc=oval(slide,Inches(10.5),Inches(-1),Inches(4),Inches(4),th.header_bg)
         seq.zoom_in(dc,dur=600)
         t=txt(slide,data["title"],Inches(0.5),Inches(0.28),Inches(9.5),Inches(1.2),
-              th["font_head"],38,rgb(th["title_color"]),bold=True)
+              th.font_head,38,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=200,from_dir="left")
         pts=data.get("points",[""])
         for i,pt in enumerate(pts[:4]):
             row=i//2; col=i%2
             cx=Inches(0.5)+col*Inches(6.5); cy=Inches(1.78)+row*Inches(2.8)
             d=400+i*140
-            dm=tri(slide,cx,cy,Inches(0.78),Inches(0.78),rgb(th["accent"]))
+            dm=tri(slide,cx,cy,Inches(0.78),Inches(0.78),th.accent)
             seq.zoom_in(dm,dur=350,delay=d); seq.spin_emphasis(dm,degrees=45)
-            c=rect(slide,cx+Inches(0.48),cy,Inches(5.72),Inches(2.55),rgb(th["card_bg"]))
+            c=rect(slide,cx+Inches(0.48),cy,Inches(5.72),Inches(2.55),th.card_bg)
             seq.fade(c,dur=350,delay=d+50)
             num=txt(slide,f"0{i+1}",cx+Inches(0.58),cy+Inches(0.08),Inches(0.6),Inches(0.45),
-                    th["font_head"],16,rgb(th["accent"]),bold=True)
+                    th.font_head,16,th.accent,bold=True)
             seq.appear(num,delay=d+80)
             ptxt=txt(slide,pt,cx+Inches(0.58),cy+Inches(0.5),Inches(5.3),Inches(2.0),
-                     th["font_body"],12,rgb(th["body_color"]),wrap=True)
+                     th.font_body,12,th.body_color,wrap=True)
             seq.fade(ptxt,dur=350,delay=d+150)
         return self._fin(slide,seq,data)
 
     def numbered(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        diag=rect(slide,Inches(0),Inches(5.5),W,Inches(2.5),rgb(th["header_bg"]))
+        diag=rect(slide,Inches(0),Inches(5.5),W,Inches(2.5),th.header_bg)
         seq.fade(diag,dur=500)
-        bc=oval(slide,Inches(-1),Inches(-1.5),Inches(5),Inches(5),rgb(th["accent2"]))
+        bc=oval(slide,Inches(-1),Inches(-1.5),Inches(5),Inches(5),th.accent2)
         seq.zoom_in(bc,dur=600)
         t=txt(slide,data["title"],Inches(0.5),Inches(0.48),Inches(12),Inches(1.2),
-              th["font_head"],36,rgb(th["title_color"]),bold=True)
+              th.font_head,36,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=250,from_dir="left")
         for i,pt in enumerate(data.get("points",[])[:4]):
             y=Inches(1.88+i*1.2); d=370+i*150
-            c=oval(slide,Inches(0.4),y,Inches(0.6),Inches(0.6),rgb(th["accent"]))
+            c=oval(slide,Inches(0.4),y,Inches(0.6),Inches(0.6),th.accent)
             seq.zoom_in(c,dur=300,delay=d); seq.pulse(c)
             nt=txt(slide,str(i+1),Inches(0.4),y,Inches(0.6),Inches(0.6),
-                   th["font_head"],14,rgb(th["bg"]),bold=True,align=PP_ALIGN.CENTER)
+                   th.font_head,14,th.bg,bold=True,align=PP_ALIGN.CENTER)
             seq.appear(nt,delay=d+40)
             ptxt=txt(slide,pt,Inches(1.2),y,Inches(11.5),Inches(1.1),
-                     th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                     th.font_body,13,th.body_color,wrap=True)
             seq.sweep_from_left(ptxt,delay=d+80,dur=600)
         return self._fin(slide,seq,data)
 
@@ -420,86 +542,86 @@ class Artistic(_Base):
 class MistyPeaks(_Base):
     trans="dissolve"
     def _mountains(self,slide,seq,th):
-        m1=tri(slide,Inches(-0.5),Inches(1.5),Inches(5),Inches(6.5),rgb(th["header_bg"]))
+        m1=tri(slide,Inches(-0.5),Inches(1.5),Inches(5),Inches(6.5),th.header_bg)
         seq.fade(m1,dur=800)
-        m2=tri(slide,Inches(3),Inches(2.5),Inches(5.5),Inches(5.5),rgb(th["header_bg"]))
+        m2=tri(slide,Inches(3),Inches(2.5),Inches(5.5),Inches(5.5),th.header_bg)
         seq.fade(m2,dur=800,delay=80)
-        m3=tri(slide,Inches(6),Inches(3.0),Inches(5),Inches(5.0),rgb(th["card_bg"]))
+        m3=tri(slide,Inches(6),Inches(3.0),Inches(5),Inches(5.0),th.card_bg)
         seq.fade(m3,dur=700,delay=200)
-        m4=tri(slide,Inches(9),Inches(2.0),Inches(5.5),Inches(6.0),rgb(th["card_bg"]))
+        m4=tri(slide,Inches(9),Inches(2.0),Inches(5.5),Inches(6.0),th.card_bg)
         seq.fade(m4,dur=700,delay=280)
-        base=rect(slide,Inches(0),Inches(5.5),W,Inches(2.0),rgb(th["accent2"]))
+        base=rect(slide,Inches(0),Inches(5.5),W,Inches(2.0),th.accent2)
         seq.fade(base,dur=600,delay=350)
 
     def hero(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         self._mountains(slide,seq,th)
-        mist=rect(slide,Inches(0),Inches(3.8),W,Inches(1.5),rgb(th["bg"]))
+        mist=rect(slide,Inches(0),Inches(3.8),W,Inches(1.5),th.bg)
         seq.fade(mist,dur=600,delay=450)
         n=txt(slide,f"{idx:02d}",Inches(0.5),Inches(0.28),Inches(1.2),Inches(0.5),
-              th["font_body"],11,rgb(th["muted_color"]))
+              th.font_body,11,th.muted_color)
         seq.appear(n,delay=500)
         t=txt(slide,data["title"],Inches(0.5),Inches(0.48),Inches(12),Inches(2.5),
-              th["font_head"],54,rgb(th["title_color"]),bold=True)
+              th.font_head,54,th.title_color,bold=True)
         seq.float_up(t,dur=700,delay=500)
         s=txt(slide,data.get("subtitle",""),Inches(0.5),Inches(2.98),Inches(11),Inches(0.8),
-              th["font_body"],18,rgb(th["accent"]),italic=True)
+              th.font_body,18,th.accent,italic=True)
         seq.fade(s,dur=500,delay=750)
         d=txt(slide,data.get("detail",""),Inches(0.5),Inches(3.88),Inches(11),Inches(1.5),
-              th["font_body"],13,rgb(th["muted_color"]),wrap=True)
+              th.font_body,13,th.muted_color,wrap=True)
         seq.fade(d,dur=500,delay=950)
         return self._fin(slide,seq,data)
 
     def content(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        m1=tri(slide,Inches(7.5),Inches(1.5),Inches(4.5),Inches(6.0),rgb(th["header_bg"]))
+        m1=tri(slide,Inches(7.5),Inches(1.5),Inches(4.5),Inches(6.0),th.header_bg)
         seq.fade(m1,dur=700)
-        m2=tri(slide,Inches(10),Inches(2.5),Inches(4.0),Inches(5.0),rgb(th["card_bg"]))
+        m2=tri(slide,Inches(10),Inches(2.5),Inches(4.0),Inches(5.0),th.card_bg)
         seq.fade(m2,dur=700,delay=100)
-        base=rect(slide,Inches(0),Inches(6.2),W,Inches(1.3),rgb(th["accent2"]))
+        base=rect(slide,Inches(0),Inches(6.2),W,Inches(1.3),th.accent2)
         seq.fade(base,dur=600,delay=200)
         n=txt(slide,f"{idx:02d}",Inches(0.4),Inches(0.28),Inches(1),Inches(0.45),
-              th["font_body"],10,rgb(th["muted_color"]))
+              th.font_body,10,th.muted_color)
         seq.appear(n,delay=300)
         t=txt(slide,data["title"],Inches(0.4),Inches(0.58),Inches(7.5),Inches(1.4),
-              th["font_head"],34,rgb(th["title_color"]),bold=True)
+              th.font_head,34,th.title_color,bold=True)
         seq.float_up(t,dur=600,delay=350)
         s=txt(slide,data.get("subtitle",""),Inches(0.4),Inches(1.92),Inches(7.5),Inches(0.5),
-              th["font_body"],13,rgb(th["accent"]),italic=True)
+              th.font_body,13,th.accent,italic=True)
         seq.fade(s,dur=400,delay=520)
-        hl=rect(slide,Inches(0.4),Inches(2.52),Inches(4.0),Inches(0.025),rgb(th["accent"]))
+        hl=rect(slide,Inches(0.4),Inches(2.52),Inches(4.0),Inches(0.025),th.accent)
         seq.wipe_in(hl,dur=400,delay=550)
         bl=bullets(slide,data.get("points",[]),Inches(0.4),Inches(2.72),Inches(6.8),Inches(3.5),th,bullet="· ")
         seq.fade(bl,dur=500,delay=650)
         d=txt(slide,data.get("detail",""),Inches(0.4),Inches(5.88),Inches(7.0),Inches(1.2),
-              th["font_body"],12,rgb(th["muted_color"]),wrap=True)
+              th.font_body,12,th.muted_color,wrap=True)
         seq.fade(d,dur=400,delay=850)
         return self._fin(slide,seq,data)
 
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        base=rect(slide,Inches(0),Inches(6.48),W,Inches(1.02),rgb(th["accent2"]))
+        base=rect(slide,Inches(0),Inches(6.48),W,Inches(1.02),th.accent2)
         seq.fade(base,dur=500)
-        m1=tri(slide,Inches(11),Inches(2),Inches(3),Inches(5.5),rgb(th["header_bg"]))
+        m1=tri(slide,Inches(11),Inches(2),Inches(3),Inches(5.5),th.header_bg)
         seq.fade(m1,dur=600,delay=50)
         t=txt(slide,data["title"],Inches(0.4),Inches(0.22),Inches(10),Inches(0.9),
-              th["font_head"],32,rgb(th["title_color"]),bold=True)
+              th.font_head,32,th.title_color,bold=True)
         seq.float_up(t,dur=600,delay=200)
-        hl=rect(slide,Inches(0.4),Inches(1.12),Inches(3.5),Inches(0.03),rgb(th["accent"]))
+        hl=rect(slide,Inches(0.4),Inches(1.12),Inches(3.5),Inches(0.03),th.accent)
         seq.wipe_in(hl,dur=400,delay=380)
         pts=data.get("points",[""])
         pos=[(Inches(0.4),Inches(1.38)),(Inches(6.7),Inches(1.38)),(Inches(0.4),Inches(3.98)),(Inches(6.7),Inches(3.98))]
         for i,(pt,(cx,cy)) in enumerate(zip(pts[:4],pos)):
             d=440+i*130
-            c=rect(slide,cx,cy,Inches(6.0),Inches(2.45),rgb(th["card_bg"]))
+            c=rect(slide,cx,cy,Inches(6.0),Inches(2.45),th.card_bg)
             seq.fade(c,dur=400,delay=d)
-            tb=rect(slide,cx,cy,Inches(6.0),Inches(0.05),rgb(th["accent"]))
+            tb=rect(slide,cx,cy,Inches(6.0),Inches(0.05),th.accent)
             seq.wipe_in(tb,dur=350,delay=d+60)
             num=txt(slide,f"0{i+1}",cx+Inches(0.14),cy+Inches(0.1),Inches(0.7),Inches(0.5),
-                    th["font_head"],18,rgb(th["accent"]),bold=True)
+                    th.font_head,18,th.accent,bold=True)
             seq.appear(num,delay=d+80)
             ptxt=txt(slide,pt,cx+Inches(0.14),cy+Inches(0.52),Inches(5.65),Inches(1.82),
-                     th["font_body"],12,rgb(th["body_color"]),wrap=True)
+                     th.font_body,12,th.body_color,wrap=True)
             seq.float_up(ptxt,dur=400,delay=d+150)
         return self._fin(slide,seq,data)
 
@@ -514,71 +636,71 @@ class Monochrome(_Base):
     trans="wipe"
     def hero(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        half=rect(slide,Inches(0),Inches(0),Inches(6.5),H,rgb(th["header_bg"]))
+        half=rect(slide,Inches(0),Inches(0),Inches(6.5),H,th.header_bg)
         seq.wipe_in(half,dur=600)
         big_n=txt(slide,f"{idx:02d}",Inches(0.3),Inches(0.2),Inches(2.5),Inches(1.2),
-                  th["font_head"],72,rgb(th["accent"]),bold=True)
+                  th.font_head,72,th.accent,bold=True)
         seq.wipe_in(big_n,dur=400,delay=200)
         t=txt(slide,data["title"],Inches(0.3),Inches(1.28),Inches(6.0),Inches(3.5),
-              th["font_head"],52,rgb(th["title_color"]),bold=True)
+              th.font_head,52,th.title_color,bold=True)
         seq.wipe_in(t,dur=500,delay=300)
         s=txt(slide,data.get("subtitle",""),Inches(0.3),Inches(4.78),Inches(6.0),Inches(0.75),
-              th["font_body"],15,rgb(th["accent"]),italic=True)
+              th.font_body,15,th.accent,italic=True)
         seq.wipe_in(s,dur=400,delay=500)
-        vd=rect(slide,Inches(6.5),Inches(0),Inches(0.06),H,rgb(th["accent"]))
+        vd=rect(slide,Inches(6.5),Inches(0),Inches(0.06),H,th.accent)
         seq.wipe_in(vd,dur=400,delay=350)
         d=txt(slide,data.get("detail",""),Inches(6.8),Inches(1.5),Inches(6.2),Inches(5.5),
-              th["font_body"],16,rgb(th["body_color"]),wrap=True)
+              th.font_body,16,th.body_color,wrap=True)
         seq.fade(d,dur=600,delay=600)
         return self._fin(slide,seq,data)
 
     def content(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        tb=rect(slide,Inches(0),Inches(0),W,Inches(1.5),rgb(th["header_bg"]))
+        tb=rect(slide,Inches(0),Inches(0),W,Inches(1.5),th.header_bg)
         seq.wipe_in(tb,dur=600)
         n=txt(slide,f"{idx:02d}",Inches(0.3),Inches(0.08),Inches(1.2),Inches(0.7),
-              th["font_head"],28,rgb(th["accent"]),bold=True)
+              th.font_head,28,th.accent,bold=True)
         seq.wipe_in(n,dur=300,delay=150)
         t=txt(slide,data["title"],Inches(1.5),Inches(0.08),Inches(11.3),Inches(1.2),
-              th["font_head"],34,rgb(th["title_color"]),bold=True)
+              th.font_head,34,th.title_color,bold=True)
         seq.wipe_in(t,dur=500,delay=250)
         for i,pt in enumerate(data.get("points",[])[:4]):
             y=Inches(1.68+i*1.3); d=390+i*150
-            nb=rect(slide,Inches(0.3),y,Inches(0.8),Inches(0.9),rgb(th["accent"]))
+            nb=rect(slide,Inches(0.3),y,Inches(0.8),Inches(0.9),th.accent)
             seq.wipe_in(nb,dur=300,delay=d)
             num=txt(slide,f"{i+1}",Inches(0.3),y,Inches(0.8),Inches(0.9),
-                    th["font_head"],22,rgb(th["bg"]),bold=True,align=PP_ALIGN.CENTER)
+                    th.font_head,22,th.bg,bold=True,align=PP_ALIGN.CENTER)
             seq.appear(num,delay=d+30)
             ptxt=txt(slide,pt,Inches(1.28),y+Inches(0.05),Inches(7.0),Inches(1.15),
-                     th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                     th.font_body,13,th.body_color,wrap=True)
             seq.wipe_in(ptxt,dur=400,delay=d+80)
-        vd2=rect(slide,Inches(8.5),Inches(1.5),Inches(0.06),Inches(5.7),rgb(th["accent"]))
+        vd2=rect(slide,Inches(8.5),Inches(1.5),Inches(0.06),Inches(5.7),th.accent)
         seq.wipe_in(vd2,dur=450,delay=350)
         d_txt=txt(slide,data.get("detail",""),Inches(8.7),Inches(1.58),Inches(4.3),Inches(5.6),
-                  th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                  th.font_body,13,th.body_color,wrap=True)
         seq.fade(d_txt,dur=500,delay=600)
         return self._fin(slide,seq,data)
 
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        b1=rect(slide,Inches(0),Inches(0),Inches(6.5),Inches(3.58),rgb(th["header_bg"]))
+        b1=rect(slide,Inches(0),Inches(0),Inches(6.5),Inches(3.58),th.header_bg)
         seq.wipe_in(b1,dur=500)
-        b2=rect(slide,Inches(6.5),Inches(3.58),Inches(6.83),Inches(3.92),rgb(th["header_bg"]))
+        b2=rect(slide,Inches(6.5),Inches(3.58),Inches(6.83),Inches(3.92),th.header_bg)
         seq.wipe_in(b2,dur=500,delay=100)
         t=txt(slide,data["title"],Inches(0.3),Inches(0.08),Inches(11),Inches(0.9),
-              th["font_head"],34,rgb(th["title_color"]),bold=True)
+              th.font_head,34,th.title_color,bold=True)
         seq.wipe_in(t,dur=500,delay=200)
         pts=data.get("points",[""])
-        quadrant_tc=[rgb(th["title_color"]),rgb(th["body_color"]),rgb(th["body_color"]),rgb(th["title_color"])]
+        quadrant_tc=[th.title_color,th.body_color,th.body_color,th.title_color]
         for i,pt in enumerate(pts[:4]):
             cx=Inches(0.3) if i%2==0 else Inches(6.8)
             cy=Inches(1.0) if i<2 else Inches(4.48)
             d=370+i*120
             num=txt(slide,f"0{i+1}",cx,cy-Inches(0.38),Inches(1.5),Inches(0.5),
-                    th["font_head"],18,rgb(th["accent"]),bold=True)
+                    th.font_head,18,th.accent,bold=True)
             seq.wipe_in(num,dur=300,delay=d)
             ptxt=txt(slide,pt,cx,cy,Inches(6.0),Inches(2.3),
-                     th["font_body"],13,quadrant_tc[i],wrap=True)
+                     th.font_body,13,quadrant_tc[i],wrap=True)
             seq.wipe_in(ptxt,dur=400,delay=d+100)
         return self._fin(slide,seq,data)
 
@@ -594,98 +716,98 @@ class Hardware(_Base):
     def _grid(self,slide,seq):
         th=self.th
         for i in range(5):
-            l=rect(slide,Inches(1+i*2.3),Inches(0),Inches(0.02),H,rgb(th["muted_color"]))
+            l=rect(slide,Inches(1+i*2.3),Inches(0),Inches(0.02),H,th.muted_color)
             seq.appear(l,delay=50+i*25)
         for j in range(3):
-            l=rect(slide,Inches(0),Inches(1.2+j*2.1),W,Inches(0.02),rgb(th["muted_color"]))
+            l=rect(slide,Inches(0),Inches(1.2+j*2.1),W,Inches(0.02),th.muted_color)
             seq.appear(l,delay=75+j*25)
         for (lx,ly) in [(Inches(0.15),Inches(0.15)),(W-Inches(0.65),Inches(0.15)),
                         (Inches(0.15),H-Inches(0.5)),(W-Inches(0.65),H-Inches(0.5))]:
-            b=rect(slide,lx,ly,Inches(0.48),Inches(0.04),rgb(th["accent"]))
+            b=rect(slide,lx,ly,Inches(0.48),Inches(0.04),th.accent)
             seq.appear(b,delay=40)
-            b2=rect(slide,lx,ly,Inches(0.04),Inches(0.4),rgb(th["accent"]))
+            b2=rect(slide,lx,ly,Inches(0.04),Inches(0.4),th.accent)
             seq.appear(b2,delay=40)
 
     def hero(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         self._grid(slide,seq)
-        cpu=rect(slide,Inches(0.38),Inches(1.5),Inches(0.15),Inches(4.5),rgb(th["accent"]))
+        cpu=rect(slide,Inches(0.38),Inches(1.5),Inches(0.15),Inches(4.5),th.accent)
         seq.appear(cpu,delay=100)
         for y_off in [0,2.2,4.4]:
-            t_=rect(slide,Inches(0.53),Inches(1.5+y_off),Inches(0.6),Inches(0.1),rgb(th["accent"]))
+            t_=rect(slide,Inches(0.53),Inches(1.5+y_off),Inches(0.6),Inches(0.1),th.accent)
             seq.appear(t_,delay=120)
-        st=rect(slide,Inches(1.2),Inches(0.7),Inches(9),Inches(0.04),rgb(th["accent"]))
+        st=rect(slide,Inches(1.2),Inches(0.7),Inches(9),Inches(0.04),th.accent)
         seq.wipe_in(st,dur=600,delay=200)
         n=txt(slide,f"/{idx:02d}",Inches(1.2),Inches(0.12),Inches(2),Inches(0.6),
-              th["font_body"],12,rgb(th["accent"]),bold=True)
+              th.font_body,12,th.accent,bold=True)
         seq.appear(n,delay=200)
         t=txt(slide,data["title"],Inches(1.2),Inches(0.98),Inches(11.8),Inches(2.8),
-              th["font_head"],52,rgb(th["title_color"]),bold=True)
+              th.font_head,52,th.title_color,bold=True)
         seq.appear(t,delay=350)
         s=txt(slide,data.get("subtitle",""),Inches(1.2),Inches(3.78),Inches(10),Inches(0.7),
-              th["font_body"],16,rgb(th["accent"]))
+              th.font_body,16,th.accent)
         seq.appear(s,delay=480)
         d=txt(slide,data.get("detail",""),Inches(1.2),Inches(4.68),Inches(11.8),Inches(2.3),
-              th["font_body"],13,rgb(th["body_color"]),wrap=True)
+              th.font_body,13,th.body_color,wrap=True)
         seq.appear(d,delay=620)
         return self._fin(slide,seq,data)
 
     def content(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         self._grid(slide,seq)
-        hdr=rect(slide,Inches(0),Inches(0),W,Inches(1.4),rgb(th["header_bg"]))
+        hdr=rect(slide,Inches(0),Inches(0),W,Inches(1.4),th.header_bg)
         seq.appear(hdr,delay=50)
         n=txt(slide,f"[{idx:02d}]",Inches(0.3),Inches(0.1),Inches(1.5),Inches(0.7),
-              th["font_body"],16,rgb(th["accent"]),bold=True)
+              th.font_body,16,th.accent,bold=True)
         seq.appear(n,delay=100)
         t=txt(slide,data["title"],Inches(1.8),Inches(0.1),Inches(10),Inches(1.1),
-              th["font_head"],30,rgb(th["title_color"]),bold=True)
+              th.font_head,30,th.title_color,bold=True)
         seq.appear(t,delay=150)
-        lb=rect(slide,Inches(0),Inches(1.4),Inches(5.5),Inches(6.1),rgb(th["card_bg"]))
+        lb=rect(slide,Inches(0),Inches(1.4),Inches(5.5),Inches(6.1),th.card_bg)
         seq.appear(lb,delay=200)
         lbl=txt(slide,"// SPECS",Inches(0.2),Inches(1.48),Inches(5),Inches(0.45),
-                th["font_body"],10,rgb(th["accent"]),bold=True)
+                th.font_body,10,th.accent,bold=True)
         seq.appear(lbl,delay=250)
-        sp=rect(slide,Inches(0.2),Inches(1.93),Inches(5.0),Inches(0.04),rgb(th["accent"]))
+        sp=rect(slide,Inches(0.2),Inches(1.93),Inches(5.0),Inches(0.04),th.accent)
         seq.wipe_in(sp,dur=400,delay=280)
         bl=bullets(slide,data.get("points",[]),Inches(0.2),Inches(2.08),Inches(5.0),Inches(5.0),th,bullet="> ",fn="Courier New")
         seq.appear(bl,delay=350)
         lbl2=txt(slide,"// ANALYSIS",Inches(5.7),Inches(1.48),Inches(7.3),Inches(0.45),
-                 th["font_body"],10,rgb(th["accent"]),bold=True)
+                 th.font_body,10,th.accent,bold=True)
         seq.appear(lbl2,delay=280)
-        sp2=rect(slide,Inches(5.7),Inches(1.93),Inches(7.3),Inches(0.04),rgb(th["accent"]))
+        sp2=rect(slide,Inches(5.7),Inches(1.93),Inches(7.3),Inches(0.04),th.accent)
         seq.wipe_in(sp2,dur=400,delay=300)
         d=txt(slide,data.get("detail",""),Inches(5.7),Inches(2.08),Inches(7.3),Inches(5.0),
-              th["font_body"],13,rgb(th["body_color"]),wrap=True)
+              th.font_body,13,th.body_color,wrap=True)
         seq.appear(d,delay=400)
         return self._fin(slide,seq,data)
 
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         self._grid(slide,seq)
-        hdr=rect(slide,Inches(0),Inches(0),W,Inches(1.5),rgb(th["header_bg"]))
+        hdr=rect(slide,Inches(0),Inches(0),W,Inches(1.5),th.header_bg)
         seq.appear(hdr,delay=50)
         n=txt(slide,f"[{idx:02d}]",Inches(0.3),Inches(0.1),Inches(1.5),Inches(0.7),
-              th["font_body"],16,rgb(th["accent"]),bold=True)
+              th.font_body,16,th.accent,bold=True)
         seq.appear(n,delay=100)
         t=txt(slide,data["title"],Inches(1.8),Inches(0.12),Inches(10.5),Inches(1.05),
-              th["font_head"],30,rgb(th["title_color"]),bold=True)
+              th.font_head,30,th.title_color,bold=True)
         seq.appear(t,delay=150)
         pts=data.get("points",[""])
         pos=[(Inches(0.3),Inches(1.68)),(Inches(6.7),Inches(1.68)),(Inches(0.3),Inches(4.58)),(Inches(6.7),Inches(4.58))]
         for i,(pt,(cx,cy)) in enumerate(zip(pts[:4],pos)):
             d=290+i*120
-            box=rect(slide,cx,cy,Inches(6.2),Inches(2.65),rgb(th["card_bg"]))
+            box=rect(slide,cx,cy,Inches(6.2),Inches(2.65),th.card_bg)
             seq.appear(box,delay=d)
-            tb=rect(slide,cx,cy,Inches(6.2),Inches(0.05),rgb(th["accent"]))
+            tb=rect(slide,cx,cy,Inches(6.2),Inches(0.05),th.accent)
             seq.wipe_in(tb,dur=350,delay=d+50)
             lbl=txt(slide,f"MODULE_{i+1:02d}",cx+Inches(0.14),cy+Inches(0.08),Inches(3),Inches(0.4),
-                    th["font_body"],9,rgb(th["accent"]),bold=True)
+                    th.font_body,9,th.accent,bold=True)
             seq.appear(lbl,delay=d+80)
-            ptxt=txt(slide,pt,cx+Inches(0.14),cy+Inches(0.48),"Courier New" if False else th["font_body"],
-                     0 if False else 11,rgb(th["body_color"]),wrap=True) if False else \
+            ptxt=txt(slide,pt,cx+Inches(0.14),cy+Inches(0.48),"Courier New" if False else th.font_body,
+                     0 if False else 11,th.body_color,wrap=True) if False else \
                  txt(slide,pt,cx+Inches(0.14),cy+Inches(0.48),Inches(5.85),Inches(2.0),
-                     "Courier New",11,rgb(th["body_color"]),wrap=True)
+                     "Courier New",11,th.body_color,wrap=True)
             seq.appear(ptxt,delay=d+120)
         return self._fin(slide,seq,data)
 
@@ -700,80 +822,80 @@ class Magazine(_Base):
     trans="cover"
     def hero(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        rp=rect(slide,Inches(7.5),Inches(0),Inches(5.83),H,rgb(th["header_bg"]))
+        rp=rect(slide,Inches(7.5),Inches(0),Inches(5.83),H,th.header_bg)
         seq.fade(rp,dur=600)
         bn=txt(slide,f"{idx:02d}",Inches(7.6),Inches(-0.5),Inches(5.5),Inches(5),
-               th["font_head"],200,rgb(th["bg"]),bold=True)
+               th.font_head,200,th.bg,bold=True)
         seq.fade(bn,dur=500,delay=100)
         tag=txt(slide,"ISSUE // "+str(idx).zfill(2),Inches(0.4),Inches(0.32),Inches(7),Inches(0.5),
-                th["font_body"],11,rgb(th["accent"]),bold=True)
+                th.font_body,11,th.accent,bold=True)
         seq.appear(tag,delay=150)
         t=txt(slide,data["title"],Inches(0.4),Inches(0.98),Inches(6.8),Inches(3.8),
-              th["font_head"],60,rgb(th["title_color"]),bold=True)
+              th.font_head,60,th.title_color,bold=True)
         seq.fly_in(t,dur=600,delay=200,from_dir="bottom")
-        rule=rect(slide,Inches(0.4),Inches(4.82),Inches(3.5),Inches(0.08),rgb(th["accent"]))
+        rule=rect(slide,Inches(0.4),Inches(4.82),Inches(3.5),Inches(0.08),th.accent)
         seq.wipe_in(rule,dur=400,delay=480)
         s=txt(slide,data.get("subtitle",""),Inches(0.4),Inches(4.98),Inches(6.8),Inches(0.7),
-              th["font_body"],16,rgb(th["muted_color"]),italic=True)
+              th.font_body,16,th.muted_color,italic=True)
         seq.fade(s,dur=400,delay=620)
         d=txt(slide,data.get("detail",""),Inches(7.7),Inches(5.48),Inches(5.3),Inches(1.8),
-              th["font_body"],13,rgb(th["body_color"]),wrap=True)
+              th.font_body,13,th.body_color,wrap=True)
         seq.fade(d,dur=400,delay=700)
         return self._fin(slide,seq,data)
 
     def content(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        bar=rect(slide,Inches(0),Inches(0),Inches(0.6),H,rgb(th["accent"]))
+        bar=rect(slide,Inches(0),Inches(0),Inches(0.6),H,th.accent)
         seq.wipe_in(bar,dur=400)
         t=txt(slide,data["title"],Inches(0.8),Inches(0.12),Inches(11),Inches(1.5),
-              th["font_head"],42,rgb(th["title_color"]),bold=True)
+              th.font_head,42,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=200,from_dir="left")
-        bot=rect(slide,Inches(0.6),Inches(1.62),W-Inches(0.6),Inches(0.07),rgb(th["accent"]))
+        bot=rect(slide,Inches(0.6),Inches(1.62),W-Inches(0.6),Inches(0.07),th.accent)
         seq.wipe_in(bot,dur=500,delay=380)
         s=txt(slide,data.get("subtitle",""),Inches(0.8),Inches(1.75),Inches(11),Inches(0.5),
-              th["font_body"],14,rgb(th["accent"]),italic=True)
+              th.font_body,14,th.accent,italic=True)
         seq.fade(s,delay=480)
         pts=data.get("points",[]); lp=pts[:2]; rp=pts[2:4]
         for i,pt in enumerate(lp):
             b=txt(slide,f"↳  {pt}",Inches(0.8),Inches(2.48+i*1.7),Inches(6.0),Inches(1.6),
-                  th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                  th.font_body,13,th.body_color,wrap=True)
             seq.sweep_from_left(b,delay=550+i*150,dur=600)
         for i,pt in enumerate(rp):
             b=txt(slide,f"↳  {pt}",Inches(7.0),Inches(2.48+i*1.7),Inches(6.0),Inches(1.6),
-                  th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                  th.font_body,13,th.body_color,wrap=True)
             seq.sweep_from_right(b,delay=550+i*150,dur=600)
-        ib=rect(slide,Inches(0.8),Inches(5.82),Inches(12.2),Inches(1.42),rgb(th["card_bg"]))
+        ib=rect(slide,Inches(0.8),Inches(5.82),Inches(12.2),Inches(1.42),th.card_bg)
         seq.zoom_in(ib,dur=400,delay=800); seq.grow_emphasis(ib,scale=102)
         d=txt(slide,data.get("detail",""),Inches(1.0),Inches(5.95),Inches(12.0),Inches(1.1),
-              th["font_body"],13,rgb(th["body_color"]),wrap=True)
+              th.font_body,13,th.body_color,wrap=True)
         seq.fade(d,delay=900)
         return self._fin(slide,seq,data)
 
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
         wm=txt(slide,str(idx),Inches(8.5),Inches(-0.8),Inches(5.0),Inches(6.0),
-               th["font_head"],220,rgb(th["header_bg"]),bold=True)
+               th.font_head,220,th.header_bg,bold=True)
         seq.fade(wm,dur=600)
-        bar=rect(slide,Inches(0),Inches(0),Inches(0.6),H,rgb(th["accent"]))
+        bar=rect(slide,Inches(0),Inches(0),Inches(0.6),H,th.accent)
         seq.wipe_in(bar,dur=400)
         t=txt(slide,data["title"],Inches(0.8),Inches(0.18),Inches(11),Inches(1.0),
-              th["font_head"],36,rgb(th["title_color"]),bold=True)
+              th.font_head,36,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=200,from_dir="left")
-        bot=rect(slide,Inches(0.8),Inches(1.22),Inches(10),Inches(0.07),rgb(th["accent"]))
+        bot=rect(slide,Inches(0.8),Inches(1.22),Inches(10),Inches(0.07),th.accent)
         seq.wipe_in(bot,dur=500,delay=350)
         pts=data.get("points",[""])
         pos=[(Inches(0.8),Inches(1.48)),(Inches(6.9),Inches(1.48)),(Inches(0.8),Inches(4.18)),(Inches(6.9),Inches(4.18))]
         for i,(pt,(cx,cy)) in enumerate(zip(pts[:4],pos)):
             d=440+i*140
-            c=rect(slide,cx,cy,Inches(5.85),Inches(2.5),rgb(th["card_bg"]))
+            c=rect(slide,cx,cy,Inches(5.85),Inches(2.5),th.card_bg)
             seq.fade(c,dur=400,delay=d)
-            at=rect(slide,cx,cy,Inches(0.5),Inches(2.5),rgb(th["accent"]))
+            at=rect(slide,cx,cy,Inches(0.5),Inches(2.5),th.accent)
             seq.wipe_in(at,dur=350,delay=d+60)
             num=txt(slide,f"{i+1}",cx,cy+Inches(0.88),Inches(0.5),Inches(0.7),
-                    th["font_head"],20,rgb(th["bg"]),bold=True,align=PP_ALIGN.CENTER)
+                    th.font_head,20,th.bg,bold=True,align=PP_ALIGN.CENTER)
             seq.appear(num,delay=d+80)
             ptxt=txt(slide,pt,cx+Inches(0.64),cy+Inches(0.08),Inches(5.1),Inches(2.28),
-                     th["font_body"],13,rgb(th["body_color"]),wrap=True)
+                     th.font_body,13,th.body_color,wrap=True)
             seq.fly_in(ptxt,dur=400,delay=d+150,from_dir="bottom")
         return self._fin(slide,seq,data)
 
@@ -796,70 +918,70 @@ class NeonNights(_Base):
         for r_i,sz in enumerate([Inches(8),Inches(6),Inches(4)]):
             cx=(W-sz)/2; cy=(H-sz)/2
             c=slide.shapes.add_shape(9,cx,cy,sz,sz)
-            c.fill.background(); c.line.color.rgb=rgb(th["accent"]); c.line.width=Pt(0.5+r_i*0.3)
+            c.fill.background(); c.line.color.rgb=th.accent; c.line.width=Pt(0.5+r_i*0.3)
             seq.zoom_in(c,dur=500+r_i*100,delay=r_i*100)
             if r_i==1: seq.pulse(c)
-        bar=self._outline(slide,Inches(0.3),Inches(0.18),W-Inches(0.6),Inches(0.04),rgb(th["accent"]),seq,300)
+        bar=self._outline(slide,Inches(0.3),Inches(0.18),W-Inches(0.6),Inches(0.04),th.accent,seq,300)
         n=txt(slide,f"{idx:02d}",Inches(0.5),Inches(0.28),Inches(1.2),Inches(0.5),
-              th["font_body"],11,rgb(th["accent"]),bold=True)
+              th.font_body,11,th.accent,bold=True)
         seq.appear(n,delay=350)
         t=txt(slide,data["title"],Inches(0.5),Inches(1.38),Inches(12.3),Inches(3.0),
-              th["font_head"],56,rgb(th["title_color"]),bold=True)
+              th.font_head,56,th.title_color,bold=True)
         seq.fly_in(t,dur=600,delay=350)
         s=txt(slide,data.get("subtitle",""),Inches(0.5),Inches(4.28),Inches(11),Inches(0.7),
-              th["font_body"],18,rgb(th["accent"]),italic=True)
+              th.font_body,18,th.accent,italic=True)
         seq.fade(s,dur=400,delay=600)
         d=txt(slide,data.get("detail",""),Inches(0.5),Inches(5.18),Inches(11),Inches(2.0),
-              th["font_body"],14,rgb(th["body_color"]),wrap=True)
+              th.font_body,14,th.body_color,wrap=True)
         seq.fade(d,dur=400,delay=800)
         return self._fin(slide,seq,data)
 
     def content(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        bar=rect(slide,Inches(0),Inches(0),Inches(0.4),H,rgb(th["accent"]))
+        bar=rect(slide,Inches(0),Inches(0),Inches(0.4),H,th.accent)
         seq.wipe_in(bar,dur=400)
-        hbox=self._outline(slide,Inches(0.5),Inches(0.08),Inches(12.5),Inches(1.42),rgb(th["accent"]),seq,100)
+        hbox=self._outline(slide,Inches(0.5),Inches(0.08),Inches(12.5),Inches(1.42),th.accent,seq,100)
         n=txt(slide,f"{idx:02d}",Inches(0.65),Inches(0.18),Inches(1.2),Inches(0.5),
-              th["font_body"],11,rgb(th["accent"]),bold=True)
+              th.font_body,11,th.accent,bold=True)
         seq.appear(n,delay=200)
         t=txt(slide,data["title"],Inches(0.65),Inches(0.38),Inches(12),Inches(1.0),
-              th["font_head"],34,rgb(th["title_color"]),bold=True)
+              th.font_head,34,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=250)
         s=txt(slide,data.get("subtitle",""),Inches(0.65),Inches(1.53),Inches(7.5),Inches(0.5),
-              th["font_body"],13,rgb(th["accent"]),italic=True)
+              th.font_body,13,th.accent,italic=True)
         seq.fade(s,dur=350,delay=420)
         bl=bullets(slide,data.get("points",[]),Inches(0.65),Inches(2.18),Inches(6.5),Inches(4.8),th,bullet="⟩  ")
         seq.fly_in(bl,dur=500,delay=500)
-        rc=self._outline(slide,Inches(7.35),Inches(0.08),Inches(5.65),Inches(7.05),rgb(th["accent2"]),seq,300)
+        rc=self._outline(slide,Inches(7.35),Inches(0.08),Inches(5.65),Inches(7.05),th.accent2,seq,300)
         seq.pulse(rc)
         d=txt(slide,data.get("detail",""),Inches(7.55),Inches(0.68),Inches(5.25),Inches(6.2),
-              th["font_body"],14,rgb(th["body_color"]),wrap=True)
+              th.font_body,14,th.body_color,wrap=True)
         seq.fade(d,dur=400,delay=550)
         return self._fin(slide,seq,data)
 
     def grid(self,prs,data,idx):
         slide,seq=self._slide(prs); th=self.th
-        bar=rect(slide,Inches(0),Inches(0),Inches(0.4),H,rgb(th["accent"]))
+        bar=rect(slide,Inches(0),Inches(0),Inches(0.4),H,th.accent)
         seq.wipe_in(bar,dur=400)
         t=txt(slide,data["title"],Inches(0.65),Inches(0.18),Inches(12),Inches(1.0),
-              th["font_head"],36,rgb(th["title_color"]),bold=True)
+              th.font_head,36,th.title_color,bold=True)
         seq.fly_in(t,dur=500,delay=200)
         s=txt(slide,data.get("subtitle",""),Inches(0.65),Inches(1.18),Inches(10),Inches(0.45),
-              th["font_body"],13,rgb(th["accent"]),italic=True)
+              th.font_body,13,th.accent,italic=True)
         seq.fade(s,dur=350,delay=350)
         pts=data.get("points",[""])
         pos=[(Inches(0.65),Inches(1.82)),(Inches(7.0),Inches(1.82)),(Inches(0.65),Inches(4.52)),(Inches(7.0),Inches(4.52))]
         for i,(pt,(cx,cy)) in enumerate(zip(pts[:4],pos)):
             d=440+i*130
-            c=self._outline(slide,cx,cy,Inches(6.1),Inches(2.45),rgb(th["accent"]),seq,d)
+            c=self._outline(slide,cx,cy,Inches(6.1),Inches(2.45),th.accent,seq,d)
             if i%2==1: seq.pulse(c)
-            nc=rect(slide,cx+Inches(0.14),cy+Inches(0.12),Inches(0.55),Inches(0.55),rgb(th["accent"]))
+            nc=rect(slide,cx+Inches(0.14),cy+Inches(0.12),Inches(0.55),Inches(0.55),th.accent)
             seq.zoom_in(nc,dur=250,delay=d+80)
             bn=txt(slide,f"0{i+1}",cx+Inches(0.14),cy+Inches(0.12),Inches(0.55),Inches(0.55),
-                   th["font_body"],12,rgb(th["bg"]),bold=True,align=PP_ALIGN.CENTER)
+                   th.font_body,12,th.bg,bold=True,align=PP_ALIGN.CENTER)
             seq.appear(bn,delay=d+80)
             ptxt=txt(slide,pt,cx+Inches(0.84),cy+Inches(0.08),Inches(5.1),Inches(2.25),
-                     th["font_body"],12,rgb(th["body_color"]),wrap=True)
+                     th.font_body,12,th.body_color,wrap=True)
             seq.fly_in(ptxt,dur=380,delay=d+150,from_dir="bottom")
         return self._fin(slide,seq,data)
 
@@ -888,19 +1010,191 @@ LAYOUT_MAP   = {
     "stat_callout":"numbered","timeline":"timeline","full_detail":"numbered",
 }
 
-def build_ppt(outline, theme, style="futuristic"):
-    prs = Presentation()
-    prs.slide_width  = Inches(13.33)
-    prs.slide_height = Inches(7.5)
-    Cls = TEMPLATES.get(style, Futuristic)
-    tmpl = Cls(theme)
+def layout_for(idx, data, last):
+    """Template method for slide idx (1-based). Depends only on the outline, never the template."""
+    if idx==1 or last:
+        return "hero"
+    key = LAYOUT_MAP.get(data.get("layout",""))
+    if not key:
+        key = LAYOUT_CYCLE[(idx-2) % len(LAYOUT_CYCLE)]
+    return key
+
+def plan_deck(outline):
     n = len(outline)
-    for idx, data in enumerate(outline, start=1):
-        if idx==1 or idx==n:
-            tmpl.hero(prs, data, idx)
-        else:
-            key = LAYOUT_MAP.get(data.get("layout",""))
-            if not key:
-                key = LAYOUT_CYCLE[(idx-2) % len(LAYOUT_CYCLE)]
-            getattr(tmpl, key, tmpl.content)(prs, data, idx)
-    buf = io.BytesIO(); prs.save(buf); buf.seek(0); return buf.read()
\ No newline at end of file
+    return [layout_for(idx, data, idx==n) for idx, data in enumerate(outline, start=1)]
+
+# ── base presentation ─────────────────────────────────────────────────────────
+# Presentation() unzips and parses python-pptx's default template on every
+# call; a deepcopy of an already-parsed, already-resized one costs well under
+# half of that. One base per thread, so concurrent render threads never read
+# the same lxml tree while copying it.
+_base = threading.local()
+
+def _base_presentation():
+    prs = getattr(_base, "prs", None)
+    if prs is None:
+        prs = _base.prs = Presentation()
+        prs.slide_width  = Inches(13.33)
+        prs.slide_height = Inches(7.5)
+    return prs
+
+def new_presentation():
+    return copy.deepcopy(_base_presentation())
+
+class DeckBuilder:
+    """
+    Incremental build_ppt: add() slides as their outline objects arrive, then
+    finish(). Slides render one step behind, because whether a slide is the
+    closing hero is only known once the next one arrives or the outline ends.
+    Slides already in slide_cache are grafted in instead of rendered
+    (cache=False: neither looked up nor stored).
+    """
+    def __init__(self, theme, style="futuristic", cache=True):
+        self.prs = new_presentation()
+        self.style = style if style in TEMPLATES else "futuristic"
+        self.tmpl = TEMPLATES[self.style](theme)
+        self.outline = []
+        th = self.tmpl.th
+        self._ck = (type(self.tmpl).__name__,
+                    tuple(str(getattr(th, k)) for k in ("name",) + ResolvedTheme.COLORS + ResolvedTheme.FONTS)) \
+                   if cache else None
+
+    def add(self, data):
+        if self.outline:
+            idx = len(self.outline)
+            self.render(idx, layout_for(idx, self.outline[-1], last=False), self.outline[-1])
+        self.outline.append(data)
+
+    def render(self, idx, key, data):
+        ck = slide_key(*self._ck, idx, key, data) if self._ck and slide_cache.enabled else None
+        hit = slide_cache.get(ck) if ck else None
+        if ck: count("ppt_slide_cache_total", result="hit" if hit else "miss")
+        with span("ppt_slide_render_seconds", template=self.style, layout=key, cache="hit" if hit else "miss"):
+            if hit:
+                graft_slide(self.prs, *hit)
+                count("ppt_slide_cache_bytes_total", len(hit[0]) + len(hit[1] or b""), result="hit")
+                return
+            tmpl = self.tmpl
+            getattr(tmpl, key, tmpl.content)(self.prs, data, idx)
+            if ck:
+                xml, notes = dump_slide(self.prs.slides[-1])
+                slide_cache.put(ck, xml, notes)
+                count("ppt_slide_cache_bytes_total", len(xml) + len(notes or b""), result="stored")
+
+    def finish(self, dest=None):
+        if self.outline:
+            idx = len(self.outline)
+            self.render(idx, layout_for(idx, self.outline[-1], last=True), self.outline[-1])
+        return self.save(dest)
+
+    def save(self, dest=None):
+        return save_presentation(self.prs, dest)
+
+def save_presentation(prs, dest=None):
+    """
+    Bytes of the .pptx, or with `dest` (a path or writable file) the zip is
+    written there entry by entry and `dest` returned — no whole-deck buffer,
+    only the part being compressed is in memory.
+    """
+    with span("ppt_pptx_save_seconds"):
+        if dest is not None:
+            prs.save(dest); return dest
+        buf = io.BytesIO(); prs.save(buf); return buf.getvalue()
+
+def build_ppt(outline, theme, style="futuristic", dest=None):
+    deck = DeckBuilder(theme, style)
+    for data in outline:
+        deck.add(data)
+    return deck.finish(dest)
+
+def build_planned(outline, plan, theme, style="futuristic", dest=None):
+    """build_ppt with the layout plan already worked out by plan_deck()."""
+    deck = DeckBuilder(theme, style)
+    for idx, (key, data) in enumerate(zip(plan, outline), start=1):
+        deck.render(idx, key, data)
+    return deck.save(dest)
+
+# ── parallel rendering ────────────────────────────────────────────────────────
+# Once the layout plan is fixed no slide depends on another, so a long deck
+# can be rendered in chunks on several processes. Each chunk comes back as
+# (slide XML, notes slide XML) pairs; merge_parts() grafts them onto fresh
+# parts in order, wiring notes exactly as python-pptx's notes_slide does, so
+# the package matches build_ppt's byte for byte.
+
+def dump_slide(slide):
+    """(slide XML, notes slide XML or None) — what graft_slide() takes back."""
+    return (etree.tostring(slide._element),
+            etree.tostring(slide.notes_slide._element) if slide.has_notes_slide else None)
+
+def graft_slide(prs, xml, notes_xml=None):
+    """Append a dumped slide to prs."""
+    part = prs.slides.add_slide(prs.slide_layouts[6]).part
+    _set_slide(prs, part, xml, notes_xml)
+
+def _set_slide(prs, part, xml, notes_xml):
+    part._element = parse_xml(xml)
+    part.__dict__.pop("slide", None)   # lazyproperty still wraps the old <p:sld>
+    try: notes_part = part.part_related_by(RT.NOTES_SLIDE)
+    except KeyError: notes_part = None
+    if notes_xml is None:
+        if notes_part is not None:   # unreferenced parts are not saved
+            part.drop_rel(next(r for r, rel in part.rels.items() if rel.reltype == RT.NOTES_SLIDE))
+    elif notes_part is not None:
+        notes_part._element = parse_xml(notes_xml)
+    else:
+        # NotesSlidePart.new() minus cloning placeholders we are about to replace
+        notes_part = NotesSlidePart._add_notes_slide_part(prs.part.package, part, prs.part.notes_master_part)
+        notes_part._element = parse_xml(notes_xml)
+        part.relate_to(notes_part, RT.NOTES_SLIDE)
+
+def render_part(theme, style, steps):
+    """Render (idx, layout key, data) steps on a scratch deck."""
+    deck = DeckBuilder(theme, style)
+    for idx, key, data in steps:
+        deck.render(idx, key, data)
+    return [dump_slide(s) for s in deck.prs.slides]
+
+def merge_parts(parts, dest=None):
+    """One saved deck from render_part() results, concatenated in slide order."""
+    prs = new_presentation()
+    for xml, notes_xml in parts:
+        graft_slide(prs, xml, notes_xml)
+    return save_presentation(prs, dest)
+
+def rerender_slide(src, outline, idx, theme, style="futuristic", dest=None):
+    """
+    The saved deck at `src` with only slide idx (1-based) rendered afresh
+    from outline[idx-1]; every other part is carried over as it is. Slide
+    layouts depend on nothing but a slide's own data and position, so the
+    slides match a full build_ppt of `outline` (notes parts may be numbered
+    differently if the edit adds or removes a slide's notes).
+    """
+    prs = Presentation(src)
+    if not 1 <= idx <= len(prs.slides): raise IndexError(f"Deck has no slide {idx}")
+    data = outline[idx-1]
+    (xml, notes_xml), = render_part(theme, style, [(idx, layout_for(idx, data, idx == len(outline)), data)])
+    _set_slide(prs, prs.slides[idx-1].part, xml, notes_xml)
+    return save_presentation(prs, dest)
+
+# ── warm-up ───────────────────────────────────────────────────────────────────
+# A fresh process pays for python-pptx's template parse, every shape
+# prototype and every timing tree on its first deck. warm_up() pays it up
+# front: one slide of each layout in every template, saved, slide cache
+# bypassed. Slide timing depends only on template and layout (4 points
+# each), so the _timing trees compiled here are the ones real decks use.
+
+_WARM_OUTLINE = [{"title": "Warm-up", "subtitle": "Warm-up slide", "points": ["Point."] * 4,
+                  "detail": "Detail.", "notes": "Notes.", "layout": layout}
+                 for layout in ("title_hero", "two_column", "icon_grid", "stat_callout", "timeline", "title_hero")]
+
+def warm_up(themes=()):
+    """Prime this process (and this thread's base deck); `themes` are resolved too."""
+    for th in themes: resolve_theme(th)
+    theme = themes[0] if themes else {"name": "", **{k: "#808080" for k in ResolvedTheme.COLORS},
+                                      "font_head": "Calibri", "font_body": "Calibri"}
+    plan = plan_deck(_WARM_OUTLINE)
+    for style in TEMPLATES:
+        deck = DeckBuilder(theme, style, cache=False)
+        for idx, (key, data) in enumerate(zip(plan, _WARM_OUTLINE), start=1):
+            deck.render(idx, key, data)
+        deck.save()
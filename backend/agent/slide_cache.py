@@ -0,0 +1,74 @@
+"""
+slide_cache.py — rendered-slide cache for DeckBuilder.
+
+A slide is a pure function of (template, theme, slide number, layout key,
+outline dict), so its XML (shapes + timing) and notes-slide XML can be kept
+under an xxh3-128 of those and grafted back in when the same slide comes up
+again — e.g. a deck regenerated after one title was edited re-renders only
+that slide.
+
+In-process LRU bounded by the bytes of XML held. Each build process keeps
+its own, so a repeated slide is a hit only if its deck lands on a process
+that rendered it before; stats() covers this process alone. Server-wide
+numbers come from the ppt_slide_cache_* counters DeckBuilder bumps, which
+build processes ship back with their results (see metrics.py, and /health).
+
+Config (env):
+    PPT_SLIDE_CACHE_MB   XML kept per process, 0 disables   (default 64)
+"""
+import json, os, threading
+from collections import OrderedDict
+import xxhash
+
+def slide_key(template: str, theme: tuple, idx: int, layout: str, data: dict) -> str:
+    raw = json.dumps([template, theme, idx, layout, data], sort_keys=True, separators=(",", ":"),
+                     ensure_ascii=False, default=str)
+    return xxhash.xxh3_128_hexdigest(raw.encode())
+
+
+class SlideCache:
+    def __init__(self, max_bytes=64 << 20):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+        self._mem  = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self): return self.max_bytes > 0
+
+    def get(self, key):
+        """(slide xml, notes xml or None), or None on a miss."""
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is None:
+                self.misses += 1; return None
+            self._mem.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, xml, notes_xml=None):
+        n = len(xml) + len(notes_xml or b"")
+        if n > self.max_bytes: return
+        with self._lock:
+            old = self._mem.pop(key, None)
+            if old is not None: self.size -= len(old[0]) + len(old[1] or b"")
+            self._mem[key] = (xml, notes_xml)
+            self.size += n
+            while self.size > self.max_bytes:
+                _, (x, nx) = self._mem.popitem(last=False)
+                self.size -= len(x) + len(nx or b"")
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._mem.clear(); self.size = 0
+
+    def stats(self):
+        looked = self.hits + self.misses
+        return {"entries": len(self._mem), "bytes": self.size, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": round(self.hits / looked, 4) if looked else 0.0}
+
+
+cache = SlideCache(max_bytes=int(float(os.getenv("PPT_SLIDE_CACHE_MB", "64")) * (1 << 20)))
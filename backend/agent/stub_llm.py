@@ -0,0 +1,85 @@
+"""
+stub_llm.py — offline LLM backend for load tests and benchmarks.
+
+Answers the planner's own prompts (full outline, section skeleton, section,
+single slide) with realistic, deterministic JSON: same prompt, same outline,
+no network, no API key. Speed is configurable so /generate-ppt can be
+benchmarked under a believable LLM profile:
+
+    PPT_STUB_LATENCY         fixed seconds before the first token   (default 0)
+    PPT_STUB_TOKENS_PER_SEC  simulated generation rate, 0 = instant (default 0)
+
+Select it with PPT_LLM_BACKEND=stub.
+"""
+import asyncio, json, os, random, re
+import xxhash
+from agent.llm import LLMBackend
+
+_WORDS = ("system data model network process design platform signal layer cloud "
+          "pipeline latency throughput security protocol framework architecture "
+          "research market strategy adoption growth efficiency analysis metric "
+          "customer workflow automation integration standard benchmark capacity").split()
+_LAYOUTS = ["two_column","icon_grid","stat_callout","timeline","full_detail"]
+_CHARS_PER_TOKEN = 4
+_CHUNK_TOKENS = 16
+
+
+class StubBackend(LLMBackend):
+    def __init__(self, latency=None, tokens_per_sec=None):
+        env = os.getenv
+        self.latency = float(env("PPT_STUB_LATENCY", "0")) if latency is None else latency
+        self.tokens_per_sec = float(env("PPT_STUB_TOKENS_PER_SEC", "0")) if tokens_per_sec is None else tokens_per_sec
+
+    # ── fake content ──────────────────────────────────────────────────────────
+    @staticmethod
+    def _sentence(rng, topic, lo, hi):
+        words = [rng.choice(_WORDS) for _ in range(rng.randint(lo, hi) - 1)]
+        words.insert(rng.randrange(len(words)), topic)
+        return " ".join(words).capitalize() + "."
+
+    def _slide(self, rng, topic, i, hero, prev_layout):
+        return {
+            "title":    f"{rng.choice(_WORDS).title()} {rng.choice(_WORDS).title()} {i+1}",
+            "subtitle": self._sentence(rng, topic, 8, 14),
+            "points":   [self._sentence(rng, topic, 20, 30) for _ in range(4)],
+            "detail":   self._sentence(rng, topic, 50, 70),
+            "notes":    self._sentence(rng, topic, 60, 80),
+            "layout":   "title_hero" if hero else rng.choice([l for l in _LAYOUTS if l != prev_layout]),
+        }
+
+    def _answer(self, prompt):
+        rng = random.Random(xxhash.xxh64_intdigest(prompt.encode()))
+        topic = re.search(r'about: "(.*?)"', prompt)
+        topic = topic.group(1) if topic else "the topic"
+        n = re.search(r"exactly (\d+) objects?", prompt)
+        n = int(n.group(1)) if n else 10
+        if "Split it into exactly" in prompt:   # section skeleton
+            return json.dumps([{"title": f"{rng.choice(_WORDS).title()} and {topic}",
+                                "focus": self._sentence(rng, topic, 10, 16)} for _ in range(n)])
+        span = re.search(r"slides? (\d+)(?: to \d+)? of (\d+)", prompt)
+        first, total = (int(span.group(1)) - 1, int(span.group(2))) if span else (0, n)
+        out, prev = [], None
+        for i in range(first, first + n):
+            s = self._slide(rng, topic, i, i == 0 or i == total - 1, prev)
+            prev = s["layout"]; out.append(s)
+        return json.dumps(out, indent=1)
+
+    def _generation_time(self, text):
+        if not self.tokens_per_sec: return 0.0
+        return len(text) / _CHARS_PER_TOKEN / self.tokens_per_sec
+
+    # ── LLMBackend ────────────────────────────────────────────────────────────
+    async def complete(self, prompt, max_tokens=6000, temperature=0.7, kind="default"):
+        text = self._answer(prompt)
+        delay = self.latency + self._generation_time(text)
+        if delay: await asyncio.sleep(delay)
+        return text
+
+    async def stream(self, prompt, max_tokens=6000, temperature=0.7):
+        text = self._answer(prompt)
+        if self.latency: await asyncio.sleep(self.latency)
+        step = _CHUNK_TOKENS * _CHARS_PER_TOKEN
+        for i in range(0, len(text), step):
+            chunk = text[i:i+step]
+            if self.tokens_per_sec: await asyncio.sleep(self._generation_time(chunk))
+            yield chunk
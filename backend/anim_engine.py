@@ -5,11 +5,14 @@ Uses p:seq/mainSeq structure — the correct PowerPoint internal format.
 Tested and verified: timing XML, transitions, entrance/emphasis/path all embed correctly.
 """
 from pptx.oxml.ns import qn
+from copy import deepcopy
+from functools import lru_cache
+from itertools import count
+from string import Formatter
 from lxml import etree
+from metrics import span
 
-_ctr = [10]
-def _nid(): v=_ctr[0]; _ctr[0]+=1; return v
-def reset(): _ctr[0]=10
+_FIRST_ID = 10   # cTn ids are per slide; every slide's timing numbers from here
 
 # ── Slide Transitions ─────────────────────────────────────────────────────────
 TRANSITION_XML = {
@@ -27,48 +30,86 @@ TRANSITION_XML = {
     "morph":    '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main" spd="med"><p14:morph option="byObject"/></p:transition>',
 }
 
+_TRANSITIONS = {k: etree.fromstring(v.encode()) for k, v in TRANSITION_XML.items()}
+
 def add_transition(slide, trans_type="fade"):
-    xml = TRANSITION_XML.get(trans_type, TRANSITION_XML["fade"])
     try:
-        el = etree.fromstring(xml.encode())
+        el = deepcopy(_TRANSITIONS.get(trans_type, _TRANSITIONS["fade"]))
         ex = slide._element.find(qn("p:transition"))
         if ex is not None: slide._element.remove(ex)
         timing = slide._element.find(qn("p:timing"))
         if timing is not None:
-            slide._element.insert(list(slide._element).index(timing), el)
+            timing.addprevious(el)
         else:
             slide._element.append(el)
     except Exception as e:
         print(f"[Trans] {e}")
 
-# ── Internal XML builders ─────────────────────────────────────────────────────
-
-def _entrance_par(spid, pid, psub, flt, dur, delay, grp, node_type):
-    par=_nid(); s=_nid(); e=_nid()
-    cond = '<p:cond delay="0"/>' if node_type=="clickEffect" else f'<p:cond delay="{delay}"/>'
-    flt_block = f'<p:animEffect transition="in" filter="{flt}"><p:cBhvr><p:cTn id="{e}" dur="{dur}"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr></p:animEffect>' if flt else ""
-    return f'<p:par><p:cTn id="{par}" presetID="{pid}" presetClass="entr" presetSubtype="{psub}" fill="hold" grpId="{grp}" nodeType="{node_type}"><p:stCondLst>{cond}</p:stCondLst><p:childTnLst><p:set><p:cBhvr><p:cTn id="{s}" dur="1" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>style.visibility</p:attrName></p:attrNameLst></p:cBhvr><p:to><p:strVal val="visible"/></p:to></p:set>{flt_block}</p:childTnLst></p:cTn></p:par>'
-
-def _emph_grow(spid, delay=0, scale=120000, dur=500):
-    par=_nid(); inn=_nid()
-    return f'<p:par><p:cTn id="{par}" presetID="150" presetClass="emph" presetSubtype="0" fill="hold" grpId="99" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animScale><p:cBhvr calcmode="lin" valueType="num"><p:cTn id="{inn}" dur="{dur}" autoRev="1"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr><p:from x="100000" y="100000"/><p:to x="{scale}" y="{scale}"/></p:animScale></p:childTnLst></p:cTn></p:par>'
-
-def _emph_spin(spid, delay=0, by=5400000, dur=600):
-    par=_nid(); inn=_nid()
-    return f'<p:par><p:cTn id="{par}" presetID="156" presetClass="emph" presetSubtype="0" fill="hold" grpId="98" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animRot by="{by}"><p:cBhvr calcmode="lin"><p:cTn id="{inn}" dur="{dur}"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr></p:animRot></p:childTnLst></p:cTn></p:par>'
-
-def _emph_pulse(spid, delay=0, dur=350):
-    par=_nid(); inn=_nid()
-    return f'<p:par><p:cTn id="{par}" presetID="150" presetClass="emph" presetSubtype="0" fill="hold" grpId="97" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animScale><p:cBhvr calcmode="lin" valueType="num"><p:cTn id="{inn}" dur="{dur}" autoRev="1" repeatCount="2"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr><p:from x="100000" y="100000"/><p:to x="108000" y="108000"/></p:animScale></p:childTnLst></p:cTn></p:par>'
-
-def _motion_path(spid, path, delay=0, dur=700):
-    par=_nid(); s=_nid(); m=_nid()
-    return f'<p:par><p:cTn id="{par}" presetID="0" presetClass="path" presetSubtype="0" fill="hold" grpId="96" nodeType="withEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:set><p:cBhvr><p:cTn id="{s}" dur="1" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>style.visibility</p:attrName></p:attrNameLst></p:cBhvr><p:to><p:strVal val="visible"/></p:to></p:set><p:animMotion origin="layout" path="{path}" pathEditMode="relative" rAng="0"><p:cBhvr calcmode="lin"><p:cTn id="{m}" dur="{dur}" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>ppt_x</p:attrName><p:attrName>ppt_y</p:attrName></p:attrNameLst></p:cBhvr></p:animMotion></p:childTnLst></p:cTn></p:par>'
-
-
-def _wrap_timing(seq_blocks):
-    root=_nid(); seq=_nid()
-    return f'<p:timing xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"><p:tnLst><p:par><p:cTn id="{root}" dur="indefinite" restart="whenNotActive" nodeType="tmRoot"><p:childTnLst><p:seq concurrent="1" nextAc="seek"><p:cTn id="{seq}" dur="indefinite" nodeType="mainSeq"><p:childTnLst>{seq_blocks}</p:childTnLst></p:cTn><p:prevCondLst><p:cond evt="onPrevClick" delay="0"><p:tn/></p:cond></p:prevCondLst><p:nextCondLst><p:cond evt="onNextClick" delay="0"><p:tn/></p:cond></p:nextCondLst></p:seq></p:childTnLst></p:cTn></p:par></p:tnLst><p:bldLst/></p:timing>'
+# ── Element templates ─────────────────────────────────────────────────────────
+# Each timing fragment is parsed once at import; filling one is a deepcopy
+# plus set() on the attributes that held a {field}. A slide's whole
+# <p:timing> — IDs included, since they depend only on the choreography — is
+# assembled from them once per distinct choreography and cached, so inject()
+# is a single deepcopy.
+
+_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+class _Tmpl:
+    def __init__(self, xml, ids=()):
+        self.ids = ids   # cTn id fields, allocated in this order
+        fields = {f for _, f, _, _ in Formatter().parse(xml) if f}
+        marks = {f"@{f}@": f for f in fields}
+        self.el = etree.fromstring(f'<p:w xmlns:p="{_P}">{xml.format(**{f: f"@{f}@" for f in fields})}</p:w>')[0]
+        self.slots = [(i, attr, marks[v]) for i, node in enumerate(self.el.iter())
+                      for attr, v in node.attrib.items() if v in marks]
+
+    def __call__(self, **vals):
+        el = deepcopy(self.el)
+        nodes = list(el.iter())
+        for i, attr, f in self.slots: nodes[i].set(attr, str(vals[f]))
+        return el
+
+_SET_VISIBLE = '<p:set><p:cBhvr><p:cTn id="{s}" dur="1" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>style.visibility</p:attrName></p:attrNameLst></p:cBhvr><p:to><p:strVal val="visible"/></p:to></p:set>'
+_ENTRANCE = '<p:par><p:cTn id="{par}" presetID="{pid}" presetClass="entr" presetSubtype="{psub}" fill="hold" grpId="{grp}" nodeType="{node_type}"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst>' + _SET_VISIBLE + '{flt_block}</p:childTnLst></p:cTn></p:par>'
+_FILTER   = '<p:animEffect transition="in" filter="{flt}"><p:cBhvr><p:cTn id="{e}" dur="{dur}"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr></p:animEffect>'
+
+_T_ENTRANCE     = _Tmpl(_ENTRANCE.replace("{flt_block}", ""))
+_T_ENTRANCE_FLT = _Tmpl(_ENTRANCE.replace("{flt_block}", _FILTER))
+_T_GROW   = _Tmpl('<p:par><p:cTn id="{par}" presetID="150" presetClass="emph" presetSubtype="0" fill="hold" grpId="99" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animScale><p:cBhvr calcmode="lin" valueType="num"><p:cTn id="{inn}" dur="{dur}" autoRev="1"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr><p:from x="100000" y="100000"/><p:to x="{scale}" y="{scale}"/></p:animScale></p:childTnLst></p:cTn></p:par>', ids=("par", "inn"))
+_T_SPIN   = _Tmpl('<p:par><p:cTn id="{par}" presetID="156" presetClass="emph" presetSubtype="0" fill="hold" grpId="98" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animRot by="{by}"><p:cBhvr calcmode="lin"><p:cTn id="{inn}" dur="{dur}"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr></p:animRot></p:childTnLst></p:cTn></p:par>', ids=("par", "inn"))
+_T_PULSE  = _Tmpl('<p:par><p:cTn id="{par}" presetID="150" presetClass="emph" presetSubtype="0" fill="hold" grpId="97" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animScale><p:cBhvr calcmode="lin" valueType="num"><p:cTn id="{inn}" dur="{dur}" autoRev="1" repeatCount="2"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr><p:from x="100000" y="100000"/><p:to x="108000" y="108000"/></p:animScale></p:childTnLst></p:cTn></p:par>', ids=("par", "inn"))
+_T_MOTION = _Tmpl('<p:par><p:cTn id="{par}" presetID="0" presetClass="path" presetSubtype="0" fill="hold" grpId="96" nodeType="withEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst>' + _SET_VISIBLE + '<p:animMotion origin="layout" path="{path}" pathEditMode="relative" rAng="0"><p:cBhvr calcmode="lin"><p:cTn id="{m}" dur="{dur}" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>ppt_x</p:attrName><p:attrName>ppt_y</p:attrName></p:attrNameLst></p:cBhvr></p:animMotion></p:childTnLst></p:cTn></p:par>', ids=("par", "s", "m"))
+_T_TIMING = _Tmpl('<p:timing><p:tnLst><p:par><p:cTn id="{root}" dur="indefinite" restart="whenNotActive" nodeType="tmRoot"><p:childTnLst><p:seq concurrent="1" nextAc="seek"><p:cTn id="{seq}" dur="indefinite" nodeType="mainSeq"><p:childTnLst/></p:cTn><p:prevCondLst><p:cond evt="onPrevClick" delay="0"><p:tn/></p:cond></p:prevCondLst><p:nextCondLst><p:cond evt="onNextClick" delay="0"><p:tn/></p:cond></p:nextCondLst></p:seq></p:childTnLst></p:cTn></p:par></p:tnLst><p:bldLst/></p:timing>')
+_MAIN_SEQ = f"{{{_P}}}tnLst/{{{_P}}}par/{{{_P}}}cTn/{{{_P}}}childTnLst/{{{_P}}}seq/{{{_P}}}cTn/{{{_P}}}childTnLst"
+
+# ── Internal element builders ─────────────────────────────────────────────────
+
+def _entrance_par(ids, spid, pid, psub, flt, dur, delay, grp, node_type):
+    par=next(ids); s=next(ids); e=next(ids)
+    cond = 0 if node_type=="clickEffect" else delay
+    t = _T_ENTRANCE_FLT if flt else _T_ENTRANCE
+    return t(par=par, s=s, e=e, spid=spid, pid=pid, psub=psub, flt=flt, dur=dur,
+             delay=cond, grp=grp, node_type=node_type)
+
+def _extra(ids, tmpl, params):
+    return tmpl(**{f: next(ids) for f in tmpl.ids}, **dict(params))
+
+
+@lru_cache(maxsize=512)
+def _timing(entrance, extras):
+    """
+    <p:timing> for one choreography; treat as read-only. `ids` is this
+    slide's own allocator: entrances take three each, then tmRoot and
+    mainSeq, then the emphasis/path effects — so nothing is shared between
+    slides, decks or threads.
+    """
+    ids = count(_FIRST_ID)
+    blocks = [_entrance_par(ids, *e, i+1, "clickEffect" if i == 0 else "withEffect")
+              for i, e in enumerate(entrance)]
+    timing = _T_TIMING(root=next(ids), seq=next(ids))
+    blocks += [_extra(ids, t, params) for t, params in extras]
+    timing.find(_MAIN_SEQ).extend(blocks)
+    return timing
 
 
 # ── AnimSequence: fluent builder ──────────────────────────────────────────────
@@ -89,7 +130,7 @@ class AnimSequence:
 
     def __init__(self):
         self._entrance = []   # (spid, pid, psub, flt, dur, delay)
-        self._extras   = []   # raw XML for emphasis/paths
+        self._extras   = []   # (template, params) for emphasis/paths
 
     # Entrance
     def appear(self, s, delay=0):
@@ -116,39 +157,34 @@ class AnimSequence:
 
     # Emphasis (fires on a subsequent click)
     def grow_emphasis(self, s, scale=120, delay=0, dur=500):
-        _nid()  # keep counter in sync
-        reset_val = _ctr[0]
-        self._extras.append(_emph_grow(s.shape_id, delay, scale*1000, dur))
+        self._extras.append((_T_GROW, (("spid", s.shape_id), ("delay", delay), ("scale", scale*1000), ("dur", dur))))
 
     def spin_emphasis(self, s, degrees=360, delay=0, dur=600):
-        self._extras.append(_emph_spin(s.shape_id, delay, int(degrees*60000), dur))
+        self._extras.append((_T_SPIN, (("spid", s.shape_id), ("delay", delay), ("by", int(degrees*60000)), ("dur", dur))))
 
     def pulse(self, s, delay=0, dur=350):
-        self._extras.append(_emph_pulse(s.shape_id, delay, dur))
+        self._extras.append((_T_PULSE, (("spid", s.shape_id), ("delay", delay), ("dur", dur))))
 
     # Motion paths (entrance via path)
+    def _path(self, s, path, delay, dur):
+        self._extras.append((_T_MOTION, (("spid", s.shape_id), ("path", path), ("delay", delay), ("dur", dur))))
+
     def sweep_from_left(self, s, delay=0, dur=700):
-        self._extras.append(_motion_path(s.shape_id, "M -0.5 0 L 0 0", delay, dur))
+        self._path(s, "M -0.5 0 L 0 0", delay, dur)
 
     def sweep_from_right(self, s, delay=0, dur=700):
-        self._extras.append(_motion_path(s.shape_id, "M 0.5 0 L 0 0", delay, dur))
+        self._path(s, "M 0.5 0 L 0 0", delay, dur)
 
     def sweep_from_below(self, s, delay=0, dur=700):
-        self._extras.append(_motion_path(s.shape_id, "M 0 0.3 L 0 0", delay, dur))
+        self._path(s, "M 0 0.3 L 0 0", delay, dur)
 
     def inject(self, slide):
-        reset()
-        blocks = ""
-        for i, (spid, pid, psub, flt, dur, delay) in enumerate(self._entrance):
-            nt = "clickEffect" if i == 0 else "withEffect"
-            blocks += _entrance_par(spid, pid, psub, flt, dur, delay, i+1, nt)
-        for b in self._extras:
-            blocks += b
-        timing = _wrap_timing(blocks)
-        try:
-            el = slide._element
-            ex = el.find(qn("p:timing"))
-            if ex is not None: el.remove(ex)
-            el.append(etree.fromstring(timing.encode()))
-        except Exception as e:
-            print(f"[AnimSeq.inject] {e}")
\ No newline at end of file
+        with span("ppt_anim_inject_seconds"):
+            timing = deepcopy(_timing(tuple(self._entrance), tuple(self._extras)))
+            try:
+                el = slide._element
+                ex = el.find(qn("p:timing"))
+                if ex is not None: el.remove(ex)
+                el.append(timing)
+            except Exception as e:
+                print(f"[AnimSeq.inject] {e}")
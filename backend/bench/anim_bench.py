@@ -0,0 +1,76 @@
+"""
+anim_bench.py — per-slide cost of AnimSequence.inject + add_transition,
+precompiled element templates (anim_engine) vs the old string builder
+(bench/anim_legacy.py), plus a check that the slide XML is the same apart
+from cTn ids (the legacy engine shared one counter across slides).
+
+    cd backend && python bench/anim_bench.py [--slides 300] [--rounds 10]
+"""
+import argparse, gc, os, statistics, sys, time
+from copy import deepcopy
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Inches
+import anim_engine
+from bench import anim_legacy
+
+TRANSITIONS = list(anim_engine.TRANSITION_XML)
+CTN = "{http://schemas.openxmlformats.org/presentationml/2006/main}cTn"
+
+def choreograph(engine, shapes, i):
+    """A typical template slide: 7 entrances of mixed kinds plus emphasis/path extras."""
+    seq = engine.AnimSequence()
+    seq.wipe_in(shapes[0]); seq.fly_in(shapes[1], delay=150); seq.fade(shapes[2], delay=300)
+    seq.appear(shapes[3]); seq.zoom_in(shapes[4], delay=400); seq.float_up(shapes[5]); seq.split_in(shapes[6])
+    [seq.grow_emphasis, seq.pulse, seq.spin_emphasis][i % 3](shapes[7])
+    seq.sweep_from_left(shapes[8], delay=100)
+    return seq
+
+def make_deck(n):
+    prs = Presentation()
+    for _ in range(n):
+        s = prs.slides.add_slide(prs.slide_layouts[6])
+        for k in range(9): s.shapes.add_textbox(Inches(k % 3), Inches(k // 3), Inches(1), Inches(1))
+    return prs
+
+def canon(slide):
+    el = deepcopy(slide._element)
+    for ctn in el.iter(CTN): del ctn.attrib["id"]
+    return etree.tostring(el)
+
+def one_pass(engine, slides, shapes):
+    gc.collect(); gc.disable()
+    t0 = time.perf_counter()
+    for i, slide in enumerate(slides):
+        choreograph(engine, shapes[i], i).inject(slide)
+        engine.add_transition(slide, TRANSITIONS[i % len(TRANSITIONS)])
+    dt = time.perf_counter() - t0; gc.enable()
+    return dt / len(slides) * 1e6
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--slides", type=int, default=300)
+    ap.add_argument("--rounds", type=int, default=10)
+    a = ap.parse_args()
+    engines = {"strings": anim_legacy, "templates": anim_engine}
+    decks = {}
+    for name in engines:
+        slides = list(make_deck(a.slides).slides)
+        shapes = [[SimpleNamespace(shape_id=sh.shape_id) for sh in s.shapes] for s in slides]   # shape_id is an xpath
+        decks[name] = slides, shapes
+    # Interleaved so allocator drift hits both alike; each inject replaces the previous timing.
+    times = {name: [] for name in engines}
+    for _ in range(a.rounds):
+        for name, engine in engines.items():
+            times[name].append(one_pass(engine, *decks[name]))
+    med = {name: statistics.median(t) for name, t in times.items()}
+    for name in engines:
+        print(f"{name:10s} {med[name]:8.1f} µs/slide  (median of {a.rounds} x {a.slides} slides)")
+    same = [canon(s) for s in decks["strings"][0]] == [canon(s) for s in decks["templates"][0]]
+    print(f"speed-up   {med['strings'] / med['templates']:.2f}x   same XML apart from cTn ids: {same}")
+    sys.exit(0 if same else 1)
+
+if __name__ == "__main__":
+    main()
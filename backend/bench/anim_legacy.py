@@ -0,0 +1,153 @@
+"""
+anim_legacy.py — frozen copy of the string-concatenating anim_engine, kept as
+the reference output and the "before" side of anim_bench.py.
+Do not import from app code.
+"""
+from pptx.oxml.ns import qn
+from lxml import etree
+
+_ctr = [10]
+def _nid(): v=_ctr[0]; _ctr[0]+=1; return v
+def reset(): _ctr[0]=10
+
+# ── Slide Transitions ─────────────────────────────────────────────────────────
+TRANSITION_XML = {
+    "fade":     '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="700"><p:fade/></p:transition>',
+    "push":     '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="600"><p:push dir="l"/></p:transition>',
+    "push_r":   '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="600"><p:push dir="r"/></p:transition>',
+    "push_u":   '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="600"><p:push dir="u"/></p:transition>',
+    "wipe":     '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="500"><p:wipe dir="l"/></p:transition>',
+    "zoom":     '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="600"><p:zoom dir="in"/></p:transition>',
+    "cover":    '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="500"><p:cover dir="l"/></p:transition>',
+    "uncover":  '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="500"><p:uncover dir="l"/></p:transition>',
+    "cut":      '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="fast" dur="100"><p:cut/></p:transition>',
+    "dissolve": '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="700"><p:dissolve/></p:transition>',
+    "flip":     '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" spd="med" dur="600"><p:flip dir="l"/></p:transition>',
+    "morph":    '<p:transition xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" xmlns:p14="http://schemas.microsoft.com/office/powerpoint/2010/main" spd="med"><p14:morph option="byObject"/></p:transition>',
+}
+
+def add_transition(slide, trans_type="fade"):
+    xml = TRANSITION_XML.get(trans_type, TRANSITION_XML["fade"])
+    try:
+        el = etree.fromstring(xml.encode())
+        ex = slide._element.find(qn("p:transition"))
+        if ex is not None: slide._element.remove(ex)
+        timing = slide._element.find(qn("p:timing"))
+        if timing is not None:
+            slide._element.insert(list(slide._element).index(timing), el)
+        else:
+            slide._element.append(el)
+    except Exception as e:
+        print(f"[Trans] {e}")
+
+# ── Internal XML builders ─────────────────────────────────────────────────────
+
+def _entrance_par(spid, pid, psub, flt, dur, delay, grp, node_type):
+    par=_nid(); s=_nid(); e=_nid()
+    cond = '<p:cond delay="0"/>' if node_type=="clickEffect" else f'<p:cond delay="{delay}"/>'
+    flt_block = f'<p:animEffect transition="in" filter="{flt}"><p:cBhvr><p:cTn id="{e}" dur="{dur}"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr></p:animEffect>' if flt else ""
+    return f'<p:par><p:cTn id="{par}" presetID="{pid}" presetClass="entr" presetSubtype="{psub}" fill="hold" grpId="{grp}" nodeType="{node_type}"><p:stCondLst>{cond}</p:stCondLst><p:childTnLst><p:set><p:cBhvr><p:cTn id="{s}" dur="1" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>style.visibility</p:attrName></p:attrNameLst></p:cBhvr><p:to><p:strVal val="visible"/></p:to></p:set>{flt_block}</p:childTnLst></p:cTn></p:par>'
+
+def _emph_grow(spid, delay=0, scale=120000, dur=500):
+    par=_nid(); inn=_nid()
+    return f'<p:par><p:cTn id="{par}" presetID="150" presetClass="emph" presetSubtype="0" fill="hold" grpId="99" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animScale><p:cBhvr calcmode="lin" valueType="num"><p:cTn id="{inn}" dur="{dur}" autoRev="1"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr><p:from x="100000" y="100000"/><p:to x="{scale}" y="{scale}"/></p:animScale></p:childTnLst></p:cTn></p:par>'
+
+def _emph_spin(spid, delay=0, by=5400000, dur=600):
+    par=_nid(); inn=_nid()
+    return f'<p:par><p:cTn id="{par}" presetID="156" presetClass="emph" presetSubtype="0" fill="hold" grpId="98" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animRot by="{by}"><p:cBhvr calcmode="lin"><p:cTn id="{inn}" dur="{dur}"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr></p:animRot></p:childTnLst></p:cTn></p:par>'
+
+def _emph_pulse(spid, delay=0, dur=350):
+    par=_nid(); inn=_nid()
+    return f'<p:par><p:cTn id="{par}" presetID="150" presetClass="emph" presetSubtype="0" fill="hold" grpId="97" nodeType="clickEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:animScale><p:cBhvr calcmode="lin" valueType="num"><p:cTn id="{inn}" dur="{dur}" autoRev="1" repeatCount="2"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl></p:cBhvr><p:from x="100000" y="100000"/><p:to x="108000" y="108000"/></p:animScale></p:childTnLst></p:cTn></p:par>'
+
+def _motion_path(spid, path, delay=0, dur=700):
+    par=_nid(); s=_nid(); m=_nid()
+    return f'<p:par><p:cTn id="{par}" presetID="0" presetClass="path" presetSubtype="0" fill="hold" grpId="96" nodeType="withEffect"><p:stCondLst><p:cond delay="{delay}"/></p:stCondLst><p:childTnLst><p:set><p:cBhvr><p:cTn id="{s}" dur="1" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>style.visibility</p:attrName></p:attrNameLst></p:cBhvr><p:to><p:strVal val="visible"/></p:to></p:set><p:animMotion origin="layout" path="{path}" pathEditMode="relative" rAng="0"><p:cBhvr calcmode="lin"><p:cTn id="{m}" dur="{dur}" fill="hold"/><p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl><p:attrNameLst><p:attrName>ppt_x</p:attrName><p:attrName>ppt_y</p:attrName></p:attrNameLst></p:cBhvr></p:animMotion></p:childTnLst></p:cTn></p:par>'
+
+
+def _wrap_timing(seq_blocks):
+    root=_nid(); seq=_nid()
+    return f'<p:timing xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"><p:tnLst><p:par><p:cTn id="{root}" dur="indefinite" restart="whenNotActive" nodeType="tmRoot"><p:childTnLst><p:seq concurrent="1" nextAc="seek"><p:cTn id="{seq}" dur="indefinite" nodeType="mainSeq"><p:childTnLst>{seq_blocks}</p:childTnLst></p:cTn><p:prevCondLst><p:cond evt="onPrevClick" delay="0"><p:tn/></p:cond></p:prevCondLst><p:nextCondLst><p:cond evt="onNextClick" delay="0"><p:tn/></p:cond></p:nextCondLst></p:seq></p:childTnLst></p:cTn></p:par></p:tnLst><p:bldLst/></p:timing>'
+
+
+# ── AnimSequence: fluent builder ──────────────────────────────────────────────
+
+class AnimSequence:
+    """
+    Collect shapes + animation types, then inject all into a slide at once.
+
+    Example:
+        seq = AnimSequence()
+        seq.wipe_in(bar_shape)
+        seq.fly_in(title_shape, delay=150)
+        seq.fade(subtitle, delay=300)
+        seq.grow_emphasis(icon)
+        seq.inject(slide)
+        add_transition(slide, "push")
+    """
+
+    def __init__(self):
+        self._entrance = []   # (spid, pid, psub, flt, dur, delay)
+        self._extras   = []   # raw XML for emphasis/paths
+
+    # Entrance
+    def appear(self, s, delay=0):
+        self._entrance.append((s.shape_id, 1, 0, "", 1, delay))
+
+    def fade(self, s, dur=500, delay=0):
+        self._entrance.append((s.shape_id, 10, 0, "fade", dur, delay))
+
+    def fly_in(self, s, dur=600, delay=0, from_dir="bottom"):
+        sub = {"bottom":8,"top":4,"right":2,"left":1}.get(from_dir,8)
+        self._entrance.append((s.shape_id, 2, sub, "fade", dur, delay))
+
+    def zoom_in(self, s, dur=500, delay=0):
+        self._entrance.append((s.shape_id, 18, 0, "fade", dur, delay))
+
+    def wipe_in(self, s, dur=500, delay=0):
+        self._entrance.append((s.shape_id, 21, 8, "wipe(right)", dur, delay))
+
+    def split_in(self, s, dur=500, delay=0):
+        self._entrance.append((s.shape_id, 27, 10, "fade", dur, delay))
+
+    def float_up(self, s, dur=650, delay=0):
+        self._entrance.append((s.shape_id, 2, 8, "fade", dur, delay))
+
+    # Emphasis (fires on a subsequent click)
+    def grow_emphasis(self, s, scale=120, delay=0, dur=500):
+        _nid()  # keep counter in sync
+        reset_val = _ctr[0]
+        self._extras.append(_emph_grow(s.shape_id, delay, scale*1000, dur))
+
+    def spin_emphasis(self, s, degrees=360, delay=0, dur=600):
+        self._extras.append(_emph_spin(s.shape_id, delay, int(degrees*60000), dur))
+
+    def pulse(self, s, delay=0, dur=350):
+        self._extras.append(_emph_pulse(s.shape_id, delay, dur))
+
+    # Motion paths (entrance via path)
+    def sweep_from_left(self, s, delay=0, dur=700):
+        self._extras.append(_motion_path(s.shape_id, "M -0.5 0 L 0 0", delay, dur))
+
+    def sweep_from_right(self, s, delay=0, dur=700):
+        self._extras.append(_motion_path(s.shape_id, "M 0.5 0 L 0 0", delay, dur))
+
+    def sweep_from_below(self, s, delay=0, dur=700):
+        self._extras.append(_motion_path(s.shape_id, "M 0 0.3 L 0 0", delay, dur))
+
+    def inject(self, slide):
+        reset()
+        blocks = ""
+        for i, (spid, pid, psub, flt, dur, delay) in enumerate(self._entrance):
+            nt = "clickEffect" if i == 0 else "withEffect"
+            blocks += _entrance_par(spid, pid, psub, flt, dur, delay, i+1, nt)
+        for b in self._extras:
+            blocks += b
+        timing = _wrap_timing(blocks)
+        try:
+            el = slide._element
+            ex = el.find(qn("p:timing"))
+            if ex is not None: el.remove(ex)
+            el.append(etree.fromstring(timing.encode()))
+        except Exception as e:
+            print(f"[AnimSeq.inject] {e}")
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+outlines.py — synthetic outlines for the benches and the concurrency test:
+random titles, 2-5 points of varied length, and every layout (plus a blank
+one, which clean_slide would have filled).
+"""
+import random
+
+LAYOUTS = ["title_hero", "two_column", "icon_grid", "stat_callout", "timeline", "full_detail", ""]
+
+def outline(seed, n):
+    r = random.Random(seed)
+    return [{"title": f"Slide {i} of deck {seed}", "subtitle": f"Subtitle {i}",
+             "points": [f"Point {j} " * r.randint(2, 6) for j in range(r.randint(2, 5))],
+             "detail": "Detail " * r.randint(3, 12), "notes": f"Notes {i}",
+             "layout": r.choice(LAYOUTS)} for i in range(n)]
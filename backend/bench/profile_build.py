@@ -0,0 +1,33 @@
+"""
+profile_build.py — cProfile of build_ppt over every template.
+
+    cd backend && python bench/profile_build.py [--slides 20] [--decks 3] [--top 25] [--sort tottime] [--out build.prof]
+"""
+import argparse, cProfile, os, pstats, sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agent"))
+from agent.ppt_builder import build_ppt, TEMPLATES
+from bench.outlines import outline
+from themes import THEMES
+
+def run(slides, decks):
+    for i, style in enumerate(TEMPLATES):
+        for d in range(decks):
+            build_ppt(outline(i * decks + d, slides), THEMES[(i * decks + d) % len(THEMES)], style)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--slides", type=int, default=20)
+    ap.add_argument("--decks", type=int, default=3, help="decks per template")
+    ap.add_argument("--top", type=int, default=25)
+    ap.add_argument("--sort", default="tottime")
+    ap.add_argument("--out", help="also dump raw stats here (for snakeviz etc.)")
+    a = ap.parse_args()
+    run(a.slides, 1)   # warm imports and caches
+    pr = cProfile.Profile()
+    pr.enable(); run(a.slides, a.decks); pr.disable()
+    if a.out: pr.dump_stats(a.out)
+    pstats.Stats(pr).strip_dirs().sort_stats(a.sort).print_stats(a.top)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+scaling.py — build_ppt cost against deck size, for every template, on
+synthetic outlines (no LLM).
+
+Per (template, slide count) it records wall time (median of --repeat), peak
+RSS, tracemalloc peak / retained bytes and the .pptx size, and splits one
+build into AnimSequence.inject, add_transition, prs.save and the rest
+(rendering shapes). Each pair runs in a fresh process so RSS peaks don't
+carry over, with the slide cache off so repeats really rebuild. tracemalloc
+only sees Python-level allocations; lxml's trees show up in the RSS column.
+
+    cd backend && python bench/scaling.py [--slides 5,10,25,50,100,200] [--templates neon,magazine]
+                                          [--repeat 3] [--out bench.json] [--compare base.json]
+
+--out writes JSON (commit, machine, one row per pair). --compare prints the
+wall-time ratio against an earlier --out file and exits 1 if any pair got
+slower than --threshold.
+"""
+import argparse, json, multiprocessing, os, platform, resource, statistics, subprocess, sys, time, tracemalloc
+from datetime import datetime, timezone
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+sys.path.insert(0, os.path.join(BACKEND, "agent"))
+
+def outline(n, seed=0):
+    """LLM-shaped outline: the layouts the planner asks for, 4 points, hero first and last."""
+    from bench.outlines import outline as synth
+    o = synth(seed, n)
+    for i, s in enumerate(o):
+        s["points"] = (s["points"] * 4)[:4]
+        if i in (0, n - 1): s["layout"] = "title_hero"
+    return o
+
+def _rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024   # KiB on Linux
+
+def _phases(pb, ae, o, theme, style):
+    """One build with inject / add_transition / save wrapped in timers; ms per phase."""
+    spent = {"inject": 0.0, "add_transition": 0.0, "save": 0.0}
+    def timed(name, fn):
+        def wrapper(*a, **kw):
+            t0 = time.perf_counter()
+            try: return fn(*a, **kw)
+            finally: spent[name] += time.perf_counter() - t0
+        return wrapper
+    orig = ae.AnimSequence.inject, pb.add_transition, pb.save_presentation
+    ae.AnimSequence.inject = timed("inject", orig[0])
+    pb.add_transition      = timed("add_transition", orig[1])
+    pb.save_presentation   = timed("save", orig[2])
+    try:
+        t0 = time.perf_counter(); pb.build_ppt(o, theme, style); total = time.perf_counter() - t0
+    finally:
+        ae.AnimSequence.inject, pb.add_transition, pb.save_presentation = orig
+    ms = {k: round(v * 1e3, 2) for k, v in spent.items()}
+    ms["render"] = round(total * 1e3 - sum(ms.values()), 2)
+    return ms
+
+def measure(style, n, repeat):
+    """Runs in its own process."""
+    import anim_engine as ae
+    from agent import ppt_builder as pb
+    from agent.slide_cache import cache
+    from themes import THEMES
+    cache.max_bytes = 0
+    theme, o = THEMES[0], outline(n)
+    pb.build_ppt(outline(3, seed=1), theme, style)   # imports, base deck, shape prototypes
+    rss0 = _rss_mb()
+    walls = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); blob = pb.build_ppt(o, theme, style); walls.append(time.perf_counter() - t0)
+    rss = _rss_mb()
+    tracemalloc.start()
+    pb.build_ppt(o, theme, style)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    wall = statistics.median(walls)
+    return {"template": style, "slides": n,
+            "wall_ms": round(wall * 1e3, 2), "wall_ms_min": round(min(walls) * 1e3, 2),
+            "per_slide_ms": round(wall * 1e3 / n, 3),
+            "peak_rss_mb": round(rss, 1), "rss_growth_mb": round(rss - rss0, 1),
+            "alloc_peak_kb": peak // 1024, "alloc_retained_kb": retained // 1024,
+            "size_bytes": len(blob),
+            "phases_ms": _phases(pb, ae, o, theme, style)}
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def compare(rows, base_path, threshold):
+    with open(base_path) as f: base = {(r["template"], r["slides"]): r for r in json.load(f)["results"]}
+    worse = 0
+    print(f"\nvs {base_path}")
+    for r in rows:
+        b = base.get((r["template"], r["slides"]))
+        if b is None: continue
+        ratio = r["wall_ms"] / b["wall_ms"]
+        flag = "  SLOWER" if ratio > threshold else ""
+        worse += bool(flag)
+        print(f"{r['template']:11s} {r['slides']:4d}  {b['wall_ms']:9.1f} -> {r['wall_ms']:9.1f} ms  {ratio:5.2f}x{flag}")
+    return worse
+
+def main():
+    from agent.ppt_builder import TEMPLATES
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--slides", default="5,10,25,50,100,200")
+    ap.add_argument("--templates", default=",".join(TEMPLATES))
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--out")
+    ap.add_argument("--compare")
+    ap.add_argument("--threshold", type=float, default=1.15, help="wall-time ratio counted as a regression")
+    a = ap.parse_args()
+    sizes = [int(s) for s in a.slides.split(",")]
+    styles = [s for s in a.templates.split(",") if s in TEMPLATES]
+
+    rows = []
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'template':11s} {'slides':>6s} {'wall ms':>9s} {'ms/slide':>8s} {'rss MB':>7s} {'alloc KB':>9s} "
+          f"{'size KB':>8s}   inject / transition / save / render ms")
+    for style in styles:
+        for n in sizes:
+            with ctx.Pool(1) as pool:
+                r = pool.apply(measure, (style, n, a.repeat))
+            rows.append(r); p = r["phases_ms"]
+            print(f"{style:11s} {n:6d} {r['wall_ms']:9.1f} {r['per_slide_ms']:8.2f} {r['peak_rss_mb']:7.1f} "
+                  f"{r['alloc_peak_kb']:9d} {r['size_bytes'] // 1024:8d}   "
+                  f"{p['inject']:.1f} / {p['add_transition']:.1f} / {p['save']:.1f} / {p['render']:.1f}", flush=True)
+
+    if a.out:
+        doc = {"commit": _commit(), "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+               "python": platform.python_version(), "machine": platform.platform(), "cpus": os.cpu_count(),
+               "repeat": a.repeat, "results": rows}
+        with open(a.out, "w") as f: json.dump(doc, f, indent=1)
+        print(f"\nwrote {a.out}")
+    if a.compare:
+        sys.exit(1 if compare(rows, a.compare, a.threshold) else 0)
+
+if __name__ == "__main__":
+    main()
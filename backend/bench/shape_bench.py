@@ -0,0 +1,84 @@
+"""
+shape_bench.py — per-shape cost of the ppt_builder helpers (rect, rrect,
+oval, txt, bullets) on the prototype fast path vs the python-pptx proxies
+they used to call, plus a check that both write the same <p:sp> XML.
+
+    cd backend && python bench/shape_bench.py [--shapes 400] [--per-slide 16] [--rounds 9]
+"""
+import argparse, gc, os, statistics, sys, time
+from types import SimpleNamespace
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agent"))
+from lxml import etree
+from pptx import Presentation
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+from agent import ppt_builder as pb
+
+C = pb.rgb("#3A7BD5"); TH = SimpleNamespace(font_body="Inter", body_color=pb.rgb("#E0E0E0"))
+PTS = ["Latency down 40%", "Cache <hit> & miss", "Tabs\tand\x07bells", "Fourth point"]
+
+def slow(kind):
+    """The same helper, written against python-pptx's shape proxies (the pre-fast-path code)."""
+    def call(s, i):
+        l, t, w, h = Inches(i % 7) + 0.5, Inches(i % 5), Inches(2.25), Inches(0.8)
+        if kind == "rect":    return pb._pptx_auto(1)(s, x=l, y=t, cx=w, cy=h, c=C)
+        if kind == "oval":    return pb._pptx_auto(9)(s, x=l, y=t, cx=w, cy=h, c=C)
+        if kind == "rrect":   return pb._pptx_outline(s, x=l, y=t, cx=w, cy=h, c=C, lw=Pt(1.5))
+        if kind == "txt":
+            return pb._pptx_txt(i % 2 == 0, False, PP_ALIGN.CENTER, i % 3 == 0, True)(
+                s, x=l, y=t, cx=w, cy=h, c=C, fn="Inter", sz=10.5, text=f"Title {i}\x0b")
+        el = pb._pptx_bullets(True, True)(s, x=l, y=t, cx=w, cy=h, c=TH.body_color, fn="Inter", sz=13, text="▸  " + PTS[0])
+        tf = s.shapes[-1].text_frame
+        for p in PTS[1:]:
+            para = tf.add_paragraph(); para.alignment = PP_ALIGN.LEFT; para.space_before = Pt(8)
+            r = para.add_run(); r.text = "▸  " + p; r.font.name = "Inter"; r.font.size = Pt(13); r.font.color.rgb = TH.body_color
+        return el
+    return call
+
+def fast(kind):
+    def call(s, i):
+        l, t, w, h = Inches(i % 7) + 0.5, Inches(i % 5), Inches(2.25), Inches(0.8)
+        if kind == "rect":    return pb.rect(s, l, t, w, h, C)
+        if kind == "oval":    return pb.oval(s, l, t, w, h, C)
+        if kind == "rrect":   return pb.rrect(s, l, t, w, h, C, lc=C)
+        if kind == "txt":
+            return pb.txt(s, f"Title {i}\x0b", l, t, w, h, "Inter", 10.5, C, bold=i % 2 == 0,
+                          align=PP_ALIGN.CENTER, wrap=i % 3 == 0)
+        return pb.bullets(s, PTS, l, t, w, h, TH)
+    return call
+
+def slide():
+    prs = Presentation(); return prs, prs.slides.add_slide(prs.slide_layouts[6])
+
+def one_pass(fn, n, per):
+    slides = [slide() for _ in range(0, n, per)]   # new-shape ids scan the slide, so keep it template-sized
+    gc.collect(); gc.disable()
+    t0 = time.perf_counter()
+    for i in range(n): fn(slides[i // per][1], i)
+    dt = time.perf_counter() - t0; gc.enable()
+    return dt / n * 1e6, [s for _, s in slides]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--shapes", type=int, default=400)
+    ap.add_argument("--per-slide", type=int, default=16)
+    ap.add_argument("--rounds", type=int, default=9)
+    a = ap.parse_args()
+    ok = True
+    print(f"{'helper':8s} {'python-pptx':>12s} {'prototype':>10s}  speed-up  same XML")
+    for kind in ("rect", "oval", "rrect", "txt", "bullets"):
+        fast(kind)(slide()[1], 0)   # build the prototype outside the timed region
+        times = {"slow": [], "fast": []}; trees = {}
+        for _ in range(a.rounds):   # interleaved so allocator drift hits both alike
+            for name, fn in (("slow", slow(kind)), ("fast", fast(kind))):
+                us, s = one_pass(fn, a.shapes, a.per_slide); times[name].append(us); trees[name] = s
+        same = [etree.tostring(s.shapes._spTree) for s in trees["slow"]] == \
+               [etree.tostring(s.shapes._spTree) for s in trees["fast"]]
+        ok &= same
+        sl, fa = statistics.median(times["slow"]), statistics.median(times["fast"])
+        print(f"{kind:8s} {sl:9.1f} µs {fa:7.1f} µs   {sl / fa:5.2f}x   {same}")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+jobs.py — background deck generation for POST /jobs.
+
+A job is queued on the bounded `workers.jobs` gate, runs the normal
+outline → deck pipeline (back in "queued" for as long as the LLM or build
+pool it needs is full of HTTP traffic), and leaves its .pptx in a JobStore:
+a directory of result files capped by total size, with TTL eviction. Job
+state is written next to the result (`<id>.json`) on every change, so any
+API worker that shares the directory can answer GET /jobs/{id}. The deck's
+outline is kept too (`<id>.outline.json`) so single slides can be edited
+later, and a profiled job's collapsed stacks (`<id>.folded`, see
+profiler.py).
+
+Reads treat a file past its TTL as gone, whether or not it has been deleted
+yet; sweeper(), started in main.py's lifespan, evicts every PPT_JOB_SWEEP
+seconds so an idle server gives the disk back too.
+
+Config (env):
+    PPT_JOB_DIR       result directory            (default <tmp>/ppt-jobs)
+    PPT_JOB_STORE_MB  total size cap              (default 512)
+    PPT_JOB_TTL       seconds a result is kept    (default 3600)
+    PPT_JOB_SWEEP     seconds between evictions   (default 60)
+"""
+import asyncio, json, os, random, tempfile, time, traceback, uuid, weakref
+import workers, metrics
+
+STAGES = ("queued", "outline", "build", "store", "done")
+RETRY_MIN, RETRY_MAX = 0.25, 5.0   # backoff while a pool a job needs is full
+
+
+class JobStore:
+    def __init__(self, root, max_bytes, ttl):
+        self.root = root; self.max_bytes = max_bytes; self.ttl = ttl
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, job_id, ext):
+        return os.path.join(self.root, f"{job_id}.{ext}")
+
+    @staticmethod
+    def valid_id(job_id):
+        return len(job_id) == 32 and all(c in "0123456789abcdef" for c in job_id)
+
+    def _write(self, path, data):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f: f.write(data)
+        os.replace(tmp, path)
+
+    def _live(self, job_id, ext):
+        """The file's path, or None if it is missing or past its TTL."""
+        if not self.valid_id(job_id): return None
+        path = self._path(job_id, ext)
+        try: return path if time.time() - os.stat(path).st_mtime <= self.ttl else None
+        except OSError: return None
+
+    def staging(self, job_id):
+        """Where a job writes its deck before commit() publishes it."""
+        return f"{self._path(job_id, 'pptx')}.{os.getpid()}.tmp"
+
+    def save_state(self, state):
+        self._write(self._path(state["id"], "json"), json.dumps(state).encode())
+
+    def load_state(self, job_id):
+        path = self._live(job_id, "json")
+        if path is None: return None
+        try:
+            with open(path) as f: return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_outline(self, job_id, outline):
+        self._write(self._path(job_id, "outline.json"), json.dumps(outline).encode())
+
+    def load_outline(self, job_id):
+        path = self._live(job_id, "outline.json")
+        if path is None: return None
+        try:
+            with open(path) as f: return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_profile(self, job_id, text):
+        self._write(self._path(job_id, "folded"), text.encode())
+
+    def profile_file(self, job_id):
+        return self._live(job_id, "folded")
+
+    def commit(self, job_id):
+        """Publish the staged deck; returns its size."""
+        path = self._path(job_id, "pptx")
+        os.replace(self.staging(job_id), path)
+        self.evict()
+        return os.path.getsize(path)
+
+    def file(self, job_id):
+        return self._live(job_id, "pptx")
+
+    def evict(self):
+        """Drop expired jobs, then the oldest results until under the size cap."""
+        now = time.time(); results = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            try: st = os.stat(path)
+            except OSError: continue
+            if now - st.st_mtime > self.ttl:
+                self._remove(path); continue
+            if name.endswith(".pptx"): results.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in results)
+        for _, size, path in sorted(results):
+            if total <= self.max_bytes: break
+            stem = path[:-len("pptx")]
+            self._remove(path); self._remove(stem + "json"); self._remove(stem + "outline.json")
+            self._remove(stem + "folded"); total -= size
+
+    @staticmethod
+    def _remove(path):
+        try: os.remove(path)
+        except OSError: pass
+
+
+class JobManager:
+    def __init__(self, store):
+        self.store = store
+        self._jobs  = {}     # id -> state dict, for jobs started by this process
+        self._tasks = set()  # strong refs so running tasks are not collected
+        self._edit_locks = weakref.WeakValueDictionary()
+
+    def submit(self, work, meta, profile=None):
+        """
+        Queue `work(progress, dest)` — a coroutine function that writes the
+        pptx to the path `dest` and returns its outline — and return the new
+        job's state. Raises workers.Overloaded if full. The job's task keeps
+        the submitting request's ID for its log lines. `profile`, the
+        profiler.Sampler that work samples into, is stored with the result.
+        """
+        workers.jobs.acquire()
+        job_id = uuid.uuid4().hex
+        state = {"id": job_id, "status": "queued", "stage": "queued", "progress": None,
+                 "error": None, "created": time.time(), "finished": None, "size": None,
+                 "request_id": metrics.request_id.get(), **meta}
+        self._jobs[job_id] = state
+        self.store.save_state(state)
+        task = asyncio.create_task(self._run(state, work, profile))
+        self._tasks.add(task); task.add_done_callback(self._tasks.discard)
+        return state
+
+    def get(self, job_id):
+        state = self._jobs.get(job_id)
+        if state is not None and self._expired(state):
+            del self._jobs[job_id]; state = None
+        return state or self.store.load_state(job_id)
+
+    def _expired(self, state):
+        last = state.get("edited") or state["finished"]
+        return last is not None and time.time() - last > self.store.ttl
+
+    def forget_expired(self):
+        """Drop in-memory state for jobs the store has expired."""
+        for jid in [j for j, s in self._jobs.items() if self._expired(s)]:
+            del self._jobs[jid]
+
+    def _update(self, state, **changes):
+        state.update(changes)
+        self.store.save_state(state)
+
+    async def _run(self, state, work, profile=None):
+        def progress(stage, **info):
+            if stage == "slide":
+                # pipelined builds render while the outline streams in
+                self._update(state, stage="build",
+                             progress={"slides_done": info["done"], "slides_total": info["total"]})
+            else:
+                self._update(state, stage=stage)
+        try:
+            async with workers.jobs.gate:
+                outline = await self._admitted(state, work, progress)
+                self._update(state, stage="store")
+                if outline is not None: self.store.save_outline(state["id"], outline)
+                if profile is not None: self.store.save_profile(state["id"], profile.collapsed())
+                size = await asyncio.to_thread(self.store.commit, state["id"])
+                self._update(state, status="done", stage="done", size=size, finished=time.time())
+        except Exception as e:
+            metrics.log(traceback.format_exc())
+            JobStore._remove(self.store.staging(state["id"]))
+            self._update(state, status="error", error=str(e), finished=time.time())
+        finally:
+            workers.jobs.release()
+            self.forget_expired()
+
+    async def _admitted(self, state, work, progress):
+        """
+        Run work, waiting out backpressure: an accepted job that finds the LLM
+        or build pool full (Overloaded, raised before that step starts) goes
+        back to "queued" and tries again with jittered backoff, not to "error".
+        """
+        delay = RETRY_MIN
+        while True:
+            self._update(state, status="running")
+            try:
+                return await work(progress, self.store.staging(state["id"]))
+            except workers.Overloaded as e:
+                JobStore._remove(self.store.staging(state["id"]))
+                self._update(state, status="queued", stage="queued", progress=None)
+                metrics.log(f"[Jobs] {state['id']} waiting: {e}")
+                await asyncio.sleep(delay * random.uniform(0.5, 1))
+                delay = min(delay * 2, RETRY_MAX)
+
+    async def edit(self, state, work):
+        """
+        Replace a finished job's deck: `work(src, dest, outline)` reads the
+        current pptx at `src` and its outline (None if the job kept none),
+        writes the new deck to `dest` and returns the new outline. Edits of
+        one job run one at a time in this process.
+        """
+        job_id = state["id"]
+        lock = self._edit_locks.get(job_id)
+        if lock is None: lock = self._edit_locks[job_id] = asyncio.Lock()
+        async with lock:
+            src, dest = self.store.file(job_id), self.store.staging(job_id)
+            if src is None: raise FileNotFoundError("Result expired")
+            try:
+                outline = await work(src, dest, self.store.load_outline(job_id))
+                size = await asyncio.to_thread(self.store.commit, job_id)
+            except BaseException:
+                JobStore._remove(dest); raise
+            self.store.save_outline(job_id, outline)
+            self._update(state, size=size, edits=state.get("edits", 0) + 1, edited=time.time())
+        return state
+
+
+store = JobStore(
+    os.getenv("PPT_JOB_DIR") or os.path.join(tempfile.gettempdir(), "ppt-jobs"),
+    max_bytes=int(os.getenv("PPT_JOB_STORE_MB", "512")) * 1024 * 1024,
+    ttl=float(os.getenv("PPT_JOB_TTL", "3600")),
+)
+manager = JobManager(store)
+
+SWEEP = float(os.getenv("PPT_JOB_SWEEP", "60"))
+
+async def sweeper(interval=SWEEP):
+    """Evict expired and over-cap results every `interval` seconds, until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(store.evict)
+            manager.forget_expired()
+        except Exception:
+            metrics.log(traceback.format_exc())
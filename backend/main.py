@@ -1,14 +1,32 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import Response, JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-import traceback, sys, os
+from pydantic import BaseModel, Field, ValidationError
+from starlette.background import BackgroundTask
+from contextlib import asynccontextmanager
+import asyncio, traceback, json, sys, os, time, zipfile
 
 # Add backend directory to path so ppt_builder can find anim_engine
 sys.path.insert(0, os.path.dirname(__file__))
+import workers, pipeline, jobs, metrics, startup
+from metrics import log
+from workers import Overloaded
+from themes import registry as themes
 
-app = FastAPI(title="AI PPT Generator")
-app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+@asynccontextmanager
+async def lifespan(app):
+    warming = asyncio.create_task(startup.warm_up())   # /ready turns 200 when done
+    sweeping = asyncio.create_task(jobs.sweeper())     # expired job results, even when idle
+    yield
+    warming.cancel(); sweeping.cancel()
+    if "agent.planner" in sys.modules:   # the LLM client exists only once a handler or warm-up imported it
+        await sys.modules["agent.planner"].client.aclose()
+    workers.shutdown()
+
+app = FastAPI(title="AI PPT Generator", lifespan=lifespan)
+app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"],
+                   expose_headers=["X-Request-ID"])
+app.add_middleware(metrics.RequestContext)
 
 TEMPLATES_INFO = {
     "futuristic":  {"name":"Futuristic",  "desc":"Dark cyber-tech, orange accents, glowing circles, grid lines"},
@@ -21,33 +39,38 @@ TEMPLATES_INFO = {
     "neon":        {"name":"Neon Nights", "desc":"Outlined neon shapes, synthwave glow, pulse & flip effects"},
 }
 
-THEMES = {
-    1:  {"name":"Midnight Orange","bg":"#0a0a0f","card_bg":"#13131f","header_bg":"#0f0f1a","title_color":"#ffffff","body_color":"#c8cfe0","muted_color":"#7a8299","accent":"#ff7820","accent2":"#ff4500","font_head":"Trebuchet MS","font_body":"Calibri"},
-    2:  {"name":"Cyber Cyan","bg":"#050d1a","card_bg":"#0a1628","header_bg":"#071220","title_color":"#e0f4ff","body_color":"#a8d8ea","muted_color":"#5a8fa8","accent":"#00d4ff","accent2":"#0099cc","font_head":"Calibri","font_body":"Calibri Light"},
-    3:  {"name":"Neon Green","bg":"#060f06","card_bg":"#0d1f0d","header_bg":"#0a180a","title_color":"#e8ffe8","body_color":"#a8d4a8","muted_color":"#5a8a5a","accent":"#39ff14","accent2":"#00cc00","font_head":"Trebuchet MS","font_body":"Calibri"},
-    4:  {"name":"Electric Purple","bg":"#0a0515","card_bg":"#130a20","header_bg":"#0f0818","title_color":"#f0e8ff","body_color":"#c8a8f0","muted_color":"#8060b0","accent":"#bf5fff","accent2":"#8800ff","font_head":"Calibri","font_body":"Calibri Light"},
-    5:  {"name":"Clean White","bg":"#fafafa","card_bg":"#ffffff","header_bg":"#f0f0f0","title_color":"#111111","body_color":"#333333","muted_color":"#888888","accent":"#ff7820","accent2":"#e05510","font_head":"Trebuchet MS","font_body":"Calibri"},
-    6:  {"name":"Warm Paper","bg":"#fdf8f0","card_bg":"#ffffff","header_bg":"#f5ede0","title_color":"#2c1810","body_color":"#5a3a28","muted_color":"#a07860","accent":"#c8500a","accent2":"#a03800","font_head":"Calibri","font_body":"Calibri Light"},
-    7:  {"name":"Executive Navy","bg":"#1e2761","card_bg":"#253070","header_bg":"#1a2258","title_color":"#ffffff","body_color":"#cadcfc","muted_color":"#8099cc","accent":"#4da6ff","accent2":"#cadcfc","font_head":"Calibri","font_body":"Calibri Light"},
-    8:  {"name":"Black Gold","bg":"#0a0800","card_bg":"#151000","header_bg":"#100c00","title_color":"#ffd700","body_color":"#c8a800","muted_color":"#886e00","accent":"#ffd700","accent2":"#c8a000","font_head":"Calibri","font_body":"Calibri Light"},
-    9:  {"name":"Sepia Classic","bg":"#2c1a00","card_bg":"#3d2a00","header_bg":"#352200","title_color":"#f5deb3","body_color":"#d4af70","muted_color":"#a07840","accent":"#cd853f","accent2":"#8b6914","font_head":"Calibri","font_body":"Calibri Light"},
-    10: {"name":"Synthwave","bg":"#0d0221","card_bg":"#1a0435","header_bg":"#14032a","title_color":"#ff7eee","body_color":"#df73ff","muted_color":"#9940cc","accent":"#08f7fe","accent2":"#09fbd3","font_head":"Trebuchet MS","font_body":"Calibri Light"},
-    11: {"name":"Terminal Green","bg":"#000a00","card_bg":"#001400","header_bg":"#000f00","title_color":"#00ff00","body_color":"#00cc00","muted_color":"#008800","accent":"#00ff44","accent2":"#00cc33","font_head":"Courier New","font_body":"Courier New"},
-    12: {"name":"Misty Mountain","bg":"#c0c8d8","card_bg":"#d0d8e8","header_bg":"#b8c0d0","title_color":"#1a2030","body_color":"#3a4050","muted_color":"#7080a0","accent":"#3060a0","accent2":"#204880","font_head":"Calibri","font_body":"Calibri Light"},
-    13: {"name":"Obsidian","bg":"#080808","card_bg":"#111111","header_bg":"#0d0d0d","title_color":"#ffffff","body_color":"#dddddd","muted_color":"#888888","accent":"#ff8c00","accent2":"#dd5500","font_head":"Trebuchet MS","font_body":"Calibri"},
-    14: {"name":"Neon Tokyo","bg":"#05001a","card_bg":"#0a0030","header_bg":"#070025","title_color":"#ff00aa","body_color":"#cc0088","muted_color":"#880055","accent":"#00eeff","accent2":"#00ccdd","font_head":"Trebuchet MS","font_body":"Calibri Light"},
-    15: {"name":"Rose Gold","bg":"#1a0a0f","card_bg":"#2a1018","header_bg":"#220d14","title_color":"#ffddcc","body_color":"#e8b090","muted_color":"#c07050","accent":"#e8927c","accent2":"#c87060","font_head":"Calibri","font_body":"Calibri Light"},
-}
+MAX_SLIDES = int(os.getenv("PPT_MAX_SLIDES", "60"))   # per deck; larger asks get a 422
 
 class PPTRequest(BaseModel):
     topic: str
-    slides: int = 10
+    slides: int = Field(10, ge=1, le=MAX_SLIDES)
     theme_id: int = 1
     template: str = "futuristic"
+    outline_id: str | None = None   # from /preview — reuse that outline instead of regenerating
+    profile: bool = False           # sample the build (/generate-ppt, /jobs); also X-Profile: 1
+
+class BatchRequest(BaseModel):
+    specs: list[PPTRequest]
+
+class RenderTarget(BaseModel):
+    template: str = "futuristic"
+    theme_id: int = 1
+
+class MultiRenderRequest(BaseModel):
+    targets: list[RenderTarget]
+    outline: list[dict] | None = None   # explicit outline, or…
+    outline_id: str | None = None       # …one from /preview, or…
+    topic: str | None = None            # …generate (cached) from a topic
+    slides: int = Field(10, ge=1, le=MAX_SLIDES)
+
+class SlideEdit(BaseModel):
+    slide: dict | None = None        # new content, merged over the current slide, or…
+    regenerate: bool = False         # …let the model rewrite the slide
+    instruction: str | None = None   # what to change, when regenerating
 
 class PreviewRequest(BaseModel):
     topic: str
-    slides: int = 10
+    slides: int = Field(10, ge=1, le=MAX_SLIDES)
     theme_id: int = 1
     template: str = "futuristic"
 
@@ -55,47 +78,391 @@ class PreviewRequest(BaseModel):
 def list_templates():
     return [{"key": k, **v} for k, v in TEMPLATES_INFO.items()]
 
+def _etag_match(if_none_match, etag):
+    if not if_none_match: return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
 @app.get("/themes")
-def list_themes():
-    return [{"id": k, "name": v["name"], "bg": v["bg"],
-             "accent": v["accent"], "accent2": v["accent2"]} for k, v in THEMES.items()]
+def list_themes(request: Request, tag: str | None = None):
+    """
+    Theme picker data — every theme, or one tag's (?tag=dark). The JSON is
+    serialised once at startup; a matching If-None-Match gets a bare 304.
+    """
+    try: body, etag = themes.listing(tag)
+    except KeyError: raise HTTPException(status_code=404, detail=f"Unknown tag, use one of: {', '.join(themes.tags)}")
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if _etag_match(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+BATCH_MAX = int(os.getenv("PPT_BATCH_MAX", "20"))
+PPTX_MIME = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+def _fname(topic, template): return f"{topic.replace(' ','_')}_{template}.pptx"
+
+def _busy(e: Overloaded):
+    return HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+def _invalid(e: ValidationError, loc=()):
+    """422 for slide content that is not a usable slide, shaped like FastAPI's own."""
+    return HTTPException(status_code=422, detail=[{**err, "loc": (*loc, *err["loc"])}
+                                                  for err in e.errors(include_url=False, include_context=False)])
 
 @app.post("/preview")
 async def preview_ppt(req: PreviewRequest):
     try:
-        from agent.planner import generate_outline
-        outline = generate_outline(req.topic, req.slides)
-        theme = THEMES.get(req.theme_id, THEMES[1])
+        oid, outline = await pipeline.get_outline(req.topic, req.slides)
+        theme = themes.get(req.theme_id)
         return JSONResponse({
+            "outline_id": oid,
             "outline": outline,
             "theme": theme,
             "template": req.template,
         })
+    except Overloaded as e:
+        raise _busy(e)
     except Exception as e:
-        print(traceback.format_exc())
+        log(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/preview-stream")
+async def preview_stream(req: PreviewRequest):
+    """
+    NDJSON: one {"index", "slide"} line per slide as the model finishes it,
+    then {"done": true, "outline_id", "theme", "template"}.
+    """
+    from agent.planner import astream_outline, outline_id
+    from agent.outline_cache import cache
+    oid = outline_id(req.topic, req.slides)
+    cached = await cache.aget(oid)
+    if cached is None:
+        try: workers.llm.check()
+        except Overloaded as e: raise _busy(e)
+
+    def line(obj): return json.dumps(obj) + "\n"
+
+    async def lines():
+        try:
+            outline = cached or []
+            if cached is not None:
+                for i, slide in enumerate(cached):
+                    yield line({"index": i, "slide": slide})
+            else:
+                async for slide in workers.llm.stream(astream_outline, req.topic, req.slides):
+                    yield line({"index": len(outline), "slide": slide})
+                    outline.append(slide)
+                if outline: await cache.aput(oid, outline)
+            yield line({"done": True, "outline_id": oid if outline else None,
+                        "theme": themes.get(req.theme_id), "template": req.template})
+        except Exception as e:
+            log(traceback.format_exc())
+            yield line({"error": str(e)})
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+def _sampler(req, request):
+    """A profiler.Sampler if the request asks for a profile, else None; 403 when profiling is off."""
+    if not (req.profile or request.headers.get("x-profile") == "1"): return None
+    import profiler
+    if not profiler.ALLOWED: raise HTTPException(status_code=403, detail="Profiling is disabled (PPT_PROFILE)")
+    return profiler.Sampler()
+
 @app.post("/generate-ppt")
-async def generate_ppt(req: PPTRequest):
+async def generate_ppt(req: PPTRequest, request: Request):
+    """
+    The deck as a .pptx — or, when profiled, a zip of the deck and its
+    collapsed-stack profile (.folded).
+    """
+    profile = _sampler(req, request)
+    # The deck is written to a spool file and streamed from disk, which is removed once sent
+    path = pipeline.spool_path()
     try:
-        from agent.planner import generate_outline
-        from agent.ppt_builder import build_ppt
-        print(f"[1/3] Generating outline '{req.topic}' ({req.slides} slides, template={req.template})...")
-        outline = generate_outline(req.topic, req.slides)
-        theme = THEMES.get(req.theme_id, THEMES[1])
-        print(f"[2/3] Theme: {theme['name']}")
-        print(f"[3/3] Building {req.template} template...")
-        ppt_bytes = build_ppt(outline, theme, req.template)
-        print("Done!")
-        fname = f"{req.topic.replace(' ','_')}_{req.template}.pptx"
-        return Response(
-            content=ppt_bytes,
-            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            headers={"Content-Disposition": f"attachment; filename={fname}"}
+        theme = themes.get(req.theme_id)
+        await pipeline.generate_deck(req.topic, req.slides, theme, req.template, path, req.outline_id,
+                                     profile=profile)
+        if profile is not None:
+            name = _fname(req.topic, req.template)
+            return _zip_response([_ready(name, path), _ready(name[:-len(".pptx")] + ".folded",
+                                                             profile.collapsed().encode())],
+                                 filename=name[:-len(".pptx")] + "_profile.zip")
+        return FileResponse(
+            path,
+            media_type=PPTX_MIME,
+            headers={"Content-Disposition": f"attachment; filename={_fname(req.topic, req.template)}"},
+            background=BackgroundTask(pipeline.discard, path),
         )
+    except Overloaded as e:
+        pipeline.discard(path)
+        raise _busy(e)
+    except Exception as e:
+        pipeline.discard(path)
+        log(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _job_view(state):
+    done = state["status"] == "done"
+    view = {**state, "status_url": f"/jobs/{state['id']}",
+            "file_url": f"/jobs/{state['id']}/file" if done else None}
+    if state.get("profiled"): view["profile_url"] = f"/jobs/{state['id']}/profile" if done else None
+    return view
+
+class _ZipSink:
+    """Write-only file for zipfile; drain() hands back what was written since the last call."""
+    def __init__(self): self._parts = []
+    def write(self, b): self._parts.append(bytes(b)); return len(b)
+    def flush(self): pass
+    def drain(self):
+        out = b"".join(self._parts); self._parts.clear(); return out
+
+ZIP_CHUNK = 256 * 1024
+
+def _discard_result(task):
+    if not task.cancelled() and task.exception() is None:
+        name, data = task.result()
+        if isinstance(data, str): pipeline.discard(data)
+
+def _ready(name, data):
+    fut = asyncio.get_running_loop().create_future(); fut.set_result((name, data))
+    return fut
+
+def _zip_response(tasks, filename="decks.zip"):
+    """
+    Stream task results into a zip as each finishes. A task yields (name,
+    spool path) for a deck, copied in ZIP_CHUNK pieces, or (name, bytes).
+    """
+    async def body():
+        sink = _ZipSink()
+        try:
+            with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as zf:   # pptx parts are already deflated
+                for fut in asyncio.as_completed(tasks):
+                    name, data = await fut
+                    info = zipfile.ZipInfo(name, time.localtime()[:6])
+                    if isinstance(data, bytes):
+                        zf.writestr(info, data)
+                    else:
+                        info.file_size = os.path.getsize(data)
+                        with open(data, "rb") as src, zf.open(info, "w") as dst:
+                            while chunk := src.read(ZIP_CHUNK):
+                                dst.write(chunk)
+                                yield sink.drain()
+                    yield sink.drain()
+            yield sink.drain()
+        finally:
+            # spool files of decks sent, unsent, or still building if the client left
+            for t in tasks:
+                if t.done(): _discard_result(t)
+                else: t.add_done_callback(_discard_result)
+    return StreamingResponse(body(), media_type="application/zip",
+                             headers={"Content-Disposition": f"attachment; filename={filename}"})
+
+@app.post("/generate-batch")
+async def generate_batch(req: BatchRequest):
+    """
+    Several decks as one streamed zip. Specs with the same topic and slide
+    count share one outline; decks render in parallel on the build pool and
+    enter the zip in completion order. A deck whose outline or build failed
+    becomes a .error.txt entry; only a batch with no outline at all fails.
+    """
+    from agent.ppt_builder import build_ppt
+    specs = req.specs
+    if not specs or len(specs) > BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"specs must hold 1-{BATCH_MAX} entries")
+    def key(s): return (s.topic.strip(), s.slides, s.outline_id)
+    try:
+        workers.build.check(len(specs))
+        keys = list(dict.fromkeys(key(s) for s in specs))
+        log(f"[Batch] {len(specs)} decks, {len(keys)} distinct outlines")
+        results = await asyncio.gather(*(pipeline.get_outline(*k) for k in keys), return_exceptions=True)
+        # a failed outline costs only its own decks: each becomes an .error.txt entry
+        outlines = {k: r if isinstance(r, BaseException) else r[1] for k, r in zip(keys, results)}
+        failed = [r for r in results if isinstance(r, BaseException)]
+        if len(failed) == len(keys):
+            raise next((r for r in failed if isinstance(r, Overloaded)), failed[0])
+        workers.build.acquire(len(specs))
+    except Overloaded as e:
+        raise _busy(e)
+    except Exception as e:
+        log(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def build(i, s):
+        name = f"{i+1:02d}_{_fname(s.topic, s.template)}"
+        path = pipeline.spool_path()
+        try:
+            outline = outlines[key(s)]
+            if isinstance(outline, BaseException):
+                pipeline.discard(path); log(f"[Batch] no outline for {name}: {outline!r}")
+                return name[:-len(".pptx")] + ".error.txt", f"Outline failed: {outline}".encode()
+            theme = themes.get(s.theme_id)
+            return name, await workers.build.submit(build_ppt, outline, theme, s.template, path)
+        except Exception as e:
+            pipeline.discard(path)
+            log(traceback.format_exc())
+            return name[:-len(".pptx")] + ".error.txt", str(e).encode()
+        finally:
+            workers.build.release()
+    # Started before the response so slots are released even if the client goes away
+    return _zip_response([asyncio.ensure_future(build(i, s)) for i, s in enumerate(specs)])
+
+@app.post("/render-multi")
+async def render_multi(req: MultiRenderRequest):
+    """
+    One outline rendered into several template/theme pairs, streamed as a
+    zip. The outline is checked and cleaned, and its slide plan worked out,
+    once; each template then renders concurrently on the build pool.
+    """
+    from agent.planner import clean_slide
+    from agent.outline_parse import Slide
+    from agent.ppt_builder import build_planned, plan_deck
+    if not req.targets or len(req.targets) > BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"targets must hold 1-{BATCH_MAX} entries")
+    try:
+        if req.outline is not None:
+            outline = []
+            for i, item in enumerate(req.outline):
+                try: outline.append(clean_slide(Slide.model_validate(item).model_dump(exclude_unset=True), i))
+                except ValidationError as e: raise _invalid(e, ("body", "outline", i))
+        elif req.outline_id or req.topic:
+            oid, outline = await pipeline.cached_outline(req.topic or "", req.slides, req.outline_id)
+            if outline is None:
+                if not req.topic: raise HTTPException(status_code=404, detail="Unknown or expired outline_id")
+                _, outline = await pipeline.get_outline(req.topic, req.slides)
+        else:
+            raise HTTPException(status_code=400, detail="Give outline, outline_id or topic")
+        if not outline: raise HTTPException(status_code=400, detail="Outline is empty")
+        plan = plan_deck(outline)
+        workers.build.acquire(len(req.targets))
+    except Overloaded as e:
+        raise _busy(e)
+    except HTTPException:
+        raise
     except Exception as e:
-        print(traceback.format_exc())
+        log(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
+    stem = outline[0].get("title") or "deck"
+    async def render(i, t):
+        name = f"{i+1:02d}_{_fname(stem, t.template)[:-len('.pptx')]}_theme{t.theme_id}.pptx"
+        path = pipeline.spool_path()
+        try:
+            theme = themes.get(t.theme_id)
+            return name, await workers.build.submit(build_planned, outline, plan, theme, t.template, path)
+        except Exception as e:
+            pipeline.discard(path)
+            log(traceback.format_exc())
+            return name[:-len(".pptx")] + ".error.txt", str(e).encode()
+        finally:
+            workers.build.release()
+    return _zip_response([asyncio.ensure_future(render(i, t)) for i, t in enumerate(req.targets)])
+
+@app.post("/jobs", status_code=202)
+async def create_job(req: PPTRequest, request: Request):
+    """
+    Queue a deck build; poll GET /jobs/{id}, then download GET /jobs/{id}/file
+    (and GET /jobs/{id}/profile for a profiled build).
+    """
+    theme = themes.get(req.theme_id)
+    profile = _sampler(req, request)
+    async def work(progress, dest):
+        return await pipeline.generate_deck(req.topic, req.slides, theme, req.template, dest,
+                                            req.outline_id, progress, profile)
+    meta = {"topic": req.topic, "slides": req.slides, "template": req.template,
+            "theme_id": req.theme_id, "filename": _fname(req.topic, req.template)}
+    if profile is not None: meta["profiled"] = True
+    try:
+        state = jobs.manager.submit(work, meta, profile)
+    except Overloaded as e:
+        raise _busy(e)
+    return _job_view(state)
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    state = jobs.manager.get(job_id)
+    if state is None: raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return _job_view(state)
+
+@app.get("/jobs/{job_id}/file")
+def job_file(job_id: str):
+    state = jobs.manager.get(job_id)
+    if state is None: raise HTTPException(status_code=404, detail="Unknown or expired job")
+    if state["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {state['status']}")
+    path = jobs.store.file(job_id)
+    if path is None: raise HTTPException(status_code=404, detail="Result expired")
+    return FileResponse(path, media_type=PPTX_MIME, filename=state["filename"])
+
+@app.get("/jobs/{job_id}/profile")
+def job_profile(job_id: str):
+    """Collapsed stacks of a profiled job's build — for flamegraph.pl, speedscope or inferno."""
+    state = jobs.manager.get(job_id)
+    if state is None: raise HTTPException(status_code=404, detail="Unknown or expired job")
+    if not state.get("profiled"): raise HTTPException(status_code=404, detail="Job was not profiled")
+    if state["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {state['status']}")
+    path = jobs.store.profile_file(job_id)
+    if path is None: raise HTTPException(status_code=404, detail="Result expired")
+    return FileResponse(path, media_type="text/plain", filename=state["filename"][:-len(".pptx")] + ".folded")
+
+@app.post("/jobs/{job_id}/slides/{index}")
+async def edit_job_slide(job_id: str, index: int, req: SlideEdit):
+    """
+    Change slide `index` (1-based) of a finished job's deck, with new content
+    or {"regenerate": true}. Only that slide goes to the LLM and is
+    re-rendered; the stored deck is replaced and GET /jobs/{id}/file serves it.
+    """
+    state = jobs.manager.get(job_id)
+    if state is None: raise HTTPException(status_code=404, detail="Unknown or expired job")
+    if state["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {state['status']}")
+    if (req.slide is not None) == req.regenerate:
+        raise HTTPException(status_code=400, detail="Give either slide or regenerate")
+    theme = themes.get(state.get("theme_id"))
+    edited = {}
+    async def work(src, dest, outline):
+        if outline is None: raise HTTPException(status_code=409, detail="This job kept no outline to edit")
+        if not 1 <= index <= len(outline):
+            raise HTTPException(status_code=400, detail=f"index must be 1-{len(outline)}")
+        outline = await pipeline.edit_slide(src, dest, outline, index, theme, state["template"], state["topic"],
+                                            req.slide, req.instruction)
+        edited["slide"] = outline[index-1]
+        return outline
+    try:
+        state = await jobs.manager.edit(state, work)
+    except Overloaded as e:
+        raise _busy(e)
+    except HTTPException:
+        raise
+    except ValidationError as e:
+        raise _invalid(e, ("body", "slide"))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Result expired")
+    except Exception as e:
+        log(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=str(e))
+    return {**_job_view(state), "slide": edited["slide"]}
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """Stage latency histograms in Prometheus text format (see metrics.py)."""
+    return Response(metrics.exposition(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/ready")
+def ready():
+    """Readiness: 503 until the startup warm-up is done (see startup.py). /health is liveness."""
+    return JSONResponse(startup.status, status_code=200 if startup.status["ready"] else 503)
+
 @app.get("/health")
-def health(): return {"status": "running"}
\ No newline at end of file
+def health():
+    return {"status": "running", "pools": workers.stats(), "slide_cache": _slide_cache_stats()}
+
+def _slide_cache_stats():
+    """
+    Slide cache totals across every process that rendered for this one, from
+    the counters DeckBuilder ships back — each build process has its own cache.
+    """
+    def by_result(name): return {dict(k).get("result"): n for k, n in metrics.registry.counter(name).items()}
+    looked, size = by_result("ppt_slide_cache_total"), by_result("ppt_slide_cache_bytes_total")
+    hits, misses = looked.get("hit", 0), looked.get("miss", 0)
+    return {"hits": hits, "misses": misses, "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "bytes_hit": size.get("hit", 0), "bytes_stored": size.get("stored", 0)}
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""
+metrics.py — per-stage latency histograms, request IDs and /metrics.
+
+Stages time themselves with span(name, **labels); the result lands in a
+Prometheus-style histogram, rendered as text exposition by exposition():
+
+    ppt_request_seconds         whole HTTP request           {method, route, status}
+    ppt_llm_ttfb_seconds        LLM call to first delta      {kind}
+    ppt_llm_seconds             LLM call, complete           {kind}
+    ppt_outline_parse_seconds   JSON parse + clean_slide     {kind}
+    ppt_slide_render_seconds    one slide                    {template, layout, cache}
+    ppt_anim_inject_seconds     AnimSequence.inject
+    ppt_pptx_save_seconds       prs.save
+
+and counters, bumped with count(name, **labels):
+
+    ppt_outline_slides_total     outline slides by how they were got   {outcome}
+    ppt_slide_cache_total        DeckBuilder slide cache lookups       {result=hit|miss}
+    ppt_slide_cache_bytes_total  slide XML grafted from / stored into
+                                 the slide cache                       {result=hit|stored}
+
+Every request gets an ID — the client's X-Request-ID or a fresh one — held in
+a contextvar, echoed in the response and prefixed to log() lines. Pool.submit
+carries it into build processes and threads; build processes send their
+observations back with the task's result, so /metrics covers the whole server
+whichever process rendered the slide.
+
+Config (env):
+    PPT_METRICS   0 = spans cost nothing and /metrics is empty   (default 1)
+"""
+import contextvars, os, threading, time, uuid
+from bisect import bisect_left
+from contextlib import contextmanager
+
+ENABLED = os.getenv("PPT_METRICS", "1") != "0"
+BUCKETS = (.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10, 30, 60, 120)
+
+HELP = {
+    "ppt_request_seconds":       "HTTP request latency",
+    "ppt_llm_ttfb_seconds":      "LLM call time to first streamed delta",
+    "ppt_llm_seconds":           "LLM call total time",
+    "ppt_outline_parse_seconds": "Outline JSON parse and cleanup",
+    "ppt_slide_render_seconds":  "Slide render (cache=hit: grafted from the slide cache)",
+    "ppt_anim_inject_seconds":   "AnimSequence.inject",
+    "ppt_pptx_save_seconds":     "Presentation save (zip + serialise)",
+    "ppt_outline_slides_total":  "Outline slides: parsed, refilled (re-requested alone) or dropped",
+    "ppt_slide_cache_total":     "Slide cache lookups in DeckBuilder, every build process included",
+    "ppt_slide_cache_bytes_total": "Slide XML bytes grafted from (hit) or stored into (stored) the slide cache",
+}
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+# ── histograms ────────────────────────────────────────────────────────────────
+class Registry:
+    """
+    Histograms: name -> sorted label tuple -> [bucket counts..., +Inf count, sum].
+    Counters:   name -> sorted label tuple -> total.
+    """
+    def __init__(self):
+        self._h = {}; self._c = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, labels=(), n=1):
+        with self._lock:
+            row = self._c.setdefault(name, {})
+            row[labels] = row.get(labels, 0) + n
+
+    def observe(self, name, seconds, labels=()):
+        with self._lock:
+            row = self._h.setdefault(name, {}).get(labels)
+            if row is None: row = self._h[name][labels] = [0] * (len(BUCKETS) + 1) + [0.0]
+            row[bisect_left(BUCKETS, seconds)] += 1
+            row[-1] += seconds
+
+    def merge(self, observations):
+        for kind, name, value, labels in observations:
+            if kind == "c": self.inc(name, labels, value)
+            else: self.observe(name, value, labels)
+
+    def counter(self, name):
+        """{label tuple: total} of counter `name`."""
+        with self._lock:
+            return dict(self._c.get(name, {}))
+
+    def exposition(self):
+        out = []
+        with self._lock:
+            for name in sorted(self._c):
+                out.append(f"# HELP {name} {HELP.get(name, name)}\n# TYPE {name} counter")
+                for labels, n in sorted(self._c[name].items()):
+                    lab = ",".join(f'{k}="{_quote(v)}"' for k, v in labels)
+                    out.append(f"{name}{{{lab}}} {n}" if lab else f"{name} {n}")
+            for name in sorted(self._h):
+                out.append(f"# HELP {name} {HELP.get(name, name)}\n# TYPE {name} histogram")
+                for labels, row in sorted(self._h[name].items()):
+                    lab = ",".join(f'{k}="{_quote(v)}"' for k, v in labels)
+                    sep = "," if lab else ""
+                    n = 0
+                    for le, c in zip(BUCKETS, row):
+                        n += c; out.append(f'{name}_bucket{{{lab}{sep}le="{le}"}} {n}')
+                    n += row[len(BUCKETS)]
+                    out.append(f'{name}_bucket{{{lab}{sep}le="+Inf"}} {n}')
+                    out.append(f"{name}_sum{{{lab}}} {row[-1]:.6f}" if lab else f"{name}_sum {row[-1]:.6f}")
+                    out.append(f"{name}_count{{{lab}}} {n}" if lab else f"{name}_count {n}")
+        return "\n".join(out) + "\n"
+
+def _quote(v):
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+registry = Registry()
+
+# While a build process runs a task for the API process, observations and
+# counts collect here and go back with the task's result
+_sink = None
+
+def observe(name, seconds, **labels):
+    if not ENABLED: return
+    key = tuple(sorted(labels.items()))
+    if _sink is not None: _sink.append(("h", name, seconds, key))
+    else: registry.observe(name, seconds, key)
+
+def count(name, n=1, **labels):
+    if not (ENABLED and n): return
+    key = tuple(sorted(labels.items()))
+    if _sink is not None: _sink.append(("c", name, n, key))
+    else: registry.inc(name, key, n)
+
+@contextmanager
+def span(name, **labels):
+    """Time the block into histogram `name`, exceptions included."""
+    if not ENABLED:
+        yield; return
+    t0 = time.perf_counter()
+    try: yield
+    finally: observe(name, time.perf_counter() - t0, **labels)
+
+def exposition():
+    return registry.exposition()
+
+
+# ── request IDs ───────────────────────────────────────────────────────────────
+def new_id():
+    return uuid.uuid4().hex[:16]
+
+def log(*args):
+    """print() with the current request ID in front."""
+    rid = request_id.get()
+    if rid: print(f"[{rid}]", *args)
+    else: print(*args)
+
+
+# ── across executors ──────────────────────────────────────────────────────────
+# run_in_executor copies no context, and a process shares no registry, so
+# Pool.submit runs every task through carried() and hands the result to landed().
+
+class _Shipped:
+    __slots__ = ("value", "observations")
+    def __init__(self, value, observations): self.value = value; self.observations = observations
+
+def carried(pid, rid, fn, *args, **kwargs):
+    """Run fn for process `pid` under request ID `rid`."""
+    global _sink
+    remote = os.getpid() != pid
+    if remote: _sink = []
+    token = request_id.set(rid)
+    try:
+        value = fn(*args, **kwargs)
+    finally:
+        request_id.reset(token)
+        if remote: shipped, _sink = _sink, None
+    return _Shipped(value, shipped) if remote else value
+
+def landed(result):
+    if isinstance(result, _Shipped):
+        registry.merge(result.observations)
+        return result.value
+    return result
+
+
+# ── ASGI middleware ───────────────────────────────────────────────────────────
+class RequestContext:
+    """Sets request_id for the request, echoes X-Request-ID, times the request."""
+    HEADER = b"x-request-id"
+
+    def __init__(self, app): self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        rid = next((v.decode("latin-1")[:64] for k, v in scope["headers"] if k == self.HEADER), None) or new_id()
+        token = request_id.set(rid)
+        status = [500]
+        async def send_with_id(msg):
+            if msg["type"] == "http.response.start":
+                status[0] = msg["status"]
+                msg["headers"] = [*msg.get("headers", []), (self.HEADER, rid.encode("latin-1"))]
+            await send(msg)
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            route = scope.get("route")
+            observe("ppt_request_seconds", time.perf_counter() - t0, method=scope["method"],
+                    route=getattr(route, "path", "unmatched"), status=status[0])
+            request_id.reset(token)
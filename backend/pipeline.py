@@ -0,0 +1,167 @@
+"""
+pipeline.py — outline → deck, shared by the HTTP handlers and the job runner.
+
+Outlines come from the outline cache when possible, and are generated on a
+miss. With the outline in hand the deck renders on the build processes; long
+decks are rendered in slide chunks across idle build processes and merged
+(see build_deck). A single slide of a finished deck can be rewritten and
+re-rendered on its own (see edit_slide).
+
+With PPT_PIPELINED=1 a miss is built pipelined instead: each slide renders as
+soon as the outline stream delivers it (build_streaming). That hides most of
+the render time behind the model on a quiet server, but the renders run on
+threads in the API process, where they hold the GIL against the event loop
+and every other request and cannot use more than one core — so it is off by
+default.
+
+Given a profiler.Sampler, the build steps of a deck are sampled wherever they
+run — render threads here, or the build processes — into that one Sampler.
+
+Decks are written straight to a file (a spool file for HTTP responses, the
+job store for /jobs) by whichever thread or process builds them, so no
+process holds a whole .pptx in memory on the way to the client.
+
+Config (env):
+    PPT_PIPELINED        1 = build cache misses while the outline streams       (default 0)
+    PPT_PARALLEL_SLIDES  decks at least this long render in parallel, 0 = never (default 16)
+    PPT_PART_SLIDES      fewest slides worth shipping to one process            (default 4)
+    PPT_SPOOL_DIR        where finished decks wait to be sent       (default system temp dir)
+"""
+import asyncio, contextlib, os, tempfile
+import workers
+from metrics import log
+
+PIPELINED       = os.getenv("PPT_PIPELINED", "0") == "1"
+PARALLEL_SLIDES = int(os.getenv("PPT_PARALLEL_SLIDES", "16"))
+PART_SLIDES     = max(1, int(os.getenv("PPT_PART_SLIDES", "4")))
+SPOOL_DIR       = os.getenv("PPT_SPOOL_DIR") or None
+
+def spool_path():
+    """A fresh, empty .pptx path for a deck on its way to a response; the caller removes it."""
+    fd, path = tempfile.mkstemp(suffix=".pptx", prefix="deck-", dir=SPOOL_DIR)
+    os.close(fd)
+    return path
+
+def discard(path):
+    try: os.remove(path)
+    except OSError: pass
+
+async def cached_outline(topic, slides, oid=None):
+    """(outline_id, outline or None) — a caller-supplied ID first, then the content key."""
+    from agent.planner import outline_id
+    from agent.outline_cache import cache
+    outline = await cache.aget(oid) if oid else None
+    if outline is None:
+        oid = outline_id(topic, slides)
+        outline = await cache.aget(oid)
+    return oid, outline
+
+async def get_outline(topic, slides, oid=None):
+    """(outline_id, outline) — served from the outline cache, generated only on a miss."""
+    from agent.planner import agenerate_outline
+    from agent.outline_cache import cache
+    oid, outline = await cached_outline(topic, slides, oid)
+    if outline is None:
+        outline = await workers.llm.call(agenerate_outline, topic, slides)
+        await cache.aput(oid, outline)
+    return oid, outline
+
+async def build_streaming(topic, slides, theme, template, dest, on_slide=None, profile=None):
+    """
+    Pipelined build into `dest` (PPT_PIPELINED). The DeckBuilder lives in this
+    process, so its steps run on the render thread pool rather than the build
+    process pool. on_slide(n) is called after each slide is added.
+    """
+    from agent.planner import astream_outline
+    from agent.ppt_builder import DeckBuilder
+    def step(fn, *args):
+        return workers.render.submit(profile.call, fn, *args) if profile else workers.render.submit(fn, *args)
+    workers.llm.check()
+    with workers.render.slot(), profile.running() if profile else contextlib.nullcontext():
+        deck = await step(DeckBuilder, theme, template)
+        async for slide in workers.llm.stream(astream_outline, topic, slides):
+            await step(deck.add, slide)
+            if on_slide: on_slide(len(deck.outline))
+        await step(deck.finish, dest)
+        return deck.outline
+
+def _parts(n):
+    """How many build processes to spread an n-slide deck over — only idle ones."""
+    if PARALLEL_SLIDES <= 0 or n < PARALLEL_SLIDES or workers.BUILD_PROCS < 2: return 1
+    idle = workers.build.workers - workers.build.inflight
+    return max(1, min(idle, n // PART_SLIDES))
+
+async def build_deck(outline, theme, template, dest, profile=None):
+    """
+    build_ppt into `dest` on the build pool. When processes are idle a long
+    deck is dealt round-robin into k chunks (so heavy layouts spread out),
+    rendered in parallel and merged by one more build task; it holds k
+    admission slots.
+    """
+    from agent.ppt_builder import build_ppt, plan_deck, render_part, merge_parts
+    wrap, land = (profile.remote, profile.land) if profile else ((lambda fn: fn), (lambda r: r))
+    k = _parts(len(outline))
+    if k == 1:
+        return land(await workers.build.run(wrap(build_ppt), outline, theme, template, dest))
+    workers.build.acquire(k)
+    try:
+        steps = [(idx, key, data) for idx, (key, data) in enumerate(zip(plan_deck(outline), outline), start=1)]
+        chunks = await asyncio.gather(*(workers.build.submit(wrap(render_part), theme, template, steps[j::k])
+                                        for j in range(k)))
+        chunks = [land(c) for c in chunks]
+        parts = [chunks[i % k][i // k] for i in range(len(steps))]
+        return land(await workers.build.submit(wrap(merge_parts), parts, dest))
+    finally:
+        workers.build.release(k)
+
+async def generate_deck(topic, slides, theme, template, dest, oid=None, progress=None, profile=None):
+    """
+    Write the deck to the path `dest` and return its outline.
+    progress(stage, **info) reports "outline" and "build" events when given,
+    or "outline" and then per-slide "slide" events for a pipelined build. With a profiler.Sampler the build is sampled into it.
+    """
+    from agent.planner import agenerate_outline
+    from agent.outline_cache import cache
+    report = progress or (lambda stage, **info: None)
+    oid, outline = await cached_outline(topic, slides, oid)
+    if outline is None and PIPELINED:
+        log(f"[1/2] Streaming outline '{topic}' ({slides} slides) into {template} / {theme['name']}...")
+        report("outline")
+        outline = await build_streaming(topic, slides, theme, template, dest,
+                                        lambda n: report("slide", done=n, total=slides), profile)
+        if not outline: raise ValueError("The model returned no slides")
+        await cache.aput(oid, outline)
+        log(f"[2/2] Built {len(outline)} slides")
+    else:
+        if outline is None:
+            log(f"[1/2] Generating outline '{topic}' ({slides} slides), theme: {theme['name']}...")
+            report("outline")
+            outline = await workers.llm.call(agenerate_outline, topic, slides)
+            await cache.aput(oid, outline)
+        else:
+            log(f"[1/2] Cached outline {oid} ({len(outline)} slides), theme: {theme['name']}")
+        log(f"[2/2] Building {template} template...")
+        report("build", total=len(outline))
+        await build_deck(outline, theme, template, dest, profile)
+    log("Done!")
+    return outline
+
+async def edit_slide(src, dest, outline, idx, theme, template, topic, slide=None, instruction=None):
+    """
+    Write the deck at `src` to `dest` with slide idx (1-based) replaced, and
+    return the new outline. `slide` holds new content, merged over the
+    current slide and checked like a model-written one (pydantic's
+    ValidationError if it isn't a usable slide); without it the LLM rewrites
+    the slide from its neighbours' titles. Only that slide is re-rendered.
+    """
+    from agent.planner import agenerate_slide, clean_slide
+    from agent.outline_parse import Slide
+    from agent.ppt_builder import rerender_slide
+    if slide is None:
+        slide = await workers.llm.call(agenerate_slide, topic, outline, idx-1, instruction)
+    else:
+        merged = Slide.model_validate({**outline[idx-1], **slide}).model_dump(exclude_unset=True)
+        slide = clean_slide(merged, idx-1)
+    outline = outline[:idx-1] + [slide] + outline[idx:]
+    await workers.build.run(rerender_slide, src, outline, idx, theme, template, dest)
+    return outline
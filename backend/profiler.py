@@ -0,0 +1,87 @@
+"""
+profiler.py — opt-in sampling profiler for deck builds.
+
+A Sampler runs one daemon thread that wakes every interval and reads the
+stacks of the threads currently attached to it (sys._current_frames), so the
+builder itself runs untouched: no tracing hooks, no per-call cost. Stacks are
+counted in collapsed form — "frame;frame;frame count" per line, outermost
+first — which flamegraph.pl, speedscope and inferno read directly.
+
+Builds on the process pool sample themselves in the build process (sampled())
+and the counts are merged into the request's Sampler; pipelined builds
+attach each render-thread step (call()). Nothing here runs unless a request
+asks for a profile and PPT_PROFILE allows it.
+
+Config (env):
+    PPT_PROFILE              1 = requests may ask for a profile     (default 0)
+    PPT_PROFILE_INTERVAL_MS  sampling period                        (default 5)
+"""
+import functools, os, sys, threading
+from collections import Counter
+from contextlib import contextmanager
+
+ALLOWED  = os.getenv("PPT_PROFILE", "0") == "1"
+INTERVAL = max(0.5, float(os.getenv("PPT_PROFILE_INTERVAL_MS", "5"))) / 1000
+
+
+def _frame(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler:
+    def __init__(self, interval=INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._threads = {}   # thread ident -> code object the stack is cut at
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ── sampling ──────────────────────────────────────────────────────────────
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for tid, root in list(self._threads.items()):
+                f = frames.get(tid); stack = []
+                while f is not None and f.f_code is not root:
+                    stack.append(_frame(f.f_code)); f = f.f_back
+                if stack:
+                    self.stacks[";".join(reversed(stack))] += 1; self.samples += 1
+
+    @contextmanager
+    def running(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ppt-profiler", daemon=True)
+        self._thread.start()
+        try: yield self
+        finally:
+            self._stop.set(); self._thread.join()
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) with this thread sampled; frames above this one are left out."""
+        tid = threading.get_ident()
+        self._threads[tid] = sys._getframe().f_code
+        try: return fn(*args, **kwargs)
+        finally: self._threads.pop(tid, None)
+
+    # ── build processes ───────────────────────────────────────────────────────
+    def remote(self, fn):
+        """fn wrapped to profile itself wherever it runs; hand its result to land()."""
+        return functools.partial(sampled, self.interval, fn)
+
+    def land(self, result):
+        value, stacks = result
+        self.stacks.update(stacks); self.samples += sum(stacks.values())
+        return value
+
+    # ── output ────────────────────────────────────────────────────────────────
+    def collapsed(self):
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+def sampled(interval, fn, *args, **kwargs):
+    """(fn's result, stack counts) — fn run under a Sampler of its own, in this process."""
+    s = Sampler(interval)
+    with s.running():
+        value = s.call(fn, *args, **kwargs)
+    return value, dict(s.stacks)
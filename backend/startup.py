@@ -0,0 +1,63 @@
+"""
+startup.py — warm-up and readiness for the API process.
+
+`import main` stays cheap: the LLM client, python-pptx and lxml are not
+imported until a handler needs them. So that the first request does not pay
+for them either, main.py's lifespan starts warm_up() as soon as the server is
+up. GET /ready answers 503 until it has finished; GET /health stays a plain
+liveness check throughout.
+
+Steps, each timed into status["steps"] (seconds):
+    imports  agent.planner (LLM backend), agent.ppt_builder, python-pptx, lxml
+    llm      the LLM client's connection pool for this event loop
+    builder  ppt_builder.warm_up here: template parse, shape prototypes,
+             compiled timing XML, every theme resolved
+    pools    every build process and render thread started, each warming
+             itself as it starts (workers.warm_up)
+
+A failed step is logged and recorded in status["error"]; the process still
+turns ready, just colder.
+
+Config (env):
+    PPT_WARMUP   0 = skip all of it and be ready at once   (default 1)
+"""
+import asyncio, importlib, time, traceback
+import workers
+from metrics import log
+
+status = {"ready": not workers.WARMUP, "seconds": None, "steps": {}, "build_processes": None, "error": None}
+
+async def _step(name, coro):
+    t0 = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        status["steps"][name] = round(time.perf_counter() - t0, 3)
+
+def _imports():
+    for mod in ("agent.planner", "agent.ppt_builder", "agent.outline_cache"):
+        importlib.import_module(mod)
+
+async def _llm():
+    from agent.planner import client
+    http = getattr(client, "http", None)   # GroqBackend's pool; the stub has none
+    if http: http()
+
+async def warm_up():
+    if status["ready"]: return status
+    from themes import registry
+    t0 = time.perf_counter()
+    try:
+        await _step("imports", asyncio.to_thread(_imports))
+        await _step("llm", _llm())
+        from agent.ppt_builder import warm_up as warm_builder
+        _, status["build_processes"] = await asyncio.gather(
+            _step("builder", asyncio.to_thread(warm_builder, registry.themes)),
+            _step("pools", workers.warm_up()))
+    except Exception as e:
+        log(traceback.format_exc())
+        status["error"] = repr(e)
+    status["seconds"] = round(time.perf_counter() - t0, 3)
+    status["ready"] = True
+    log(f"[startup] ready in {status['seconds']}s {status['steps']}")
+    return status
@@ -0,0 +1,8 @@
+import os, sys, tempfile
+
+# Tests import the backend modules the way the server does, from backend/,
+# never reach a real model, and keep job results out of the shared temp dir
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("PPT_LLM_BACKEND", "stub")
+os.environ.setdefault("PPT_WARMUP", "0")
+os.environ.setdefault("PPT_JOB_DIR", tempfile.mkdtemp(prefix="ppt-jobs-test-"))
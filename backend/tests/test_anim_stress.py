@@ -0,0 +1,45 @@
+"""
+Many decks built at once on a thread pool: every slide's cTn ids must be
+unique, and each deck's slides must match a serial build of the same outline.
+"""
+import io, zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from agent.ppt_builder import build_ppt, TEMPLATES
+from bench.outlines import outline
+from themes import THEMES
+
+CTN = "{http://schemas.openxmlformats.org/presentationml/2006/main}cTn"
+DECKS, THREADS, SLIDES = 24, 8, 8
+
+def slides_of(blob):
+    z = zipfile.ZipFile(io.BytesIO(blob))
+    names = sorted((n for n in z.namelist() if n.startswith("ppt/slides/slide")),
+                   key=lambda n: int(n[16:-4]))
+    return {n: z.read(n) for n in names}
+
+def duplicate_ids(xml):
+    ids = Counter(el.get("id") for el in etree.fromstring(xml).iter(CTN))
+    return sorted(i for i, c in ids.items() if c > 1)
+
+def build(job):
+    seed, style, theme, n = job
+    return build_ppt(outline(seed, n), theme, style)
+
+
+def test_concurrent_builds_keep_ctn_ids_unique_and_deterministic():
+    styles = list(TEMPLATES)
+    jobs = [(seed, styles[seed % len(styles)], THEMES[seed % len(THEMES)], SLIDES) for seed in range(DECKS)]
+    with ThreadPoolExecutor(THREADS) as pool:
+        parallel = list(pool.map(build, jobs))
+
+    bad = []
+    for job, blob in zip(jobs, parallel):
+        got, want = slides_of(blob), slides_of(build(job))
+        assert len(got) == SLIDES
+        for name, xml in got.items():
+            dup = duplicate_ids(xml)
+            if dup: bad.append(f"deck {job[0]} ({job[1]}) {name}: duplicate cTn ids {dup}")
+            elif xml != want[name]: bad.append(f"deck {job[0]} ({job[1]}) {name}: differs from the serial build")
+    assert not bad, "\n".join(bad)
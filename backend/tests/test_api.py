@@ -0,0 +1,69 @@
+import io, time, zipfile
+import pytest
+from fastapi.testclient import TestClient
+import main
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(main.app) as c:
+        yield c
+
+@pytest.fixture(scope="module")
+def job(client):
+    j = client.post("/jobs", json={"topic": "Edits", "slides": 4, "template": "neon"}).json()
+    for _ in range(300):
+        state = client.get(j["status_url"]).json()
+        if state["status"] in ("done", "error"): break
+        time.sleep(0.1)
+    assert state["status"] == "done"
+    return j
+
+
+@pytest.mark.parametrize("slide", [{"points": None}, {"title": None}, {"title": ""}, {"points": []}])
+def test_edit_rejects_unusable_slide(client, job, slide):
+    r = client.post(f"/jobs/{job['id']}/slides/2", json={"slide": slide})
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"][:2] == ["body", "slide"]
+
+def test_edit_string_points_become_one_bullet(client, job):
+    r = client.post(f"/jobs/{job['id']}/slides/2", json={"slide": {"points": "just a string"}})
+    assert r.status_code == 200
+    assert r.json()["slide"]["points"][0] == "just a string"
+
+@pytest.mark.parametrize("item", [{"title": "A", "points": None}, {"points": ["x"]}, {"title": "A", "points": [[1]]}])
+def test_render_multi_rejects_unusable_outline(client, item):
+    outline = [{"title": "Fine", "points": ["x"]}, item]
+    r = client.post("/render-multi", json={"targets": [{"template": "neon"}], "outline": outline})
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"][:3] == ["body", "outline", 1]
+
+def test_render_multi_splits_string_points(client):
+    outline = [{"title": "Opening", "points": "- one\n- two", "layout": "title_hero"}, {"title": "B", "points": "abc"}]
+    r = client.post("/render-multi", json={"targets": [{"template": "neon"}, {"template": "magazine"}], "outline": outline})
+    assert r.status_code == 200
+    assert all(n.endswith(".pptx") for n in zipfile.ZipFile(io.BytesIO(r.content)).namelist())
+
+def test_batch_keeps_decks_whose_outline_did_not_fail(client, monkeypatch):
+    import pipeline
+    real = pipeline.get_outline
+    async def flaky(topic, slides, oid=None):
+        if topic == "Broken": raise ValueError("The model returned no readable slides")
+        return await real(topic, slides, oid)
+    monkeypatch.setattr(pipeline, "get_outline", flaky)
+    specs = [{"topic": "Fine", "slides": 3}, {"topic": "Broken", "slides": 3}, {"topic": "Fine", "slides": 3, "template": "neon"}]
+    r = client.post("/generate-batch", json={"specs": specs})
+    assert r.status_code == 200
+    z = zipfile.ZipFile(io.BytesIO(r.content))
+    assert sorted(z.namelist()) == ["01_Fine_futuristic.pptx", "02_Broken_futuristic.error.txt", "03_Fine_neon.pptx"]
+    assert b"no readable slides" in z.read("02_Broken_futuristic.error.txt")
+    r = client.post("/generate-batch", json={"specs": specs[1:2]})
+    assert r.status_code == 500
+
+def test_health_reports_slide_cache_hits_from_build_processes(client):
+    before = client.get("/health").json()["slide_cache"]
+    spec = {"topic": "Cache stats", "slides": 3, "template": "magazine"}
+    for _ in range(2): assert client.post("/generate-ppt", json=spec).status_code == 200
+    after = client.get("/health").json()["slide_cache"]
+    assert after["hits"] - before["hits"] >= 3 and after["misses"] - before["misses"] >= 3
+    assert after["bytes_hit"] > before["bytes_hit"] and 0 < after["hit_rate"] <= 1
@@ -0,0 +1,63 @@
+"""
+What `import main` costs a cold API process, checked against a budget.
+
+`python -X importtime -c "import main"` runs in fresh processes; the median
+over REPEAT runs of the part that is ours — main itself plus the backend
+modules it imports — must stay under BUDGET_MS, and none of the modules
+startup.py warms in the background (python-pptx, lxml, httpx, the planner,
+the builder) may creep into `import main`. startup.warm_up() must reach
+ready within WARMUP_BUDGET seconds.
+
+Budgets (env):
+    PPT_IMPORT_BUDGET_MS   our modules' import time, ms    (default 60)
+    PPT_WARMUP_BUDGET      warm_up() to ready, seconds     (default 10)
+"""
+import json, os, statistics, subprocess, sys
+import pytest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS     = float(os.getenv("PPT_IMPORT_BUDGET_MS", "60"))
+WARMUP_BUDGET = float(os.getenv("PPT_WARMUP_BUDGET", "10"))
+REPEAT = 3
+
+OURS  = {"main", "workers", "pipeline", "jobs", "metrics", "startup", "themes"}
+HEAVY = ("pptx", "lxml", "httpx", "tenacity", "dotenv", "agent.planner", "agent.ppt_builder", "agent.llm")
+
+def importtime():
+    """{module: (self us, cumulative us, depth)} for one cold `import main`."""
+    r = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=BACKEND,
+                       capture_output=True, text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"})
+    assert r.returncode == 0, f"import main failed:\n{r.stderr[-2000:]}"
+    mods = {}
+    for line in r.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line: continue
+        own, cum, name = line[len("import time:"):].split("|")
+        mods[name.strip()] = (int(own), int(cum), (len(name) - len(name.lstrip())) // 2)
+    return mods
+
+def ours_us(mods):
+    """main's own time plus every backend module it pulls in (counted once, outermost)."""
+    total = mods["main"][0]
+    return total + sum(cum for name, (_, cum, depth) in mods.items() if name in OURS - {"main"} and depth == 1)
+
+@pytest.fixture(scope="module")
+def runs():
+    return [importtime() for _ in range(REPEAT)]
+
+
+def test_our_modules_import_within_budget(runs):
+    ours = statistics.median(ours_us(m) for m in runs) / 1e3
+    assert ours <= BUDGET_MS, f"our modules take {ours:.1f} ms to import, budget {BUDGET_MS:.0f} ms"
+
+def test_warmed_modules_are_not_imported_eagerly(runs):
+    leaked = sorted({name for m in runs for name in m if name in HEAVY})
+    assert not leaked, f"imported by `import main`, should wait for warm-up: {', '.join(leaked)}"
+
+def test_warm_up_reaches_ready_within_budget():
+    code = "import asyncio, json, main, startup; print(json.dumps(asyncio.run(startup.warm_up())))"
+    r = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, capture_output=True, text=True,
+                       env={**os.environ, "PPT_WARMUP": "1"})
+    assert r.returncode == 0, f"warm-up failed:\n{r.stderr[-2000:]}"
+    st = json.loads(r.stdout.strip().splitlines()[-1])
+    assert st["ready"] and not st["error"], st
+    assert st["seconds"] <= WARMUP_BUDGET, f"warm-up took {st['seconds']}s {st['steps']}, budget {WARMUP_BUDGET}s"
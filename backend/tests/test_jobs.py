@@ -0,0 +1,68 @@
+import asyncio, os, shutil, time
+import jobs
+
+
+def stored(tmp_path, ttl=60, max_bytes=1 << 20):
+    store = jobs.JobStore(str(tmp_path), max_bytes=max_bytes, ttl=ttl)
+    job_id = "ab" * 16
+    store.save_state({"id": job_id, "status": "done", "finished": time.time()})
+    store.save_outline(job_id, [{"title": "A"}])
+    with open(store.staging(job_id), "wb") as f: f.write(b"PK")
+    store.commit(job_id)
+    return store, job_id
+
+def age(store, job_id, seconds):
+    for name in os.listdir(store.root):
+        if name.startswith(job_id):
+            path = os.path.join(store.root, name); t = time.time() - seconds
+            os.utime(path, (t, t))
+
+
+def test_expired_result_is_not_served_before_eviction(tmp_path):
+    store, job_id = stored(tmp_path)
+    assert store.file(job_id) and store.load_state(job_id) and store.load_outline(job_id)
+    age(store, job_id, 120)
+    assert store.file(job_id) is None
+    assert store.load_state(job_id) is None and store.load_outline(job_id) is None
+    assert os.listdir(store.root)   # still on disk until the next eviction
+
+def test_manager_forgets_expired_in_memory_state(tmp_path):
+    store, job_id = stored(tmp_path)
+    age(store, job_id, 120)
+    manager = jobs.JobManager(store)
+    manager._jobs[job_id] = {"id": job_id, "status": "done", "finished": time.time() - 120}
+    assert manager.get(job_id) is None and job_id not in manager._jobs
+
+def test_sweeper_evicts_while_idle(tmp_path, monkeypatch):
+    store, job_id = stored(tmp_path)
+    age(store, job_id, 120)
+    monkeypatch.setattr(jobs, "store", store)
+    async def run():
+        task = asyncio.create_task(jobs.sweeper(0.01))
+        await asyncio.sleep(0.2); task.cancel()
+    asyncio.run(run())
+    assert os.listdir(store.root) == []
+
+def test_accepted_job_waits_out_a_full_build_pool(tmp_path, monkeypatch):
+    import workers
+    monkeypatch.setattr(jobs, "RETRY_MIN", 0.01)
+    manager = jobs.JobManager(jobs.JobStore(str(tmp_path), max_bytes=1 << 20, ttl=60))
+    src = tmp_path / "deck.pptx"; src.write_bytes(b"PK")
+    async def work(progress, dest):
+        await workers.build.run(shutil.copyfile, str(src), dest)
+    async def run():
+        full = workers.build.workers + workers.build.max_queue - workers.build.inflight
+        workers.build.acquire(full)   # HTTP traffic holds every build slot
+        try:
+            state = manager.submit(work, {})
+            await asyncio.sleep(0.1)
+            assert state["status"] == "queued" and state["error"] is None
+        finally:
+            workers.build.release(full)
+        for _ in range(200):
+            if state["status"] in ("done", "error"): break
+            await asyncio.sleep(0.02)
+        return state
+    try: state = asyncio.run(run())
+    finally: workers.build.shutdown()
+    assert state["status"] == "done", state
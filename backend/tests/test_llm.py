@@ -0,0 +1,66 @@
+import asyncio, json
+import httpx, pytest
+from agent.llm import GroqBackend
+
+
+def sse(*deltas):
+    return [f"data: {json.dumps({'choices': [{'delta': {'content': d}}]})}\n\n".encode() for d in deltas] + [b"data: [DONE]\n\n"]
+
+class Body(httpx.AsyncByteStream):
+    def __init__(self, chunks, gap=0.0): self.chunks = chunks; self.gap = gap
+    async def __aiter__(self):
+        for c in self.chunks:
+            await asyncio.sleep(self.gap); yield c
+
+def backend(handler, **kw):
+    b = GroqBackend("m", api_key="k", **kw)
+    b.http = lambda: b._http.setdefault(asyncio.get_running_loop(), httpx.AsyncClient(
+        base_url="http://llm", transport=httpx.MockTransport(handler)))
+    return b
+
+def collect(b):
+    async def run():
+        try: return [d async for d in b.stream("p")]
+        finally: await b.aclose()
+    return asyncio.run(run())
+
+
+def test_stream_yields_deltas():
+    async def handler(request): return httpx.Response(200, stream=Body(sse("a", "b")))
+    assert collect(backend(handler)) == ["a", "b"]
+
+def test_stream_deadline_covers_the_body():
+    async def handler(request): return httpx.Response(200, stream=Body(sse(*"abcdef"), gap=0.1))
+    with pytest.raises(TimeoutError):
+        collect(backend(handler, deadline=0.25))
+
+def test_stream_opening_is_hedged():
+    calls = []
+    async def handler(request):
+        calls.append(1)
+        if len(calls) == 1: await asyncio.sleep(5)
+        return httpx.Response(200, stream=Body(sse("fast")))
+    b = backend(handler, hedge=True)
+    b._latency["stream"].extend([0.01] * b.HEDGE_MIN_SAMPLES)
+    assert collect(b) == ["fast"] and len(calls) == 2
+
+def test_complete_retries_a_5xx():
+    calls = []
+    async def handler(request):
+        calls.append(1)
+        if len(calls) == 1: return httpx.Response(503)
+        return httpx.Response(200, json={"choices": [{"message": {"content": " ok "}}]})
+    b = backend(handler)
+    async def run():
+        try: return await b.complete("p")
+        finally: await b.aclose()
+    assert asyncio.run(run()) == "ok" and len(calls) == 2
+
+def test_backends_must_implement_the_interface():
+    from agent.llm import LLMBackend, Timed
+    from agent.stub_llm import StubBackend
+    class Partial(LLMBackend):
+        async def complete(self, prompt, max_tokens=6000, temperature=0.7, kind="default"): return ""
+    with pytest.raises(TypeError):
+        Partial()
+    Timed(StubBackend())
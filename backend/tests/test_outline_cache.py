@@ -0,0 +1,60 @@
+import os, time
+from agent.outline_cache import OutlineCache
+
+OUTLINE = [{"title": "T", "points": ["p" * 200] * 4}]
+
+def key(i): return f"{i:032x}"
+
+def files(c): return sorted(n for n in os.listdir(c.disk_dir) if n.endswith(".zst"))
+
+def backdate(c, i, seconds):
+    path = c._path(key(i)); t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+def test_disk_tier_stays_under_its_cap(tmp_path):
+    c = OutlineCache(max_items=1, disk_dir=str(tmp_path))
+    c.put(key(0), OUTLINE)
+    size = os.path.getsize(c._path(key(0)))
+    c.disk_max_bytes = 3 * size
+    for i in range(1, 8):
+        backdate(c, i - 1, 100 - i)   # oldest first
+        c.put(key(i), OUTLINE)
+    assert len(files(c)) == 3
+    assert sum(os.path.getsize(os.path.join(c.disk_dir, n)) for n in files(c)) <= c.disk_max_bytes
+
+def test_disk_hit_refreshes_recency(tmp_path):
+    c = OutlineCache(max_items=1, disk_dir=str(tmp_path))
+    for i in range(3):
+        c.put(key(i), OUTLINE); backdate(c, i, 100 - i)
+    c.disk_max_bytes = 2 * os.path.getsize(c._path(key(0)))
+    c._remember("f" * 32, None)                    # push key 0 out of memory
+    assert c.get(key(0)) == OUTLINE                # read from disk: now the most recent
+    c.evict()
+    assert files(c) == [f"{key(0)}.json.zst", f"{key(2)}.json.zst"]
+
+def test_expired_entries_miss_and_are_evicted(tmp_path):
+    c = OutlineCache(max_items=1, disk_dir=str(tmp_path), disk_ttl=60)
+    c.put(key(0), OUTLINE); c.put(key(1), OUTLINE)
+    backdate(c, 0, 120)
+    assert c.get(key(0)) is None
+    c.evict()
+    assert files(c) == [f"{key(1)}.json.zst"]
+
+def test_async_access_keeps_disk_io_off_the_event_loop(tmp_path, monkeypatch):
+    import asyncio, threading
+    c = OutlineCache(max_items=1, disk_dir=str(tmp_path))
+    seen = []
+    for name in ("_write", "get"):
+        real = getattr(c, name)
+        def spy(*a, real=real):
+            seen.append(threading.get_ident()); return real(*a)
+        monkeypatch.setattr(c, name, spy)
+    async def run():
+        loop = threading.get_ident()
+        await c.aput(key(0), OUTLINE); await c.aput(key(1), OUTLINE)   # key 0 leaves memory
+        assert await c.aget(key(1)) == OUTLINE and not seen[2:]        # memory hit: no disk, no thread
+        assert await c.aget(key(0)) == OUTLINE
+        return loop
+    loop = asyncio.run(run())
+    assert len(seen) == 3 and loop not in seen
@@ -0,0 +1,55 @@
+import json
+from agent.outline_parse import SlideScanner, recover
+from agent.planner import _gaps
+
+
+def slide(title):
+    return {"title": title, "subtitle": "s", "points": ["a", "b", "c", "d"],
+            "detail": "d", "notes": "n", "layout": "two_column"}
+
+def completion(n, bad, title, indent=2):
+    """n slides as the model writes them, slide `bad` (0-based) titled with a raw, unescaped `title`."""
+    raw = json.dumps([slide(f"T{i}") for i in range(n)], indent=indent)
+    return raw.replace(f'"T{bad}"', f'"{title}"')
+
+def titles(slots):
+    return [s and s["title"] for s in slots]
+
+
+def test_even_stray_quotes_cost_one_slide():
+    slots = recover(completion(6, 2, 'Broken "quote" here'), 6)
+    assert titles(slots) == ["T0", "T1", None, "T3", "T4", "T5"]
+    assert _gaps(slots) == [(2, 1)]
+
+def test_odd_stray_quote_resyncs_at_the_next_slide():
+    for indent in (2, None):
+        slots = recover(completion(8, 1, 'Why a 27" monitor', indent), 8)
+        assert titles(slots) == ["T0", None, "T2", "T3", "T4", "T5", "T6", "T7"]
+        assert _gaps(slots) == [(1, 1)]
+
+def test_odd_stray_quote_in_the_last_slide():
+    slots = recover(completion(4, 3, 'Why a 27" monitor'), 4)
+    assert titles(slots) == ["T0", "T1", "T2", None]
+
+def test_scanner_resyncs_across_chunks():
+    raw = completion(8, 1, 'Why a 27" monitor')
+    scanner, objects = SlideScanner(), []
+    for k in range(0, len(raw), 5):
+        objects += scanner.feed(raw[k:k + 5])
+    assert len(objects) == 8 and scanner.done
+
+def test_truncated_tail_is_a_gap():
+    raw = json.dumps([slide(f"T{i}") for i in range(5)])
+    slots = recover(raw[:raw.index('"T3"') + 10], 5)
+    assert titles(slots) == ["T0", "T1", "T2", None, None]
+    assert _gaps(slots) == [(3, 2)]
+
+def test_fenced_with_trailing_comma():
+    raw = "Here you go:\n```json\n" + json.dumps([slide("A"), slide("B")])[:-1] + ",]\n```"
+    assert titles(recover(raw)) == ["A", "B"]
+
+def test_string_points_are_split_and_invalid_slides_are_gaps():
+    raw = json.dumps([{"title": "A", "points": "- one\n- two"}, {"title": "", "points": ["x"]}, {"points": ["x"]}])
+    slots = recover(raw, 3)
+    assert slots[0]["points"] == ["one", "two"]
+    assert slots[1:] == [None, None]
@@ -0,0 +1,74 @@
+import asyncio, json, re
+from agent import planner
+
+
+class Scripted:
+    """An LLM backend that streams `raw` for the outline and answers repair prompts with the slides asked for."""
+    def __init__(self, raw): self.raw = raw; self.prompts = []
+
+    async def complete(self, prompt, max_tokens=6000, temperature=0.7, kind="default"):
+        self.prompts.append(prompt)
+        if kind == "outline": return self.raw
+        first, last = re.search(r"Write ONLY slides? (\d+)(?: to (\d+))?", prompt).groups()
+        first = int(first); last = int(last or first)
+        return json.dumps([slide(f"R{i}", "two_column") for i in range(first - 1, last)])
+
+    async def stream(self, prompt, max_tokens=6000, temperature=0.7):
+        for k in range(0, len(self.raw), 9):
+            await asyncio.sleep(0)
+            yield self.raw[k:k + 9]
+
+
+def slide(title, layout):
+    return {"title": title, "subtitle": "s", "points": ["a", "b", "c", "d"],
+            "detail": "d", "notes": "n", "layout": layout}
+
+def streamed(monkeypatch, raw, n):
+    client = Scripted(raw)
+    monkeypatch.setattr(planner, "client", client)
+    async def run():
+        return [s async for s in planner.astream_outline("topic", n)]
+    return asyncio.run(run()), client
+
+def completion(layouts, bad=None):
+    raw = json.dumps([slide(f"T{i}", l) for i, l in enumerate(layouts)], indent=2)
+    return raw.replace(f'"T{bad}"', '"Broken "quote" here"') if bad is not None else raw
+
+
+def test_unreadable_slide_is_refilled_in_place(monkeypatch):
+    layouts = ["title_hero", "icon_grid", "timeline", "stat_callout", "full_detail", "title_hero"]
+    out, client = streamed(monkeypatch, completion(layouts, bad=2), 6)
+    assert [s["title"] for s in out] == ["T0", "T1", "R2", "T3", "T4", "T5"]
+    assert out[-1]["layout"] == "title_hero"
+    repairs = [p for p in client.prompts if "Write ONLY" in p]
+    assert len(repairs) == 1 and "Write ONLY slide 3 of 6." in repairs[0]
+
+def test_truncated_stream_refills_the_tail(monkeypatch):
+    raw = completion(["title_hero", "icon_grid", "timeline", "stat_callout"])
+    out, client = streamed(monkeypatch, raw[:raw.index('"T2"')], 4)
+    assert [s["title"] for s in out] == ["T0", "T1", "R2", "R3"]
+    assert any("Write ONLY slides 3 to 4 of 4." in p for p in client.prompts)
+
+def test_stream_applies_the_same_layout_rule_as_the_batch_outline(monkeypatch):
+    raw = completion(["title_hero", "timeline", "timeline", "timeline", "icon_grid", "title_hero"])
+    out, _ = streamed(monkeypatch, raw, 6)
+    whole = asyncio.run(planner.agenerate_outline("topic", 6))
+    assert out == whole
+    assert all(a["layout"] != b["layout"] for a, b in zip(out, out[1:]))
+
+def test_failed_section_is_refilled_in_place(monkeypatch):
+    class Flaky(Scripted):
+        async def complete(self, prompt, max_tokens=6000, temperature=0.7, kind="default"):
+            if kind == "skeleton":
+                return json.dumps([{"title": f"Part {k}", "focus": ""} for k in range(3)])
+            if kind == "section":
+                first, last = map(int, re.search(r"slides (\d+) to (\d+)", prompt).groups())
+                if first == 7: raise TimeoutError("section timed out")
+                return json.dumps([slide(f"T{i}", "two_column") for i in range(first - 1, last)])
+            return await super().complete(prompt, max_tokens, temperature, kind)
+    client = Flaky("")
+    monkeypatch.setattr(planner, "client", client)
+    out = asyncio.run(planner.agenerate_outline("topic", 18))
+    assert [s["title"] for s in out] == [f"T{i}" for i in range(6)] + [f"R{i}" for i in range(6, 12)] \
+                                        + [f"T{i}" for i in range(12, 18)]
+    assert sum("Write ONLY slides 7 to 12 of 18." in p for p in client.prompts) == 1
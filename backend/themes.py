@@ -1,11 +1,16 @@
 """
-themes.py — 100+ unique PPT design themes.
+themes.py — 100+ unique PPT design themes, and the registry the API serves
+them from.
 Each theme defines: bg, card_bg, header_bg, title_color, body_color,
 muted_color, accent, accent2, font_head, font_body, style_tag.
 style_tag groups: dark, light, neon, pastel, corporate, retro, minimal, bold
+
+IDs are the API's theme_id. 1-15 are the themes the API has always served
+(they used to live in main.py) and must keep meaning the same theme.
 """
 
 import random
+import orjson, xxhash
 
 THEMES = [
     # ── DARK FUTURISTIC ─────────────────────────────────────────────────────
@@ -13,19 +18,19 @@ THEMES = [
     {"id":2,"name":"Cyber Cyan","bg":"#050d1a","card_bg":"#0a1628","header_bg":"#071220","title_color":"#e0f4ff","body_color":"#a8d8ea","muted_color":"#5a8fa8","accent":"#00d4ff","accent2":"#0099cc","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
     {"id":3,"name":"Neon Green","bg":"#060f06","card_bg":"#0d1f0d","header_bg":"#0a180a","title_color":"#e8ffe8","body_color":"#a8d4a8","muted_color":"#5a8a5a","accent":"#39ff14","accent2":"#00cc00","font_head":"Trebuchet MS","font_body":"Calibri","tag":"neon"},
     {"id":4,"name":"Electric Purple","bg":"#0a0515","card_bg":"#130a20","header_bg":"#0f0818","title_color":"#f0e8ff","body_color":"#c8a8f0","muted_color":"#8060b0","accent":"#bf5fff","accent2":"#8800ff","font_head":"Calibri","font_body":"Calibri Light","tag":"neon"},
-    {"id":5,"name":"Magenta Noir","bg":"#0f050f","card_bg":"#1a0a1a","header_bg":"#140814","title_color":"#ffe8ff","body_color":"#d4a8d4","muted_color":"#885088","accent":"#ff00aa","accent2":"#cc0077","font_head":"Trebuchet MS","font_body":"Calibri","tag":"neon"},
-    {"id":6,"name":"Solar Flare","bg":"#0f0800","card_bg":"#1f1200","header_bg":"#180e00","title_color":"#fff8e8","body_color":"#f0d090","muted_color":"#a07830","accent":"#ffa500","accent2":"#ff6600","font_head":"Calibri","font_body":"Calibri","tag":"dark"},
-    {"id":7,"name":"Arctic Blue","bg":"#040d1f","card_bg":"#091828","header_bg":"#061420","title_color":"#e8f4ff","body_color":"#a8c8f0","muted_color":"#5080b0","accent":"#4da8ff","accent2":"#0066cc","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"dark"},
-    {"id":8,"name":"Blood Red","bg":"#0f0000","card_bg":"#1f0505","header_bg":"#180303","title_color":"#ffe8e8","body_color":"#f0a8a8","muted_color":"#a05050","accent":"#ff2222","accent2":"#cc0000","font_head":"Calibri","font_body":"Calibri","tag":"dark"},
-    {"id":9,"name":"Teal Depths","bg":"#020f0f","card_bg":"#071e1e","header_bg":"#051818","title_color":"#e8ffff","body_color":"#a8e0e0","muted_color":"#508080","accent":"#00c8c8","accent2":"#009999","font_head":"Trebuchet MS","font_body":"Calibri","tag":"dark"},
-    {"id":10,"name":"Gold Rush","bg":"#0a0800","card_bg":"#1a1400","header_bg":"#150f00","title_color":"#fffbe8","body_color":"#f0e090","muted_color":"#a09030","accent":"#ffd700","accent2":"#c8a800","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
+    {"id":106,"name":"Magenta Noir","bg":"#0f050f","card_bg":"#1a0a1a","header_bg":"#140814","title_color":"#ffe8ff","body_color":"#d4a8d4","muted_color":"#885088","accent":"#ff00aa","accent2":"#cc0077","font_head":"Trebuchet MS","font_body":"Calibri","tag":"neon"},
+    {"id":107,"name":"Solar Flare","bg":"#0f0800","card_bg":"#1f1200","header_bg":"#180e00","title_color":"#fff8e8","body_color":"#f0d090","muted_color":"#a07830","accent":"#ffa500","accent2":"#ff6600","font_head":"Calibri","font_body":"Calibri","tag":"dark"},
+    {"id":108,"name":"Arctic Blue","bg":"#040d1f","card_bg":"#091828","header_bg":"#061420","title_color":"#e8f4ff","body_color":"#a8c8f0","muted_color":"#5080b0","accent":"#4da8ff","accent2":"#0066cc","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"dark"},
+    {"id":109,"name":"Blood Red","bg":"#0f0000","card_bg":"#1f0505","header_bg":"#180303","title_color":"#ffe8e8","body_color":"#f0a8a8","muted_color":"#a05050","accent":"#ff2222","accent2":"#cc0000","font_head":"Calibri","font_body":"Calibri","tag":"dark"},
+    {"id":110,"name":"Teal Depths","bg":"#020f0f","card_bg":"#071e1e","header_bg":"#051818","title_color":"#e8ffff","body_color":"#a8e0e0","muted_color":"#508080","accent":"#00c8c8","accent2":"#009999","font_head":"Trebuchet MS","font_body":"Calibri","tag":"dark"},
+    {"id":111,"name":"Gold Rush","bg":"#0a0800","card_bg":"#1a1400","header_bg":"#150f00","title_color":"#fffbe8","body_color":"#f0e090","muted_color":"#a09030","accent":"#ffd700","accent2":"#c8a800","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
 
     # ── CORPORATE / PROFESSIONAL ─────────────────────────────────────────────
-    {"id":11,"name":"Executive Navy","bg":"#1e2761","card_bg":"#253070","header_bg":"#1a2258","title_color":"#ffffff","body_color":"#cadcfc","muted_color":"#8099cc","accent":"#4da6ff","accent2":"#cadcfc","font_head":"Calibri","font_body":"Calibri Light","tag":"corporate"},
-    {"id":12,"name":"Slate Pro","bg":"#2c3e50","card_bg":"#34495e","header_bg":"#2c3e50","title_color":"#ecf0f1","body_color":"#bdc3c7","muted_color":"#7f8c8d","accent":"#3498db","accent2":"#2980b9","font_head":"Calibri","font_body":"Calibri","tag":"corporate"},
-    {"id":13,"name":"Forest Executive","bg":"#1a2f1a","card_bg":"#233023","header_bg":"#1e2a1e","title_color":"#e8f5e8","body_color":"#a8c8a8","muted_color":"#608060","accent":"#4caf50","accent2":"#388e3c","font_head":"Trebuchet MS","font_body":"Calibri","tag":"corporate"},
-    {"id":14,"name":"Burgundy Suite","bg":"#2d0a0a","card_bg":"#3d1010","header_bg":"#350c0c","title_color":"#ffe8e8","body_color":"#d4a8a8","muted_color":"#885050","accent":"#c0392b","accent2":"#e74c3c","font_head":"Calibri","font_body":"Calibri Light","tag":"corporate"},
-    {"id":15,"name":"Charcoal Minimal","bg":"#1a1a1a","card_bg":"#252525","header_bg":"#1f1f1f","title_color":"#ffffff","body_color":"#cccccc","muted_color":"#888888","accent":"#ff7820","accent2":"#e06010","font_head":"Trebuchet MS","font_body":"Calibri","tag":"corporate"},
+    {"id":7,"name":"Executive Navy","bg":"#1e2761","card_bg":"#253070","header_bg":"#1a2258","title_color":"#ffffff","body_color":"#cadcfc","muted_color":"#8099cc","accent":"#4da6ff","accent2":"#cadcfc","font_head":"Calibri","font_body":"Calibri Light","tag":"corporate"},
+    {"id":112,"name":"Slate Pro","bg":"#2c3e50","card_bg":"#34495e","header_bg":"#2c3e50","title_color":"#ecf0f1","body_color":"#bdc3c7","muted_color":"#7f8c8d","accent":"#3498db","accent2":"#2980b9","font_head":"Calibri","font_body":"Calibri","tag":"corporate"},
+    {"id":113,"name":"Forest Executive","bg":"#1a2f1a","card_bg":"#233023","header_bg":"#1e2a1e","title_color":"#e8f5e8","body_color":"#a8c8a8","muted_color":"#608060","accent":"#4caf50","accent2":"#388e3c","font_head":"Trebuchet MS","font_body":"Calibri","tag":"corporate"},
+    {"id":114,"name":"Burgundy Suite","bg":"#2d0a0a","card_bg":"#3d1010","header_bg":"#350c0c","title_color":"#ffe8e8","body_color":"#d4a8a8","muted_color":"#885050","accent":"#c0392b","accent2":"#e74c3c","font_head":"Calibri","font_body":"Calibri Light","tag":"corporate"},
+    {"id":115,"name":"Charcoal Minimal","bg":"#1a1a1a","card_bg":"#252525","header_bg":"#1f1f1f","title_color":"#ffffff","body_color":"#cccccc","muted_color":"#888888","accent":"#ff7820","accent2":"#e06010","font_head":"Trebuchet MS","font_body":"Calibri","tag":"corporate"},
     {"id":16,"name":"Ocean Depths","bg":"#003366","card_bg":"#004080","header_bg":"#002d5a","title_color":"#e8f4ff","body_color":"#99ccff","muted_color":"#5599cc","accent":"#00aaff","accent2":"#0088cc","font_head":"Calibri","font_body":"Calibri Light","tag":"corporate"},
     {"id":17,"name":"Emerald Trust","bg":"#013220","card_bg":"#024d30","header_bg":"#012a1a","title_color":"#e8fff0","body_color":"#90ee90","muted_color":"#408040","accent":"#00c853","accent2":"#009624","font_head":"Trebuchet MS","font_body":"Calibri","tag":"corporate"},
     {"id":18,"name":"Stone Cold","bg":"#36454f","card_bg":"#40505c","header_bg":"#2e3c45","title_color":"#f5f5f5","body_color":"#b0bec5","muted_color":"#78909c","accent":"#ff8f00","accent2":"#e65100","font_head":"Calibri","font_body":"Calibri","tag":"corporate"},
@@ -33,8 +38,8 @@ THEMES = [
     {"id":20,"name":"Graphite Edge","bg":"#212121","card_bg":"#303030","header_bg":"#292929","title_color":"#fafafa","body_color":"#e0e0e0","muted_color":"#9e9e9e","accent":"#ff5722","accent2":"#e64a19","font_head":"Calibri","font_body":"Calibri","tag":"corporate"},
 
     # ── LIGHT / MINIMAL ──────────────────────────────────────────────────────
-    {"id":21,"name":"Clean White","bg":"#fafafa","card_bg":"#ffffff","header_bg":"#f0f0f0","title_color":"#111111","body_color":"#333333","muted_color":"#888888","accent":"#ff7820","accent2":"#e05510","font_head":"Trebuchet MS","font_body":"Calibri","tag":"light"},
-    {"id":22,"name":"Warm Paper","bg":"#fdf8f0","card_bg":"#ffffff","header_bg":"#f5ede0","title_color":"#2c1810","body_color":"#5a3a28","muted_color":"#a07860","accent":"#c8500a","accent2":"#a03800","font_head":"Calibri","font_body":"Calibri Light","tag":"light"},
+    {"id":5,"name":"Clean White","bg":"#fafafa","card_bg":"#ffffff","header_bg":"#f0f0f0","title_color":"#111111","body_color":"#333333","muted_color":"#888888","accent":"#ff7820","accent2":"#e05510","font_head":"Trebuchet MS","font_body":"Calibri","tag":"light"},
+    {"id":6,"name":"Warm Paper","bg":"#fdf8f0","card_bg":"#ffffff","header_bg":"#f5ede0","title_color":"#2c1810","body_color":"#5a3a28","muted_color":"#a07860","accent":"#c8500a","accent2":"#a03800","font_head":"Calibri","font_body":"Calibri Light","tag":"light"},
     {"id":23,"name":"Mint Fresh","bg":"#f0fff4","card_bg":"#ffffff","header_bg":"#e0f7ea","title_color":"#1a3a2a","body_color":"#2d6a4f","muted_color":"#74a98c","accent":"#00b37e","accent2":"#00916e","font_head":"Trebuchet MS","font_body":"Calibri","tag":"light"},
     {"id":24,"name":"Sky Light","bg":"#f0f8ff","card_bg":"#ffffff","header_bg":"#e0f0ff","title_color":"#0a2a4a","body_color":"#1a4a7a","muted_color":"#5080aa","accent":"#0077cc","accent2":"#005599","font_head":"Calibri","font_body":"Calibri Light","tag":"light"},
     {"id":25,"name":"Blush Rose","bg":"#fff5f5","card_bg":"#ffffff","header_bg":"#ffe8e8","title_color":"#4a0a0a","body_color":"#7a2a2a","muted_color":"#aa6060","accent":"#e91e63","accent2":"#c2185b","font_head":"Trebuchet MS","font_body":"Calibri","tag":"light"},
@@ -43,6 +48,7 @@ THEMES = [
     {"id":28,"name":"Ice White","bg":"#f4f9ff","card_bg":"#ffffff","header_bg":"#eaf3ff","title_color":"#0a1a3a","body_color":"#2a4a7a","muted_color":"#6080aa","accent":"#1565c0","accent2":"#003c8f","font_head":"Calibri","font_body":"Calibri","tag":"light"},
     {"id":29,"name":"Parchment","bg":"#fdf5e6","card_bg":"#fff8f0","header_bg":"#f5e8d0","title_color":"#2a1a00","body_color":"#5a3a10","muted_color":"#906040","accent":"#8b4513","accent2":"#6b3010","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"light"},
     {"id":30,"name":"Arctic White","bg":"#f0f4f8","card_bg":"#ffffff","header_bg":"#e4ecf4","title_color":"#102030","body_color":"#304050","muted_color":"#708090","accent":"#007acc","accent2":"#005a9e","font_head":"Calibri","font_body":"Calibri","tag":"light"},
+    {"id":12,"name":"Misty Mountain","bg":"#c0c8d8","card_bg":"#d0d8e8","header_bg":"#b8c0d0","title_color":"#1a2030","body_color":"#3a4050","muted_color":"#7080a0","accent":"#3060a0","accent2":"#204880","font_head":"Calibri","font_body":"Calibri Light","tag":"light"},
 
     # ── PASTEL / SOFT ────────────────────────────────────────────────────────
     {"id":31,"name":"Cotton Candy","bg":"#fff0f8","card_bg":"#ffe8f5","header_bg":"#ffd8ee","title_color":"#4a0a3a","body_color":"#7a2a6a","muted_color":"#b070a0","accent":"#ff69b4","accent2":"#ff1493","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"pastel"},
@@ -59,7 +65,7 @@ THEMES = [
     # ── RETRO / VINTAGE ──────────────────────────────────────────────────────
     {"id":41,"name":"Retro Arcade","bg":"#1a0a2e","card_bg":"#2a1040","header_bg":"#220d38","title_color":"#ffee00","body_color":"#ff9900","muted_color":"#cc6600","accent":"#ff0066","accent2":"#ff00cc","font_head":"Calibri","font_body":"Courier New","tag":"retro"},
     {"id":42,"name":"VHS Purple","bg":"#0d0020","card_bg":"#1a0035","header_bg":"#150028","title_color":"#ff80ff","body_color":"#cc99ff","muted_color":"#8844cc","accent":"#ff00ff","accent2":"#cc00cc","font_head":"Courier New","font_body":"Courier New","tag":"retro"},
-    {"id":43,"name":"Sepia Classic","bg":"#2c1a00","card_bg":"#3d2a00","header_bg":"#352200","title_color":"#f5deb3","body_color":"#d4af70","muted_color":"#a07840","accent":"#cd853f","accent2":"#8b6914","font_head":"Calibri","font_body":"Calibri Light","tag":"retro"},
+    {"id":9,"name":"Sepia Classic","bg":"#2c1a00","card_bg":"#3d2a00","header_bg":"#352200","title_color":"#f5deb3","body_color":"#d4af70","muted_color":"#a07840","accent":"#cd853f","accent2":"#8b6914","font_head":"Calibri","font_body":"Calibri Light","tag":"retro"},
     {"id":44,"name":"Film Noir","bg":"#111111","card_bg":"#1e1e1e","header_bg":"#191919","title_color":"#f5f5f5","body_color":"#cccccc","muted_color":"#888888","accent":"#c8a84b","accent2":"#a08030","font_head":"Trebuchet MS","font_body":"Calibri","tag":"retro"},
     {"id":45,"name":"Pop Art","bg":"#fff700","card_bg":"#ffdd00","header_bg":"#ffc800","title_color":"#000000","body_color":"#1a1a1a","muted_color":"#444444","accent":"#ff0000","accent2":"#cc0000","font_head":"Trebuchet MS","font_body":"Calibri","tag":"retro"},
     {"id":46,"name":"Retro Sunset","bg":"#1a0033","card_bg":"#2a0050","header_bg":"#220040","title_color":"#ff9966","body_color":"#ffcc99","muted_color":"#cc7744","accent":"#ff6600","accent2":"#ff3300","font_head":"Calibri","font_body":"Calibri Light","tag":"retro"},
@@ -105,22 +111,22 @@ THEMES = [
     {"id":80,"name":"Misty Morning","bg":"#d8e8f0","card_bg":"#e8f4fc","header_bg":"#c8d8e8","title_color":"#102030","body_color":"#2a4060","muted_color":"#607090","accent":"#2080c0","accent2":"#1060a0","font_head":"Calibri","font_body":"Calibri Light","tag":"light"},
 
     # ── TECH / DIGITAL ───────────────────────────────────────────────────────
-    {"id":81,"name":"Terminal Green","bg":"#000a00","card_bg":"#001400","header_bg":"#000f00","title_color":"#00ff00","body_color":"#00cc00","muted_color":"#008800","accent":"#00ff44","accent2":"#00cc33","font_head":"Courier New","font_body":"Courier New","tag":"dark"},
+    {"id":11,"name":"Terminal Green","bg":"#000a00","card_bg":"#001400","header_bg":"#000f00","title_color":"#00ff00","body_color":"#00cc00","muted_color":"#008800","accent":"#00ff44","accent2":"#00cc33","font_head":"Courier New","font_body":"Courier New","tag":"dark"},
     {"id":82,"name":"Matrix","bg":"#000800","card_bg":"#001000","header_bg":"#000c00","title_color":"#00ff00","body_color":"#00cc00","muted_color":"#007700","accent":"#00ff88","accent2":"#00dd66","font_head":"Courier New","font_body":"Courier New","tag":"dark"},
     {"id":83,"name":"Hologram","bg":"#000f1a","card_bg":"#001828","header_bg":"#001220","title_color":"#00eeff","body_color":"#00aacc","muted_color":"#005588","accent":"#00ddff","accent2":"#00bbee","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"dark"},
     {"id":84,"name":"Cyberpunk Yellow","bg":"#0a0a00","card_bg":"#151500","header_bg":"#101000","title_color":"#ffff00","body_color":"#cccc00","muted_color":"#888800","accent":"#ffdd00","accent2":"#ccaa00","font_head":"Trebuchet MS","font_body":"Courier New","tag":"neon"},
     {"id":85,"name":"Circuit Board","bg":"#001a0a","card_bg":"#002815","header_bg":"#002010","title_color":"#00ff88","body_color":"#00cc66","muted_color":"#008844","accent":"#00ffcc","accent2":"#00ddaa","font_head":"Courier New","font_body":"Courier New","tag":"neon"},
     {"id":86,"name":"Data Stream","bg":"#040014","card_bg":"#080022","header_bg":"#06001a","title_color":"#4488ff","body_color":"#2266dd","muted_color":"#1144aa","accent":"#66aaff","accent2":"#4488ee","font_head":"Calibri","font_body":"Courier New","tag":"dark"},
     {"id":87,"name":"Pixel Art","bg":"#1a1a2e","card_bg":"#16213e","header_bg":"#0f3460","title_color":"#e94560","body_color":"#e0e0e0","muted_color":"#a0a0a0","accent":"#e94560","accent2":"#c0364a","font_head":"Courier New","font_body":"Calibri","tag":"retro"},
-    {"id":88,"name":"Synthwave","bg":"#0d0221","card_bg":"#1a0435","header_bg":"#14032a","title_color":"#ff7eee","body_color":"#df73ff","muted_color":"#9940cc","accent":"#08f7fe","accent2":"#09fbd3","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"retro"},
+    {"id":10,"name":"Synthwave","bg":"#0d0221","card_bg":"#1a0435","header_bg":"#14032a","title_color":"#ff7eee","body_color":"#df73ff","muted_color":"#9940cc","accent":"#08f7fe","accent2":"#09fbd3","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"retro"},
     {"id":89,"name":"Quantum","bg":"#000d1a","card_bg":"#001528","header_bg":"#001020","title_color":"#88ccff","body_color":"#4499dd","muted_color":"#2266aa","accent":"#00aaff","accent2":"#0088dd","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
     {"id":90,"name":"Neural Net","bg":"#0a000f","card_bg":"#14001e","header_bg":"#0f0018","title_color":"#dd88ff","body_color":"#aa55dd","muted_color":"#7733aa","accent":"#cc44ff","accent2":"#aa22ee","font_head":"Trebuchet MS","font_body":"Calibri","tag":"dark"},
 
     # ── LUXURY / PREMIUM ─────────────────────────────────────────────────────
-    {"id":91,"name":"Black Gold","bg":"#0a0800","card_bg":"#151000","header_bg":"#100c00","title_color":"#ffd700","body_color":"#c8a800","muted_color":"#886e00","accent":"#ffd700","accent2":"#c8a000","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
+    {"id":8,"name":"Black Gold","bg":"#0a0800","card_bg":"#151000","header_bg":"#100c00","title_color":"#ffd700","body_color":"#c8a800","muted_color":"#886e00","accent":"#ffd700","accent2":"#c8a000","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
     {"id":92,"name":"Platinum","bg":"#1a1a20","card_bg":"#252530","header_bg":"#1e1e28","title_color":"#e8e8f0","body_color":"#c0c0d0","muted_color":"#808090","accent":"#c0c0c0","accent2":"#a0a0b0","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"dark"},
-    {"id":93,"name":"Rose Gold","bg":"#1a0a0f","card_bg":"#2a1018","header_bg":"#220d14","title_color":"#ffddcc","body_color":"#e8b090","muted_color":"#c07050","accent":"#e8927c","accent2":"#c87060","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
-    {"id":94,"name":"Obsidian","bg":"#080808","card_bg":"#111111","header_bg":"#0d0d0d","title_color":"#ffffff","body_color":"#dddddd","muted_color":"#888888","accent":"#ff7820","accent2":"#dd5500","font_head":"Trebuchet MS","font_body":"Calibri","tag":"dark"},
+    {"id":15,"name":"Rose Gold","bg":"#1a0a0f","card_bg":"#2a1018","header_bg":"#220d14","title_color":"#ffddcc","body_color":"#e8b090","muted_color":"#c07050","accent":"#e8927c","accent2":"#c87060","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
+    {"id":13,"name":"Obsidian","bg":"#080808","card_bg":"#111111","header_bg":"#0d0d0d","title_color":"#ffffff","body_color":"#dddddd","muted_color":"#888888","accent":"#ff8c00","accent2":"#dd5500","font_head":"Trebuchet MS","font_body":"Calibri","tag":"dark"},
     {"id":95,"name":"Sapphire","bg":"#000a2a","card_bg":"#001040","header_bg":"#000d35","title_color":"#c8d8ff","body_color":"#8899cc","muted_color":"#445588","accent":"#4466ff","accent2":"#2244dd","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
     {"id":96,"name":"Malachite","bg":"#001a10","card_bg":"#002818","header_bg":"#002014","title_color":"#ccffee","body_color":"#88ddbb","muted_color":"#449977","accent":"#00cc88","accent2":"#00aa66","font_head":"Trebuchet MS","font_body":"Calibri","tag":"dark"},
     {"id":97,"name":"Amethyst","bg":"#150020","card_bg":"#200030","header_bg":"#1a0028","title_color":"#e8ccff","body_color":"#c099ee","muted_color":"#8855bb","accent":"#aa55ff","accent2":"#8833ee","font_head":"Calibri","font_body":"Calibri Light","tag":"dark"},
@@ -129,7 +135,7 @@ THEMES = [
     {"id":100,"name":"Diamond","bg":"#f0f8ff","card_bg":"#e8f4ff","header_bg":"#deeeff","title_color":"#0a1a2a","body_color":"#1a3a5a","muted_color":"#5070a0","accent":"#0055aa","accent2":"#003388","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"light"},
 
     # ── EXTRA BONUS THEMES ───────────────────────────────────────────────────
-    {"id":101,"name":"Neon Tokyo","bg":"#05001a","card_bg":"#0a0030","header_bg":"#070025","title_color":"#ff00aa","body_color":"#cc0088","muted_color":"#880055","accent":"#00eeff","accent2":"#00ccdd","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"neon"},
+    {"id":14,"name":"Neon Tokyo","bg":"#05001a","card_bg":"#0a0030","header_bg":"#070025","title_color":"#ff00aa","body_color":"#cc0088","muted_color":"#880055","accent":"#00eeff","accent2":"#00ccdd","font_head":"Trebuchet MS","font_body":"Calibri Light","tag":"neon"},
     {"id":102,"name":"Miami Vice","bg":"#000a1a","card_bg":"#001528","header_bg":"#001020","title_color":"#ff6ec7","body_color":"#ff8ed7","muted_color":"#cc55a0","accent":"#44ffdd","accent2":"#22ddbb","font_head":"Calibri","font_body":"Calibri Light","tag":"retro"},
     {"id":103,"name":"Nordic Frost","bg":"#e8f0f8","card_bg":"#f0f8ff","header_bg":"#dde8f2","title_color":"#0a1830","body_color":"#2a3050","muted_color":"#607090","accent":"#2a6090","accent2":"#1a4870","font_head":"Trebuchet MS","font_body":"Calibri","tag":"light"},
     {"id":104,"name":"Terracotta","bg":"#f5e8e0","card_bg":"#fff0e8","header_bg":"#ede0d5","title_color":"#2a0a00","body_color":"#5a2a10","muted_color":"#a06040","accent":"#b85042","accent2":"#963830","font_head":"Calibri","font_body":"Calibri Light","tag":"light"},
@@ -137,11 +143,57 @@ THEMES = [
 ]
 
 
+# ── registry ──────────────────────────────────────────────────────────────────
+COLOR_KEYS = ("bg","card_bg","header_bg","title_color","body_color","muted_color","accent","accent2")
+LIST_KEYS  = ("id","name","tag","bg","accent","accent2")   # what the theme picker needs
+
+def _rgb(h):
+    h = h.lstrip("#")
+    if len(h) != 6: raise ValueError(f"bad colour {h!r}")
+    return int(h[:2],16), int(h[2:4],16), int(h[4:],16)
+
+
+class ThemeRegistry:
+    """
+    THEMES indexed once at import: O(1) lookup by ID, themes grouped by tag,
+    every colour checked (so a malformed theme fails at startup rather than
+    mid-build; ppt_builder.ResolvedTheme does the parsing), and the picker
+    listing kept as pre-serialised JSON with an ETag. Everything here is
+    read-only.
+    """
+    def __init__(self, themes, default_id=1):
+        self.themes  = sorted(themes, key=lambda t: t["id"])
+        self.by_id   = {t["id"]: t for t in self.themes}
+        if len(self.by_id) != len(self.themes): raise ValueError("duplicate theme id")
+        self.default = self.by_id[default_id]
+        self.by_tag  = {}
+        for t in self.themes: self.by_tag.setdefault(t["tag"], []).append(t)
+        self.tags    = tuple(sorted(self.by_tag))
+        for t in self.themes:
+            for k in COLOR_KEYS: _rgb(t[k])
+        self.summary = [{k: t[k] for k in LIST_KEYS} for t in self.themes]
+        self._json   = {tag: self._serialise([r for r in self.summary if tag in (None, r["tag"])])
+                        for tag in (None,) + self.tags}
+
+    @staticmethod
+    def _serialise(rows):
+        body = orjson.dumps(rows)
+        return body, f'"{xxhash.xxh3_64_hexdigest(body)}"'
+
+    def get(self, theme_id):
+        """The theme with this ID, or the default theme."""
+        return self.by_id.get(theme_id, self.default)
+
+    def listing(self, tag=None):
+        """(JSON bytes, ETag) of the picker summary, all themes or one tag's; KeyError for an unknown tag."""
+        return self._json[tag]
+
+
+registry = ThemeRegistry(THEMES)
+
+
 def get_theme_by_id(theme_id: int) -> dict:
-    for t in THEMES:
-        if t["id"] == theme_id:
-            return t
-    return THEMES[0]
+    return registry.get(theme_id)
 
 
 def get_random_theme() -> dict:
@@ -149,5 +201,6 @@ def get_random_theme() -> dict:
 
 
 def get_themes_list() -> list:
-    return [{"id": t["id"], "name": t["name"], "tag": t["tag"],
-             "accent": t["accent"], "bg": t["bg"]} for t in THEMES]
\ No newline at end of file
+    """Picker summary of every theme; shared, do not mutate."""
+    return registry.summary
+
@@ -0,0 +1,172 @@
+"""
+workers.py — bounded pools for the expensive parts of a request.
+
+LLM calls are async I/O, so their pool is just a concurrency gate on the
+event loop. build_ppt is CPU-bound and runs on a process pool so deck
+throughput grows with cores; pipelined builds, whose DeckBuilder has to stay
+in this process, step through a small thread pool.
+Each pool admits at most `workers + max_queue` jobs; beyond that callers get
+Overloaded, which main.py turns into a 429 with Retry-After. Executor tasks
+run under the submitting request's ID, and a build process's timing spans
+come back with its result (see metrics.carried).
+
+Config (env):
+    PPT_LLM_CONCURRENCY  concurrent LLM calls                    (default 32)
+    PPT_BUILD_PROCS      processes for build_ppt, 0 = use threads (default cpu count)
+    PPT_RENDER_THREADS   threads for pipelined builds              (default cpu count)
+    PPT_JOB_CONCURRENCY  background /jobs running at once        (default cpu count)
+    PPT_MAX_QUEUE        jobs allowed to wait per pool             (default 32)
+    PPT_WARMUP           1 = build processes and render threads prime
+                         the builder as they start (see warm_up)   (default 1)
+"""
+import asyncio, contextlib, functools, os
+import metrics
+
+def _env_int(name, default):
+    try: return int(os.getenv(name, default))
+    except ValueError: return default
+
+CPUS            = os.cpu_count() or 1
+LLM_CONCURRENCY = max(1, _env_int("PPT_LLM_CONCURRENCY", 32))
+BUILD_PROCS     = max(0, _env_int("PPT_BUILD_PROCS", CPUS))
+RENDER_THREADS  = max(1, _env_int("PPT_RENDER_THREADS", CPUS))
+JOB_CONCURRENCY = max(1, _env_int("PPT_JOB_CONCURRENCY", CPUS))
+MAX_QUEUE       = max(0, _env_int("PPT_MAX_QUEUE", 32))
+WARMUP          = os.getenv("PPT_WARMUP", "1") != "0"
+
+
+class Overloaded(Exception):
+    """Pool is full — the caller should back off and retry."""
+    def __init__(self, pool, retry_after=2):
+        super().__init__(f"Server busy: {pool} queue is full, retry in {retry_after}s")
+        self.pool = pool; self.retry_after = retry_after
+
+
+class Pool:
+    """
+    Admission control plus either an executor (run/submit) or, with no
+    factory, a semaphore for coroutines (call/stream). `inflight` is only
+    touched from the event loop thread, so it needs no lock.
+    """
+    def __init__(self, name, factory, workers, max_queue=MAX_QUEUE):
+        self.name = name; self.workers = workers; self.max_queue = max_queue
+        self.inflight = 0
+        self._factory = factory; self._executor = None
+        self.gate = asyncio.Semaphore(workers)
+
+    @property
+    def executor(self):
+        if self._executor is None: self._executor = self._factory()
+        return self._executor
+
+    def check(self, n=1):
+        if self.inflight + n > self.workers + self.max_queue:
+            raise Overloaded(self.name)
+
+    def acquire(self, n=1):
+        """Take n admission slots now; pair with release(n), possibly from another task."""
+        self.check(n)
+        self.inflight += n
+
+    def release(self, n=1):
+        self.inflight -= n
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold one admission slot, e.g. across several submit() steps of one job."""
+        self.acquire()
+        try: yield
+        finally: self.release()
+
+    async def submit(self, fn, *args, **kwargs):
+        """Run on the executor without admission — for later steps of an admitted job."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(metrics.carried, os.getpid(), metrics.request_id.get(), fn, *args, **kwargs)
+        return metrics.landed(await loop.run_in_executor(self.executor, call))
+
+    async def run(self, fn, *args, **kwargs):
+        with self.slot():
+            return await self.submit(fn, *args, **kwargs)
+
+    async def call(self, coro_fn, *args, **kwargs):
+        with self.slot():
+            async with self.gate:
+                return await coro_fn(*args, **kwargs)
+
+    async def stream(self, agen_fn, *args):
+        """
+        Iterate an async generator under one admission slot. Call check()
+        first if a 429 must be raised before a response starts.
+        """
+        with self.slot():
+            async with self.gate:
+                agen = agen_fn(*args)
+                try:
+                    async for item in agen:
+                        yield item
+                finally:
+                    await agen.aclose()
+
+    def stats(self):
+        return {"workers": self.workers, "inflight": self.inflight,
+                "queued": max(0, self.inflight - self.workers), "max_queue": self.max_queue}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# ── warm-up ───────────────────────────────────────────────────────────────────
+# Executor initializers: a build process imports and primes the builder
+# before its first task; a thread only needs its own base presentation, the
+# rest of the builder's caches being shared with the process that warmed it.
+
+def _warm_process():
+    try:
+        from agent.ppt_builder import warm_up
+        from themes import registry
+        warm_up(registry.themes)
+    except Exception as e:   # a failing initializer would break the whole pool
+        metrics.log(f"[warm-up] build process {os.getpid()}: {e!r}")
+
+def _warm_thread():
+    try:
+        from agent.ppt_builder import _base_presentation
+        _base_presentation()
+    except Exception as e:
+        metrics.log(f"[warm-up] render thread: {e!r}")
+
+async def warm_up():
+    """
+    Start every build process and render thread now, so their initializers
+    run before traffic does. Returns how many distinct processes answered.
+    """
+    pids = await asyncio.gather(*(build.submit(os.getpid) for _ in range(build.workers)),
+                                *(render.submit(os.getpid) for _ in range(render.workers)))
+    return len(set(pids[:build.workers]))
+
+def _build_executor():
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    if BUILD_PROCS == 0:   # serverless / no fork: fall back to threads
+        return ThreadPoolExecutor(max_workers=CPUS, thread_name_prefix="ppt-build",
+                                  initializer=_warm_thread if WARMUP else None)
+    import multiprocessing
+    # spawn, not fork: the parent is a running event loop with live threads
+    return ProcessPoolExecutor(max_workers=BUILD_PROCS, mp_context=multiprocessing.get_context("spawn"),
+                               initializer=_warm_process if WARMUP else None)
+
+def _render_executor():
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=RENDER_THREADS, thread_name_prefix="ppt-render",
+                              initializer=_warm_thread if WARMUP else None)
+
+llm    = Pool("llm",    None, LLM_CONCURRENCY)
+build  = Pool("build",  _build_executor, BUILD_PROCS or CPUS)
+render = Pool("render", _render_executor, RENDER_THREADS)
+jobs   = Pool("jobs",   None, JOB_CONCURRENCY)
+
+def stats(): return {p.name: p.stats() for p in (llm, build, render, jobs)}
+
+def shutdown():
+    for p in (llm, build, render): p.shutdown()